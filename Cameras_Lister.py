@@ -7,7 +7,1031 @@ bl_info = {
 }
 
 import bpy
-from bpy.types import Operator, Menu, Panel, PropertyGroup, PointerProperty, Object
+from bpy.types import Operator, Menu, Panel, PropertyGroup, PointerProperty, Object, WindowManager
+from bpy.app.handlers import persistent
+import collections
+import argparse
+import bisect
+import fnmatch
+import functools
+import hashlib
+import json
+import os
+import queue
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+
+#--------------------------------------------------------------------------------------
+# P R O F I L I N G
+#--------------------------------------------------------------------------------------
+
+# PROFILER
+# Opt-in timings of the lister draw code and the cameras.* operators, kept in a
+# ring buffer. When disabled, an instrumented call costs one attribute check.
+class Profiler:
+    def __init__(self, size=4096):
+        self.enabled = False
+        self.samples = collections.deque(maxlen=size)
+        self.counts = collections.Counter()
+
+    def configure(self, enabled, size):
+        self.enabled = enabled
+        if size != self.samples.maxlen:
+            self.samples = collections.deque(self.samples, maxlen=size)
+
+    def clear(self):
+        self.samples.clear()
+        self.counts.clear()
+
+    def record(self, name, seconds):
+        self.samples.append((name, time.time(), seconds))
+        self.counts[name] += 1
+
+    def stats(self):
+        durations = {}
+        for name, timestamp, seconds in self.samples:
+            durations.setdefault(name, []).append(seconds)
+        stats = []
+        for name in sorted(durations):
+            values = sorted(durations[name])
+            stats.append({
+                "name": name,
+                "calls": self.counts[name],
+                "samples": len(values),
+                "p50_ms": values[len(values) // 2] * 1000.0,
+                "p95_ms": values[min(len(values) - 1, int(len(values) * 0.95))] * 1000.0,
+                "max_ms": values[-1] * 1000.0,
+            })
+        return stats
+
+    def dump(self, filepath):
+        if filepath.lower().endswith(".csv"):
+            with open(filepath, "w") as f:
+                f.write("name,timestamp,ms\n")
+                for name, timestamp, seconds in self.samples:
+                    f.write("%s,%.6f,%.6f\n" % (name, timestamp, seconds * 1000.0))
+        else:
+            with open(filepath, "w") as f:
+                json.dump({
+                    "blender": ".".join(str(part) for part in bpy.app.version),
+                    "stats": self.stats(),
+                    "samples": [{"name": name, "timestamp": timestamp, "ms": seconds * 1000.0}
+                        for name, timestamp, seconds in self.samples],
+                }, f, indent=1)
+
+profiler = Profiler()
+
+def timed_call(name, func, *args):
+    if not profiler.enabled:
+        return func(*args)
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        profiler.record(name, time.perf_counter() - start)
+
+def profiled(name):
+    # Blender checks the argument count of registered callbacks, so the
+    # wrappers keep the wrapped function's signature
+    def decorator(func):
+        argcount = func.__code__.co_argcount
+        if argcount == 2:
+            def wrapper(self, context):
+                return timed_call(name, func, self, context)
+        elif argcount == 3:
+            def wrapper(self, context, event):
+                return timed_call(name, func, self, context, event)
+        else:
+            def wrapper(*args):
+                return timed_call(name, func, *args)
+        functools.update_wrapper(wrapper, func)
+        wrapper.profiled = True
+        return wrapper
+    return decorator
+
+def InstrumentOperators(classes):
+    for cls in classes:
+        idname = getattr(cls, "bl_idname", "")
+        if not idname.startswith(("cameras.", "camera.")):
+            continue
+        for method in ("execute", "invoke"):
+            func = cls.__dict__.get(method)
+            if func is not None and not getattr(func, "profiled", False):
+                setattr(cls, method, profiled("%s.%s" % (idname, method))(func))
+
+#--------------------------------------------------------------------------------------
+# C A M E R A S   I N D E X
+#--------------------------------------------------------------------------------------
+
+# CAMERA ROW (precomputed per-row view model read by the lister)
+class CameraRow:
+    __slots__ = ("key", "name", "object")
+
+    def __init__(self, key, name, object):
+        self.key = key
+        self.name = name
+        self.object = object
+
+# CAMERA INDEX
+# Rebuilt lazily, only after the handlers below report a structural change
+# (camera added, removed or renamed, collection links changed). Drawing the
+# lister never walks the scene objects. Cameras are keyed by their camera
+# identifier, a local and a linked camera may share a name.
+class CameraIndex:
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.scene_key = None
+        self.object_count = -1
+        self.root_count = -1
+        self.names = []
+        self.full_names = set()
+        self.objects = {}
+        self.positions = {}
+        self.rows = []
+        self.rows_by_key = {}
+        self.grouped_rows = []
+        self.grouped_key = None
+        self.filtered = {}
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self, scene):
+        if self.dirty or self.scene_key != scene.as_pointer():
+            self.rebuild(scene)
+        return self
+
+    def rebuild(self, scene):
+        cameras = {}
+        positions = {}
+        rows = []
+        for position, ob in enumerate(scene.objects):
+            if ob.type == 'CAMERA':
+                key = camera_ids.key(ob)
+                cameras[key] = ob
+                positions[key] = position
+                rows.append(CameraRow(key, ob.name, ob))
+        rows.sort(key=lambda row: CameraOrder(row.object))
+
+        self.scene_key = scene.as_pointer()
+        self.object_count = len(scene.objects)
+        self.root_count = len(scene.collection.objects)
+        self.names = [row.name for row in rows]
+        self.full_names = {row.object.name_full for row in rows}
+        self.objects = cameras
+        self.positions = positions
+        self.rows = rows
+        self.rows_by_key = {row.key: row for row in rows}
+        self.filtered = {}
+        camera_search.sync(self.names)
+        lister_selection.prune(cameras)
+        # Cameras added or duplicated since the last save still go by name
+        if any(key.startswith(CameraIDs.NAME_PREFIX) and camera_ids.writable(ob) for key, ob in cameras.items()):
+            schedule_camera_ids_assign()
+        self.version += 1
+        self.dirty = False
+
+    def collections(self, scene, key):
+        return collection_camera_map.ensure(scene).membership.get(key, ())
+
+    def groups(self, scene):
+        coll_map = collection_camera_map.ensure(scene)
+        key = (self.version, coll_map.version)
+        if self.grouped_key != key:
+            rows_by_key = self.rows_by_key
+            self.grouped_rows = [(coll_name, [rows_by_key[cam] for cam in cams if cam in rows_by_key])
+                for coll_name, cams in coll_map.groups]
+            self.grouped_key = key
+        return self.grouped_rows
+
+    def filter_rows(self, scene, search, by_collections=False):
+        groups = self.groups(scene) if by_collections else None
+        key = (self.grouped_key if by_collections else self.version, by_collections, search,
+            camera_visibility.version)
+        cached = self.filtered.get(key)
+        if cached is None:
+            matches = ListerMatches(search)
+            if by_collections:
+                if matches is None:
+                    cached = groups
+                else:
+                    cached = [(coll_name, [row for row in rows if row.name in matches]) for coll_name, rows in groups]
+                    cached = [(coll_name, rows) for coll_name, rows in cached if rows]
+            else:
+                cached = self.rows if matches is None else [row for row in self.rows if row.name in matches]
+            if len(self.filtered) > 32:
+                self.filtered.clear()
+            self.filtered[key] = cached
+        return cached
+
+camera_index = CameraIndex()
+
+# By name, local cameras before linked ones of the same name
+def CameraOrder(ob):
+    return ob.name.lower(), ob.library.filepath if ob.library is not None else ""
+
+# Names the lister shows for a search, narrowed to the cameras seeing the
+# selection while that filter is set; None when nothing is filtered out
+def ListerMatches(search):
+    matches = camera_search.search(search)
+    seeing = camera_visibility.names
+    if seeing is None:
+        return matches
+    return seeing if matches is None else matches & seeing
+
+# CAMERA NAME SEARCH
+# Case-insensitive substring search over camera names backed by an n-gram
+# index (every 1 to 3 character substring of a name maps to the names that
+# contain it). The index is updated incrementally from the camera index and
+# a query that extends the previous one only narrows the previous result,
+# so typing stays cheap with thousands of cameras.
+class NameSearchIndex:
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.names = set()
+        self.grams = {}
+        self.version = 0
+        self.last_query = None
+        self.last_result = None
+
+    def _grams(self, lower):
+        size = self.GRAM_SIZE
+        return {lower[i:i + n] for n in range(1, size + 1) for i in range(len(lower) - n + 1)}
+
+    def add(self, name):
+        if name in self.names:
+            return
+        self.names.add(name)
+        for gram in self._grams(name.lower()):
+            self.grams.setdefault(gram, set()).add(name)
+        self.version += 1
+
+    def remove(self, name):
+        if name not in self.names:
+            return
+        self.names.discard(name)
+        for gram in self._grams(name.lower()):
+            names = self.grams.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self.grams[gram]
+        self.version += 1
+
+    def sync(self, names):
+        names = set(names)
+        for name in self.names - names:
+            self.remove(name)
+        for name in names - self.names:
+            self.add(name)
+
+    def search(self, query):
+        # None means no filtering
+        query = query.strip().lower()
+        if not query:
+            return None
+        last = self.last_query
+        if last is not None and last[0] == self.version and query == last[1]:
+            return self.last_result
+        if last is not None and last[0] == self.version and query.startswith(last[1]):
+            result = frozenset(name for name in self.last_result if query in name.lower())
+        elif len(query) <= self.GRAM_SIZE:
+            result = frozenset(self.grams.get(query, ()))
+        else:
+            size = self.GRAM_SIZE
+            candidates = sorted((self.grams.get(query[i:i + size], ()) for i in range(len(query) - size + 1)), key=len)
+            result = set(candidates[0])
+            for names in candidates[1:]:
+                result &= names
+                if not result:
+                    break
+            result = frozenset(name for name in result if query in name.lower())
+        self.last_query = (self.version, query)
+        self.last_result = result
+        return result
+
+camera_search = NameSearchIndex()
+
+# CAMERA IDS
+# Every local camera object carries a random identifier saved with the file
+# (Object.cameras_lister_id). UI buttons, picks and operators refer to cameras
+# by it, so they keep pointing at the same camera through renames and never
+# mix up a local camera with a linked one of the same name. The identifier ->
+# object map covers bpy.data.objects and is rebuilt lazily after a structural
+# change; it is dropped on load and undo, which reallocate every object.
+# Identifiers are only written on file load and save, by the operators that
+# create cameras and by the command line, never while drawing. Cameras
+# without one yet (added by other tools, or the copy of a duplicated camera,
+# which carries the original's identifier) are keyed by name until then.
+class CameraIDs:
+    NAME_PREFIX = "name:"
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.by_id = {}
+        self.ids = {}
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self):
+        if self.dirty:
+            self.rebuild()
+        return self
+
+    def cameras(self):
+        # Local cameras first, and among those the previous owner of an
+        # identifier before any copy of it
+        owners = self.ids
+        cams = [ob for ob in bpy.data.objects if ob.type == 'CAMERA']
+        cams.sort(key=lambda ob: (not self.writable(ob),
+            owners.get(ob.as_pointer()) != ob.cameras_lister_id))
+        return cams
+
+    @staticmethod
+    def writable(ob):
+        return ob.library is None and getattr(ob, "override_library", None) is None
+
+    def rebuild(self):
+        by_id = {}
+        ids = {}
+        for ob in self.cameras():
+            key = ob.cameras_lister_id
+            if not key or key in by_id:
+                key = self.NAME_PREFIX + ob.name_full
+            by_id[key] = ob
+            ids[ob.as_pointer()] = key
+        self.by_id = by_id
+        self.ids = ids
+        self.dirty = False
+
+    def get(self, key):
+        cam = self.ensure().by_id.get(key)
+        if cam is not None:
+            try:
+                cam.name
+            except ReferenceError:
+                self.rebuild()
+                cam = self.by_id.get(key)
+        return cam
+
+    def discard(self, ob):
+        # Before ob is removed, so the map stays valid without a rebuild
+        key = self.ids.pop(ob.as_pointer(), None)
+        if key is not None:
+            self.by_id.pop(key, None)
+
+    def key(self, ob):
+        key = self.ensure().ids.get(ob.as_pointer())
+        if key is None:
+            # A camera created since the last rebuild
+            self.rebuild()
+            key = self.ids.get(ob.as_pointer(), self.NAME_PREFIX + ob.name_full)
+        return key
+
+    def assign(self):
+        # Give every local camera keyed by name an identifier of its own,
+        # returns how many were written
+        self.ensure()
+        count = 0
+        used = set()
+        for ob in self.cameras():
+            key = ob.cameras_lister_id
+            if self.writable(ob) and (not key or key in used):
+                old_key = self.ids.get(ob.as_pointer())
+                key = ob.cameras_lister_id = uuid.uuid4().hex
+                lister_selection.rekey(old_key, key)
+                count += 1
+            used.add(key)
+        if count:
+            self.invalidate()
+            camera_index.invalidate()
+        return count
+
+    def identify(self, ob):
+        # For one camera just created by an operator, without a full pass
+        key = ob.cameras_lister_id
+        owner = self.ensure().by_id.get(key)
+        if self.writable(ob) and (not key or (owner is not None and owner != ob)):
+            ob.cameras_lister_id = uuid.uuid4().hex
+        self.invalidate()
+
+camera_ids = CameraIDs()
+
+@persistent
+def camera_ids_assign(*args):
+    camera_ids.assign()
+
+# The index is rebuilt while drawing, where ID properties are read only, so
+# new cameras get their identifier from a one-shot timer
+def assign_camera_ids():
+    if camera_ids.assign():
+        schedule_browser_sync()
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return None
+
+def schedule_camera_ids_assign():
+    if not bpy.app.timers.is_registered(assign_camera_ids):
+        bpy.app.timers.register(assign_camera_ids, first_interval=0.0)
+
+# Camera from an operator's camera property: an identifier from the UI, or
+# a plain object name from scripts and the command line
+def ResolveCamera(key):
+    cam = camera_ids.get(key)
+    if cam is None:
+        cam = bpy.data.objects.get(key)
+        if cam is not None and cam.type != 'CAMERA':
+            cam = None
+    if cam is None:
+        camera_ids.rebuild()
+        cam = camera_ids.get(key)
+    return cam
+
+# LISTER SELECTION
+# Cameras picked in the lister for the bulk operators, by camera identifier.
+# Kept apart from the viewport selection, which SelectCamera and
+# SetCameraView replace.
+class ListerSelection:
+    def __init__(self):
+        self.keys = set()
+
+    def clear(self):
+        self.keys.clear()
+
+    def prune(self, keys):
+        self.keys &= set(keys)
+
+    def rekey(self, old_key, key):
+        if old_key in self.keys:
+            self.keys.discard(old_key)
+            self.keys.add(key)
+
+lister_selection = ListerSelection()
+
+def SelectedCameras(context):
+    # Picked cameras in list order
+    index = get_camera_index(context)
+    if not lister_selection.keys:
+        return []
+    return [row_data.object for row_data in index.rows if camera_ids.key(row_data.object) in lister_selection.keys]
+
+# COLLECTION CAMERA MAP
+# Collection -> camera identifiers for the "By Collections" sort. The tree is walked
+# iteratively and every collection is visited once, however many parents it is
+# linked under. Groups are stored already sorted and only recomputed when
+# collections or their object links change.
+class CollectionCameraMap:
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.scene_key = None
+        self.groups = []
+        self.membership = {}
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self, scene):
+        if self.dirty or self.scene_key != scene.as_pointer():
+            self.rebuild(scene)
+        return self
+
+    def rebuild(self, scene):
+        groups = []
+        membership = {}
+        visited = set()
+        stack = [scene.collection]
+        while stack:
+            coll = stack.pop()
+            key = coll.as_pointer()
+            if key in visited:
+                continue
+            visited.add(key)
+            stack.extend(coll.children)
+            cams = [ob for ob in coll.objects if ob.type == 'CAMERA']
+            if cams:
+                cams.sort(key=CameraOrder)
+                cams = [camera_ids.key(ob) for ob in cams]
+                groups.append((coll.name, tuple(cams)))
+                for cam in cams:
+                    membership.setdefault(cam, []).append(coll.name)
+        groups.sort(key=lambda group: group[0])
+
+        self.scene_key = scene.as_pointer()
+        self.groups = groups
+        self.membership = {cam: tuple(colls) for cam, colls in membership.items()}
+        self.version += 1
+        self.dirty = False
+
+collection_camera_map = CollectionCameraMap()
+
+def get_camera_index(context):
+    return camera_index.ensure(context.scene)
+
+# MARKER INDEX
+# Frame -> markers and camera -> markers maps over scene.timeline_markers. The
+# cameras.* operators keep it current through add/remove/remove_many, edits
+# made elsewhere are caught by the handlers below or by a marker count change.
+class MarkerIndex:
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.scene_key = None
+        self.marker_count = -1
+        self.by_frame = {}
+        self.by_camera = {}
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self, scene):
+        if (self.dirty or self.scene_key != scene.as_pointer()
+        or len(scene.timeline_markers) != self.marker_count):
+            self.rebuild(scene)
+        return self
+
+    def rebuild(self, scene):
+        self.by_frame = {}
+        self.by_camera = {}
+        for marker in scene.timeline_markers:
+            self._link(marker)
+        self.scene_key = scene.as_pointer()
+        self.marker_count = len(scene.timeline_markers)
+        self.version += 1
+        self.dirty = False
+
+    def _link(self, marker):
+        self.by_frame.setdefault(marker.frame, []).append(marker)
+        if marker.camera is not None:
+            self.by_camera.setdefault(marker.camera.as_pointer(), []).append(marker)
+
+    def _unlink(self, marker):
+        markers = self.by_frame.get(marker.frame)
+        if markers is not None:
+            markers.remove(marker)
+            if not markers:
+                del self.by_frame[marker.frame]
+        if marker.camera is not None:
+            key = marker.camera.as_pointer()
+            markers = self.by_camera.get(key)
+            if markers is not None:
+                markers.remove(marker)
+                if not markers:
+                    del self.by_camera[key]
+
+    def at_frame(self, frame):
+        return self.by_frame.get(frame, ())
+
+    def for_camera(self, camera):
+        return self.by_camera.get(camera.as_pointer(), ())
+
+    def bound_camera(self, frame):
+        markers = self.by_frame.get(frame)
+        return markers[0].camera if markers else None
+
+    def add(self, scene, name, frame, camera=None):
+        self.ensure(scene)
+        marker = scene.timeline_markers.new(name, frame=frame)
+        marker.camera = camera
+        self._link(marker)
+        self.marker_count += 1
+        self.version += 1
+        return marker
+
+    def add_many(self, scene, bindings):
+        # bindings: (name, frame, camera) tuples
+        self.ensure(scene)
+        tm = scene.timeline_markers
+        for name, frame, camera in bindings:
+            marker = tm.new(name, frame=frame)
+            marker.camera = camera
+            self._link(marker)
+        self.marker_count = len(tm)
+        self.version += 1
+
+    def remove(self, scene, marker):
+        self.ensure(scene)
+        self._unlink(marker)
+        scene.timeline_markers.remove(marker)
+        self.marker_count -= 1
+        self.version += 1
+
+    def remove_many(self, scene, markers):
+        # Copied first: the index lists change while markers are removed
+        for marker in list(markers):
+            self.remove(scene, marker)
+
+    def unbind_camera(self, scene, camera):
+        self.ensure(scene)
+        self.remove_many(scene, self.for_camera(camera))
+
+marker_index = MarkerIndex()
+
+def get_marker_index(context):
+    return marker_index.ensure(context.scene)
+
+# CAMERA POSITIONS
+# KD-tree over the world positions of the scene's cameras for spatial
+# navigation. A mathutils KD-tree cannot be edited once balanced, so it is
+# rebuilt on the next lookup after the camera index changes or a camera
+# moves; lookups in between only walk the tree.
+class CameraPositions:
+    STEP_CANDIDATES = 16
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.tree = None
+        self.cameras = []
+        self.key = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self, scene):
+        index = camera_index.ensure(scene)
+        key = (index.scene_key, index.version)
+        if self.dirty or self.key != key:
+            from mathutils import kdtree
+            self.cameras = [row_data.object for row_data in index.rows]
+            self.tree = kdtree.KDTree(len(self.cameras))
+            for i, cam in enumerate(self.cameras):
+                self.tree.insert(cam.matrix_world.translation, i)
+            self.tree.balance()
+            self.key = key
+            self.dirty = False
+        return self
+
+    def nearest(self, co, exclude=None):
+        for found, i, distance in self.tree.find_n(co, 2):
+            if self.cameras[i] != exclude:
+                return self.cameras[i]
+        return None
+
+    # Closest camera within `cone` (cosine of the half angle, 0.5 is a 60
+    # degree half angle, a 120 degree cone) of `direction`, given in the
+    # camera's local axes, preferring cameras straight ahead
+    def step(self, cam, direction, cone=0.5):
+        from mathutils import Vector
+        origin = cam.matrix_world.translation
+        axis = (cam.matrix_world.to_3x3() @ Vector(direction)).normalized()
+        count = len(self.cameras)
+        candidates = self.STEP_CANDIDATES
+        while True:
+            best = None
+            best_score = None
+            for found, i, distance in self.tree.find_n(origin, min(candidates, count)):
+                if distance <= 0.0 or self.cameras[i] == cam:
+                    continue
+                alignment = (found - origin).dot(axis) / distance
+                if alignment >= cone and (best_score is None or distance / alignment < best_score):
+                    best = self.cameras[i]
+                    best_score = distance / alignment
+            if best is not None or candidates >= count:
+                return best
+            candidates *= 8
+
+camera_positions = CameraPositions()
+
+def get_camera_positions(context):
+    return camera_positions.ensure(context.scene)
+
+# CAMERA CATALOG
+# Cameras of every scene, plus the library-linked cameras no scene holds, for
+# the All Scenes mode. Rows only keep names (scene, camera, library path), so
+# a removed scene or camera never leaves a dangling reference behind. Each
+# scene is scanned once; the handlers mark the active scene for a rescan when
+# its cameras change, and linked cameras are rescanned when libraries are
+# added or removed. Drawing only compares the scene names.
+class CatalogRow:
+    __slots__ = ("name", "scene", "library")
+
+    def __init__(self, name, scene, library):
+        self.name = name
+        self.scene = scene
+        self.library = library
+
+class CameraCatalog:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.scenes = {}
+        self.scene_names = ()
+        self.dirty_scenes = set()
+        self.linked = None
+        self.library_count = -1
+        self.version = 0
+        self.filtered = {}
+
+    def invalidate_scene(self, name):
+        self.dirty_scenes.add(name)
+
+    def ensure(self, context):
+        changed = False
+        scene_names = []
+        for scene in bpy.data.scenes:
+            scene_names.append(scene.name)
+            if scene.name not in self.scenes or scene.name in self.dirty_scenes:
+                self.scenes[scene.name] = self.scan_scene(context, scene)
+                changed = True
+        self.dirty_scenes.clear()
+        scene_names = tuple(scene_names)
+        if scene_names != self.scene_names:
+            for name in set(self.scenes).difference(scene_names):
+                del self.scenes[name]
+            self.scene_names = scene_names
+            changed = True
+        if self.linked is None or len(bpy.data.libraries) != self.library_count:
+            self.linked = self.scan_linked()
+            self.library_count = len(bpy.data.libraries)
+            changed = True
+        if changed:
+            self.version += 1
+            self.filtered = {}
+        return self
+
+    def scan_scene(self, context, scene):
+        # The active scene is already indexed
+        if scene == context.scene:
+            cams = [row_data.object for row_data in camera_index.ensure(scene).rows]
+        else:
+            cams = sorted((ob for ob in scene.objects if ob.type == 'CAMERA'), key=lambda ob: ob.name)
+        return [CatalogRow(cam.name, scene.name, cam.library.filepath if cam.library else None) for cam in cams]
+
+    def scan_linked(self):
+        rows = [CatalogRow(ob.name, "", ob.library.filepath) for ob in bpy.data.objects
+            if ob.library is not None and ob.type == 'CAMERA']
+        rows.sort(key=lambda row_data: (row_data.library, row_data.name))
+        return rows
+
+    # (scene name, rows) groups in scene order, linked cameras last under ""
+    def groups(self, search=""):
+        key = (self.version, search)
+        cached = self.filtered.get(key)
+        if cached is None:
+            groups = [(name, self.scenes[name]) for name in self.scene_names]
+            in_scenes = {(row_data.name, row_data.library) for name, rows in groups
+                for row_data in rows if row_data.library is not None}
+            groups.append(("", [row_data for row_data in self.linked
+                if (row_data.name, row_data.library) not in in_scenes]))
+            search = search.lower()
+            if search:
+                groups = [(name, [row_data for row_data in rows if search in row_data.name.lower()])
+                    for name, rows in groups]
+            cached = [(name, rows) for name, rows in groups if rows]
+            if len(self.filtered) > 32:
+                self.filtered.clear()
+            self.filtered[key] = cached
+        return cached
+
+camera_catalog = CameraCatalog()
+
+# INDEX HANDLERS
+@persistent
+def index_depsgraph_update_post(scene, depsgraph=None):
+    if depsgraph is None:
+        camera_ids.invalidate()
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
+        marker_index.invalidate()
+        camera_positions.invalidate()
+        camera_catalog.invalidate_scene(scene.name)
+        schedule_browser_sync()
+        return
+    if camera_index.scene_key != scene.as_pointer():
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
+    for update in depsgraph.updates:
+        id = update.id
+        if isinstance(id, bpy.types.Collection):
+            # Objects linked, unlinked or deleted
+            camera_index.invalidate()
+            collection_camera_map.invalidate()
+        elif isinstance(id, bpy.types.Object):
+            if id.type == 'CAMERA':
+                if id.name_full not in camera_index.full_names:
+                    # New, renamed or from another scene
+                    camera_ids.invalidate()
+                    camera_index.invalidate()
+                    collection_camera_map.invalidate()
+                elif update.is_updated_transform:
+                    camera_positions.invalidate()
+        elif isinstance(id, bpy.types.Scene):
+            # The scene's own collection is not an ID of its own, links to it
+            # only show up as a scene update. Only its direct objects are
+            # counted, never the whole scene.
+            if len(scene.collection.objects) != camera_index.root_count:
+                camera_ids.invalidate()
+                camera_index.invalidate()
+                collection_camera_map.invalidate()
+        if camera_index.dirty and collection_camera_map.dirty and camera_ids.dirty:
+            break
+    if camera_index.dirty or collection_camera_map.dirty:
+        camera_catalog.invalidate_scene(scene.name)
+        schedule_browser_sync()
+
+@persistent
+def index_load_post(*args):
+    camera_ids.clear()
+    camera_index.clear()
+    camera_search.clear()
+    lister_selection.clear()
+    collection_camera_map.clear()
+    marker_index.clear()
+    camera_positions.clear()
+    camera_catalog.clear()
+    browser_state.clear()
+    camera_visibility.clear()
+    schedule_browser_sync()
+
+@persistent
+def index_undo_post(*args):
+    camera_ids.clear()
+    camera_index.invalidate()
+    collection_camera_map.invalidate()
+    marker_index.invalidate()
+    camera_positions.invalidate()
+    camera_catalog.clear()
+    schedule_browser_sync()
+
+index_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, index_depsgraph_update_post),
+    (bpy.app.handlers.load_post, index_load_post),
+    (bpy.app.handlers.load_post, camera_ids_assign),
+    (bpy.app.handlers.save_pre, camera_ids_assign),
+    (bpy.app.handlers.undo_post, index_undo_post),
+    (bpy.app.handlers.redo_post, index_undo_post),
+)
+
+#--------------------------------------------------------------------------------------
+# P R E F E R E N C E S
+#--------------------------------------------------------------------------------------
+
+# ADDON PREFERENCES
+class Cameras_Lister_Preferences(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
+    navigation_undo: bpy.props.BoolProperty(
+        name="Undo Steps for Camera Navigation",
+        description="Push an undo step every time a camera is selected or viewed from the lister. "
+            "Off by default: on large files each step stores the whole file and takes a noticeable time",
+        default=False)
+
+    profiling_enabled: bpy.props.BoolProperty(
+        name="Record Timings",
+        description="Time the lister drawing and every cameras.* operator",
+        default=False,
+        update=lambda self, context: UpdateProfiler(self))
+
+    profiling_buffer_size: bpy.props.IntProperty(
+        name="Samples Kept",
+        description="Size of the ring buffer holding the most recent timings",
+        default=4096, min=64, max=1000000,
+        update=lambda self, context: UpdateProfiler(self))
+
+    thumbnails_enabled: bpy.props.BoolProperty(
+        name="Camera Thumbnails",
+        description="Show a small viewport render of each camera in the lister. "
+            "Thumbnails are rendered in the background a few at a time and cached on disk",
+        default=False,
+        update=lambda self, context: UpdateThumbnails(self))
+
+    thumbnail_size: bpy.props.IntProperty(
+        name="Size",
+        description="Longest side of the thumbnails in pixels",
+        default=128, min=32, max=512,
+        update=lambda self, context: UpdateThumbnails(self))
+
+    thumbnail_memory: bpy.props.IntProperty(
+        name="Memory (MB)",
+        description="Memory kept for thumbnail icons; the least recently shown are released first",
+        default=32, min=1, max=4096,
+        update=lambda self, context: UpdateThumbnails(self))
+
+    thumbnail_disk: bpy.props.IntProperty(
+        name="Disk (MB)",
+        description="Size of the thumbnail cache on disk, shared by all files; the least recently "
+            "shown thumbnails are deleted first",
+        default=256, min=1, max=65536,
+        update=lambda self, context: UpdateThumbnails(self))
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Undo", icon="LOOP_BACK")
+        layout.prop(self, "navigation_undo")
+        layout.separator()
+        layout.label(text="Thumbnails", icon="IMAGE_DATA")
+        row = layout.row()
+        row.prop(self, "thumbnails_enabled")
+        row.prop(self, "thumbnail_size")
+        row.prop(self, "thumbnail_memory")
+        row.prop(self, "thumbnail_disk")
+        layout.operator("cameras.thumbnails_refresh", icon="FILE_REFRESH")
+        layout.separator()
+        layout.label(text="Profiling", icon="TIME")
+        row = layout.row()
+        row.prop(self, "profiling_enabled")
+        row.prop(self, "profiling_buffer_size")
+        row = layout.row()
+        row.operator("cameras.profiling_clear", icon="TRASH")
+        row.operator("cameras.profiling_export", icon="EXPORT")
+        stats = profiler.stats()
+        if not stats:
+            layout.label(text="No timings recorded")
+            return
+        box = layout.box()
+        grid = box.grid_flow(row_major=True, columns=4, even_columns=False, align=True)
+        for heading in ("Name", "Calls", "p50 (ms)", "p95 (ms)"):
+            grid.label(text=heading)
+        for entry in stats:
+            grid.label(text=entry["name"])
+            grid.label(text=str(entry["calls"]))
+            grid.label(text="%.3f" % entry["p50_ms"])
+            grid.label(text="%.3f" % entry["p95_ms"])
+
+def UpdateProfiler(preferences):
+    profiler.configure(preferences.profiling_enabled, preferences.profiling_buffer_size)
+
+def UpdateThumbnails(preferences):
+    camera_thumbnails.configure(preferences.thumbnails_enabled, preferences.thumbnail_size,
+        preferences.thumbnail_memory, preferences.thumbnail_disk)
+
+def GetPreferences(context):
+    addon = context.preferences.addons.get(__name__)
+    return addon.preferences if addon is not None else None
+
+# NAVIGATION UNDO
+# Selecting and viewing cameras is registered without 'UNDO' and only pushes a
+# step when the preference asks for it. Destructive operators keep 'UNDO', and
+# their bulk variants do all their work in one invocation, so one undo step.
+def PushNavigationUndo(context, message):
+    preferences = GetPreferences(context)
+    if preferences is not None and preferences.navigation_undo:
+        bpy.ops.ed.undo_push(message=message)
+
+# CLEAR PROFILING DATA
+class ClearProfilingData(bpy.types.Operator):
+    bl_idname = 'cameras.profiling_clear'
+    bl_label = 'Clear Timings'
+    bl_description = "Forget the recorded timings"
+
+    def execute(self,context):
+        profiler.clear()
+
+        return{'FINISHED'}
+
+# EXPORT PROFILING DATA
+class ExportProfilingData(bpy.types.Operator):
+    bl_idname = 'cameras.profiling_export'
+    bl_label = 'Export Timings'
+    bl_description = "Write the recorded timings to a .json or .csv file"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+
+    def execute(self,context):
+        filepath = bpy.path.abspath(self.filepath)
+        if not filepath.lower().endswith((".json", ".csv")):
+            filepath += ".json"
+        profiler.dump(filepath)
+        self.report({'INFO'}, "Timings written to %s" % filepath)
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "cameras_lister_timings.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
 #--------------------------------------------------------------------------------------
 # F E A T U R E S
@@ -18,29 +1042,68 @@ class Camera_Custom_Resolution_Settings(PropertyGroup):
     Custom_Horizontal_Resolution: bpy.props.IntProperty(
         name="Custom Horizontal Resolution",
         description="Custom Horizontal Resolution",
-        default = 1920)
+        default = 1920,
+        update = lambda self, context: resolution_schedule.invalidate())
         
     Custom_Vertical_Resolution: bpy.props.IntProperty(
         name="Custom Vertical Resolution",
         description="Custom Vertical Resolution",
-        default = 1080)
+        default = 1080,
+        update = lambda self, context: resolution_schedule.invalidate())
 
 # SET CAMERA CUSTOM RESOLUTION
-def SetCameraCustomResolution(self, context):
-    context.scene.render.resolution_x = context.active_object.camera_custom_resolution_settings_pointer_prop.Custom_Horizontal_Resolution
-    context.scene.render.resolution_y = context.active_object.camera_custom_resolution_settings_pointer_prop.Custom_Vertical_Resolution
+def ApplyCameraCustomResolution(scene, cam):
+    settings = cam.camera_custom_resolution_settings_pointer_prop
+    render = scene.render
+    if render.resolution_x != settings.Custom_Horizontal_Resolution:
+        render.resolution_x = settings.Custom_Horizontal_Resolution
+    if render.resolution_y != settings.Custom_Vertical_Resolution:
+        render.resolution_y = settings.Custom_Vertical_Resolution
+
+# SWITCH TO CAMERA
+# Fast path behind SelectCamera, SetCameraView and the camera settings popup:
+# everything goes through the data API, so there is no nested operator call
+# and hidden cameras do not need to be unhidden first. The camera view is
+# recentered but keeps its current zoom.
+def SelectCameraObject(context, cam):
+    layer_objects = context.view_layer.objects
+    if layer_objects.get(cam.name) != cam:
+        # Not in the view layer (e.g. excluded collection), it can still be the scene camera
+        return
+    active = layer_objects.active
+    if active is not None and active != cam and active.select_get():
+        active.select_set(state=False)
+    cam.select_set(state=True)
+    layer_objects.active = cam
+
+def SwitchToCamera(context, cam, select=True, set_view=True):
+    scene = context.scene
+    if select:
+        SelectCameraObject(context, cam)
+    if scene.camera != cam:
+        scene.camera = cam
+    if set_view:
+        space = context.space_data
+        if space is not None and space.type == 'VIEW_3D':
+            if space.use_local_camera:
+                space.camera = cam
+            region_3d = space.region_3d
+            region_3d.view_perspective = 'CAMERA'
+            region_3d.view_camera_offset = (0.0, 0.0)
+    ApplyCameraCustomResolution(scene, cam)
 
 # CAMERA VIEW OFF
 class CameraViewOff(bpy.types.Operator):
     bl_idname = 'cameras.camera_view_off'
     bl_label = 'Camera View Off'
     bl_description = "Camera View Off"
-    bl_options = {'UNDO'}
+    bl_options = {'REGISTER'}
 
     camera: bpy.props.StringProperty()
     
     def execute(self,context):
         context.area.spaces[0].region_3d.view_perspective='PERSP'
+        PushNavigationUndo(context, self.bl_label)
 
         return{'FINISHED'}
 
@@ -80,6 +1143,9 @@ class NewCameraFromView(bpy.types.Operator):
         currentCameraObj = bpy.data.objects[bpy.context.active_object.name]
         scene.camera = currentCameraObj
         bpy.ops.view3d.camera_to_view()
+        camera_ids.identify(currentCameraObj)
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
 
         return{'FINISHED'}
 
@@ -112,45 +1178,110 @@ bpy.types.Scene.sort_cameras = bpy.props.EnumProperty(
     description="Sort cameras",
     default= "alphabetically")
 
+# MARKER RESOLUTION SCHEDULE
+# Camera markers baked into frame-sorted arrays of (camera, resolution). The
+# frame change and render handlers below only do a bisect lookup; the arrays
+# are rebuilt when the markers or a custom resolution change.
+class ResolutionSchedule:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.key = None
+        self.frames = []
+        self.entries = []
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def ensure(self, scene):
+        markers = marker_index.ensure(scene)
+        key = (markers.scene_key, markers.version)
+        if self.dirty or self.key != key:
+            self.rebuild(scene, markers)
+            self.key = key
+        return self
+
+    def rebuild(self, scene, markers):
+        frames = []
+        entries = []
+        for frame in sorted(markers.by_frame):
+            cams = [marker.camera for marker in markers.by_frame[frame] if marker.camera is not None]
+            if not cams:
+                continue
+            cam = cams[0]
+            settings = cam.camera_custom_resolution_settings_pointer_prop
+            frames.append(frame)
+            entries.append((cam, settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution))
+        self.frames = frames
+        self.entries = entries
+        self.dirty = False
+
+    def lookup(self, frame):
+        # Same rule as Blender's marker camera switching: last marker at or
+        # before the frame, else the first one
+        if not self.frames:
+            return None
+        i = bisect.bisect_right(self.frames, frame) - 1
+        return self.entries[max(i, 0)]
+
+resolution_schedule = ResolutionSchedule()
+
+def ApplyScheduledResolution(scene):
+    if not scene.cameras_lister_marker_resolution:
+        return
+    entry = resolution_schedule.ensure(scene).lookup(scene.frame_current)
+    if entry is None:
+        return
+    cam, resolution_x, resolution_y = entry
+    render = scene.render
+    if render.resolution_x != resolution_x:
+        render.resolution_x = resolution_x
+    if render.resolution_y != resolution_y:
+        render.resolution_y = resolution_y
+
+@persistent
+def resolution_schedule_frame_change_pre(scene, depsgraph=None):
+    ApplyScheduledResolution(scene)
+
+@persistent
+def resolution_schedule_render_pre(scene, depsgraph=None):
+    ApplyScheduledResolution(scene)
+
+@persistent
+def resolution_schedule_reset(*args):
+    resolution_schedule.clear()
+
+resolution_schedule_handlers = (
+    (bpy.app.handlers.frame_change_pre, resolution_schedule_frame_change_pre),
+    (bpy.app.handlers.render_pre, resolution_schedule_render_pre),
+    (bpy.app.handlers.load_post, resolution_schedule_reset),
+    (bpy.app.handlers.undo_post, resolution_schedule_reset),
+    (bpy.app.handlers.redo_post, resolution_schedule_reset),
+)
+
+bpy.types.Scene.cameras_lister_marker_resolution = bpy.props.BoolProperty(
+    name="Marker Resolution",
+    description="Switch the render resolution to the custom resolution of the camera bound to the "
+        "current marker on frame change and at render time",
+    default=False)
+
 # SET CAMERA VIEW
 class SetCameraView(bpy.types.Operator):
     bl_idname = 'cameras.set_view'
     bl_label = 'Set Camera View'
     bl_description = "Set View to this Camera"
-    bl_options = {'UNDO'}
+    bl_options = {'REGISTER'}
 
     camera: bpy.props.StringProperty()
 
     def execute(self,context):
-        
-        if bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == False:
-            bpy.context.object.hide_set(False)
-            bpy.ops.cameras.select(camera=self.camera)
-            bpy.ops.view3d.object_as_camera()
-            bpy.ops.view3d.view_center_camera()
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-        elif bpy.context.object.hide_get(view_layer=None) == False and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_viewport = False
-            bpy.ops.cameras.select(camera=self.camera)
-            bpy.ops.view3d.object_as_camera()
-            bpy.ops.view3d.view_center_camera()
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_viewport = True
-        elif bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_set(False)
-            bpy.context.object.hide_viewport = False
-            bpy.ops.cameras.select(camera=self.camera)
-            bpy.ops.view3d.object_as_camera()
-            bpy.ops.view3d.view_center_camera()
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-            bpy.context.object.hide_viewport = True
-        else:
-            bpy.ops.cameras.select(camera=self.camera)
-            bpy.ops.view3d.object_as_camera()
-            bpy.ops.view3d.view_center_camera()
-            SetCameraCustomResolution(self, context)
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        SwitchToCamera(context, cam)
+        PushNavigationUndo(context, self.bl_label)
 
         return{'FINISHED'}
 
@@ -159,37 +1290,112 @@ class SelectCamera(bpy.types.Operator):
     bl_idname = 'cameras.select'
     bl_label = 'Select Camera'
     bl_description = "Select camera"
-    bl_options = {'UNDO'}
+    bl_options = {'REGISTER'}
 
     camera: bpy.props.StringProperty()
 
     def execute(self,context):
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        SwitchToCamera(context, cam, set_view=False)
+        PushNavigationUndo(context, self.bl_label)
         
-        if context.object:
-            if context.object.select_get():
-                context.object.select_set(state=False)
-        cam=bpy.data.objects[self.camera]
-        cam.select_set(state=True)
-        context.view_layer.objects.active = cam
-        context.scene.camera=cam
-        
-        if bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == False:
-            bpy.context.object.hide_set(False)
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-        elif bpy.context.object.hide_get(view_layer=None) == False and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_viewport = False
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_viewport = True
-        elif bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_set(False)
-            bpy.context.object.hide_viewport = False
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-            bpy.context.object.hide_viewport = True
+        return{'FINISHED'}
+
+# VIEW NEAREST CAMERA
+class ViewNearestCamera(bpy.types.Operator):
+    bl_idname = 'cameras.view_nearest'
+    bl_label = 'View Nearest Camera'
+    bl_description = "Set View to the camera closest to the viewport"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data is not None and context.space_data.type == 'VIEW_3D'
+
+    def execute(self,context):
+        cam = NearestViewCamera(context)
+        if cam is None:
+            return{'CANCELLED'}
+        SwitchToCamera(context, cam)
+        PushNavigationUndo(context, self.bl_label)
+
+        return{'FINISHED'}
+
+def NearestViewCamera(context):
+    space = context.space_data
+    if space is None or space.type != 'VIEW_3D':
+        return None
+    region_3d = space.region_3d
+    location = region_3d.view_matrix.inverted().translation
+    # From a camera view, go to the next closest one
+    exclude = context.scene.camera if region_3d.view_perspective == 'CAMERA' else None
+    return get_camera_positions(context).nearest(location, exclude)
+
+# STEP CAMERA
+class StepCamera(bpy.types.Operator):
+    bl_idname = 'cameras.step'
+    bl_label = 'Step to Camera'
+    bl_description = "Set View to the closest camera in a direction relative to the active camera"
+    bl_options = {'REGISTER'}
+
+    direction: bpy.props.EnumProperty(
+        name="Direction",
+        items=[
+            ("LEFT", "Left", "Closest camera to the left of the active camera"),
+            ("RIGHT", "Right", "Closest camera to the right of the active camera"),
+            ("FORWARD", "Forward", "Closest camera in front of the active camera"),
+            ("BACK", "Back", "Closest camera behind the active camera")],
+        default="RIGHT")
+
+    directions = {
+        "LEFT": (-1.0, 0.0, 0.0),
+        "RIGHT": (1.0, 0.0, 0.0),
+        "FORWARD": (0.0, 0.0, -1.0),
+        "BACK": (0.0, 0.0, 1.0),
+    }
+
+    def execute(self,context):
+        scene_camera = context.scene.camera
+        if scene_camera is None:
+            # Nothing to step from, start at the camera closest to the view
+            cam = NearestViewCamera(context)
         else:
-            SetCameraCustomResolution(self, context)
-        
+            cam = get_camera_positions(context).step(scene_camera, self.directions[self.direction])
+            if cam is None:
+                self.report({'INFO'}, "No camera %s of %s" % (self.direction.lower(), scene_camera.name))
+        if cam is None:
+            return{'CANCELLED'}
+        SwitchToCamera(context, cam)
+        PushNavigationUndo(context, self.bl_label)
+
+        return{'FINISHED'}
+
+# VIEW CATALOG CAMERA
+class CatalogViewCamera(bpy.types.Operator):
+    bl_idname = 'cameras.catalog_view'
+    bl_label = 'View Camera'
+    bl_description = "Switch to this camera's scene and set View to it"
+    bl_options = {'REGISTER'}
+
+    scene: bpy.props.StringProperty()
+    camera: bpy.props.StringProperty()
+    library: bpy.props.StringProperty()
+
+    def execute(self,context):
+        scene = bpy.data.scenes.get(self.scene) if self.scene else context.scene
+        cam = bpy.data.objects.get((self.camera, self.library or None))
+        if scene is None or cam is None or cam.type != 'CAMERA':
+            self.report({'WARNING'}, "Camera %s no longer exists" % self.camera)
+            camera_catalog.clear()
+            return{'CANCELLED'}
+        if context.window.scene != scene:
+            context.window.scene = scene
+        # Linked cameras outside every scene can be the scene camera but not selected
+        SwitchToCamera(context, cam, select=bool(self.scene))
+        PushNavigationUndo(context, self.bl_label)
+
         return{'FINISHED'}
 
 # BIND CAMERA TO MARKER
@@ -202,19 +1408,15 @@ class BindCameraToMarker(bpy.types.Operator):
     camera: bpy.props.StringProperty()
 
     def execute(self,context):
-                
-        tm = bpy.context.scene.timeline_markers
-        cur_frame = context.scene.frame_current
-        frame_markers = [marker for marker in tm if marker.frame == cur_frame]
-
-        if len(frame_markers) == 0:
-            new_marker = tm.new(self.camera, frame = cur_frame)
-            new_marker.camera = bpy.data.objects[self.camera]
-        elif len(frame_markers) >= 1:
-            for marker in frame_markers:
-                tm.remove(marker)
-            new_marker = tm.new(self.camera, frame = cur_frame)
-            new_marker.camera = bpy.data.objects[self.camera]
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        scene = context.scene
+        markers = get_marker_index(context)
+        cur_frame = scene.frame_current
+
+        markers.remove_many(scene, markers.at_frame(cur_frame))
+        markers.add(scene, cam.name, cur_frame, cam)
         
         return{'FINISHED'}
 
@@ -228,14 +1430,14 @@ class Delete_Camera_Marker(bpy.types.Operator):
     camera: bpy.props.StringProperty()
 
     def execute(self,context):
-        
-        tm = bpy.context.scene.timeline_markers
-        cur_frame = context.scene.frame_current
-        frame_markers = [marker for marker in tm if marker.frame == cur_frame]
-        
-        for marker in frame_markers:
-            if marker.name == self.camera:
-                tm.remove(frame_markers[0])
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        scene = context.scene
+        markers = get_marker_index(context)
+
+        markers.remove_many(scene, [marker for marker in markers.at_frame(scene.frame_current)
+            if marker.camera == cam])
 
         return{'FINISHED'}
 
@@ -249,16 +1451,628 @@ class DeleteCamera(bpy.types.Operator):
     camera: bpy.props.StringProperty()
 
     def execute(self,context):
-        cam=bpy.data.objects[self.camera]
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        get_marker_index(context).unbind_camera(context.scene, cam)
+        camera_ids.discard(cam)
         bpy.data.objects.remove(cam)
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
         
-        tm = bpy.context.scene.timeline_markers
-        for marker in tm:
-            if marker.name == self.camera:
-                 tm.remove(marker)
-        
         return{'FINISHED'}
 
+# PICK CAMERA
+class PickCamera(bpy.types.Operator):
+    bl_idname = 'cameras.pick'
+    bl_label = 'Pick Camera'
+    bl_description = "Add or remove this camera from the cameras affected by the bulk operations"
+
+    camera: bpy.props.StringProperty()
+
+    def execute(self,context):
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        key = camera_ids.key(cam)
+        if key in lister_selection.keys:
+            lister_selection.keys.discard(key)
+        else:
+            lister_selection.keys.add(key)
+
+        return{'FINISHED'}
+
+# PICK CAMERAS
+class PickCameras(bpy.types.Operator):
+    bl_idname = 'cameras.pick_all'
+    bl_label = 'Pick Cameras'
+    bl_description = "Change which cameras are affected by the bulk operations"
+
+    action: bpy.props.EnumProperty(
+        items=[
+            ("ALL", "All", "Pick every camera shown by the lister"),
+            ("NONE", "None", "Clear the picked cameras"),
+            ("INVERT", "Invert", "Invert the picked cameras among those shown"),
+            ("VIEWPORT", "From Viewport", "Pick the cameras selected in the viewport")],
+        default="ALL")
+
+    def execute(self,context):
+        index = get_camera_index(context)
+        objects = index.objects
+        matches = ListerMatches(context.window_manager.cameras_lister_search)
+        shown = {row_data.key for row_data in index.rows if matches is None or row_data.name in matches}
+        if self.action == "ALL":
+            lister_selection.keys |= shown
+        elif self.action == "NONE":
+            lister_selection.clear()
+        elif self.action == "INVERT":
+            lister_selection.keys ^= shown
+        elif self.action == "VIEWPORT":
+            keys = (camera_ids.key(ob) for ob in context.selected_objects if ob.type == 'CAMERA')
+            lister_selection.keys = {key for key in keys if key in objects}
+
+        return{'FINISHED'}
+
+# BULK DELETE CAMERAS
+class BulkDeleteCameras(bpy.types.Operator):
+    bl_idname = 'cameras.bulk_delete'
+    bl_label = 'Delete Picked Cameras'
+    bl_description = "Delete the picked cameras and their markers"
+    bl_options = {'UNDO'}
+
+    def execute(self,context):
+        cams = SelectedCameras(context)
+        if not cams:
+            return{'CANCELLED'}
+        scene = context.scene
+        markers = get_marker_index(context)
+        markers.remove_many(scene, [marker for cam in cams for marker in markers.for_camera(cam)])
+        for cam in cams:
+            camera_ids.discard(cam)
+        if hasattr(bpy.data, "batch_remove"):
+            bpy.data.batch_remove(cams)
+        else:
+            for cam in cams:
+                bpy.data.objects.remove(cam)
+        lister_selection.clear()
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
+        self.report({'INFO'}, "Deleted %d cameras" % len(cams))
+
+        return{'FINISHED'}
+
+# BULK BIND CAMERAS TO MARKERS
+class BulkBindCamerasToMarkers(bpy.types.Operator):
+    bl_idname = 'cameras.bulk_bind_to_marker'
+    bl_label = 'Bind Picked Cameras to Markers'
+    bl_description = "Bind the picked cameras, in list order, to markers starting at the current frame"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_step: bpy.props.IntProperty(
+        name="Frame Step",
+        description="Frames between two consecutive camera markers",
+        default=1, min=1)
+
+    def execute(self,context):
+        cams = SelectedCameras(context)
+        if not cams:
+            return{'CANCELLED'}
+        scene = context.scene
+        markers = get_marker_index(context)
+        frames = [scene.frame_current + i * self.frame_step for i in range(len(cams))]
+        markers.remove_many(scene, [marker for frame in frames for marker in markers.at_frame(frame)])
+        markers.add_many(scene, [(cam.name, frame, cam) for frame, cam in zip(frames, cams)])
+
+        return{'FINISHED'}
+
+# BULK UNBIND CAMERAS
+class BulkUnbindCameras(bpy.types.Operator):
+    bl_idname = 'cameras.bulk_unbind'
+    bl_label = 'Unbind Picked Cameras'
+    bl_description = "Remove every marker bound to the picked cameras"
+    bl_options = {'UNDO'}
+
+    def execute(self,context):
+        cams = SelectedCameras(context)
+        if not cams:
+            return{'CANCELLED'}
+        markers = get_marker_index(context)
+        markers.remove_many(context.scene, [marker for cam in cams for marker in markers.for_camera(cam)])
+
+        return{'FINISHED'}
+
+# SEQUENCE CAMERA MARKERS
+# Builds a whole camera cut in one pass: the chosen cameras, in order, are
+# bound to markers spread evenly over a frame range or spaced by a fixed shot
+# length. The markers being replaced go in a single remove_many and the new
+# ones are linked into the marker index as they are created, so the marker
+# list is never rescanned per shot.
+def SequenceCameras(context, source, collection="", pattern=""):
+    scene = context.scene
+    index = get_camera_index(context)
+    if source == "PICKED":
+        return SelectedCameras(context)
+    if source == "COLLECTION":
+        keys = dict(collection_camera_map.ensure(scene).groups).get(collection, ())
+        return [index.objects[key] for key in keys]
+    if source == "PATTERN":
+        pattern = pattern.lower()
+        return [row_data.object for row_data in index.rows if fnmatch.fnmatchcase(row_data.name.lower(), pattern)]
+    return [row_data.object for row_data in
+        ListedCameraRows(scene, search=context.window_manager.cameras_lister_search)]
+
+def CameraCutList(cams, frame_start, frame_end, shot_length=0):
+    # (first frame, last frame, camera) per shot; without a shot length the
+    # range is split evenly and cameras that do not fit are left out
+    if shot_length:
+        starts = [frame_start + i * shot_length for i in range(len(cams))]
+        frame_end = frame_start + len(cams) * shot_length - 1
+    else:
+        span = frame_end - frame_start + 1
+        cams = cams[:max(span, 0)]
+        starts = [frame_start + i * span // len(cams) for i in range(len(cams))]
+    ends = [start - 1 for start in starts[1:]] + [frame_end]
+    return list(zip(starts, ends, cams))
+
+class SequenceCameraMarkers(bpy.types.Operator):
+    bl_idname = 'cameras.sequence_markers'
+    bl_label = 'Sequence Camera Markers'
+    bl_description = "Bind a series of cameras to markers over a frame range, or remove their markers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    PREVIEW_ROWS = 12
+
+    source: bpy.props.EnumProperty(
+        name="Cameras",
+        items=[
+            ("LISTED", "Listed", "Every camera the lister shows, in list order"),
+            ("PICKED", "Picked", "The cameras picked for bulk operations, in list order"),
+            ("COLLECTION", "Collection", "The cameras of one collection, by name"),
+            ("PATTERN", "Pattern", "The cameras whose name matches a wildcard pattern, by name")],
+        default="LISTED")
+    collection: bpy.props.StringProperty(name="Collection")
+    pattern: bpy.props.StringProperty(
+        name="Pattern",
+        description="Case-insensitive name pattern, * and ? are wildcards",
+        default="*")
+    timing: bpy.props.EnumProperty(
+        name="Timing",
+        items=[
+            ("RANGE", "Frame Range", "Split the frame range evenly between the cameras"),
+            ("LENGTH", "Shot Length", "Give every camera the same number of frames")],
+        default="RANGE")
+    frame_start: bpy.props.IntProperty(name="Start", default=1)
+    frame_end: bpy.props.IntProperty(name="End", default=250)
+    shot_length: bpy.props.IntProperty(name="Shot Length", default=24, min=1)
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ("CREATE", "Create", "Add the markers, replacing markers on the cut frames"),
+            ("REPLACE", "Replace", "Remove every camera marker in the range first"),
+            ("REMOVE", "Remove", "Remove the markers of these cameras in the range")],
+        default="REPLACE")
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report the resulting cut list",
+        default=False)
+
+    def cut_list(self, context):
+        cams = SequenceCameras(context, self.source, self.collection, self.pattern)
+        if not cams:
+            return []
+        shot_length = self.shot_length if self.timing == "LENGTH" else 0
+        return CameraCutList(cams, self.frame_start, self.frame_end, shot_length)
+
+    def execute(self,context):
+        scene = context.scene
+        cuts = self.cut_list(context)
+        if not cuts:
+            self.report({'WARNING'}, "No cameras to sequence")
+            return{'CANCELLED'}
+        if self.dry_run:
+            self.report({'INFO'}, "\n".join("%d-%d %s" % (start, end, cam.name) for start, end, cam in cuts))
+            return{'CANCELLED'}
+
+        markers = get_marker_index(context)
+        first, last = cuts[0][0], cuts[-1][1]
+        if self.action == "REMOVE":
+            stale = [marker for start, end, cam in cuts for marker in markers.for_camera(cam)
+                if first <= marker.frame <= last]
+        else:
+            stale = {marker.as_pointer(): marker for start, end, cam in cuts for marker in markers.at_frame(start)}
+            if self.action == "REPLACE":
+                stale.update((marker.as_pointer(), marker) for bound in markers.by_camera.values()
+                    for marker in bound if first <= marker.frame <= last)
+            stale = list(stale.values())
+        markers.remove_many(scene, stale)
+        if self.action == "REMOVE":
+            self.report({'INFO'}, "Removed %d markers" % len(stale))
+        else:
+            markers.add_many(scene, [(cam.name, start, cam) for start, end, cam in cuts])
+            self.report({'INFO'}, "Bound %d cameras from frame %d to %d" % (len(cuts), first, last))
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self, width=360)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "source")
+        if self.source == "COLLECTION":
+            layout.prop_search(self, "collection", bpy.data, "collections")
+        elif self.source == "PATTERN":
+            layout.prop(self, "pattern")
+        layout.prop(self, "timing")
+        row = layout.row(align=True)
+        row.prop(self, "frame_start")
+        row.prop(self, "frame_end" if self.timing == "RANGE" else "shot_length")
+        layout.prop(self, "action")
+        layout.prop(self, "dry_run")
+
+        # Preview of the resulting cut list
+        cuts = self.cut_list(context)
+        col = layout.box().column(align=True)
+        if not cuts:
+            col.label(text="No cameras", icon="INFO")
+        for start, end, cam in cuts[:self.PREVIEW_ROWS]:
+            row = col.row()
+            row.label(text="%d - %d" % (start, end))
+            row.label(text=cam.name, icon="OUTLINER_OB_CAMERA")
+        if len(cuts) > self.PREVIEW_ROWS:
+            col.label(text="... %d more shots up to frame %d" % (len(cuts) - self.PREVIEW_ROWS, cuts[-1][1]))
+
+# BULK CAMERAS CUSTOM RESOLUTION
+BULK_EDIT_MODES = [
+    ("SET", "Set", "Replace the value"),
+    ("ADD", "Add", "Add to the current value"),
+    ("MULTIPLY", "Multiply", "Multiply the current value")]
+
+class BulkCamerasCustomResolution(bpy.types.Operator):
+    bl_idname = 'cameras.bulk_custom_resolution'
+    bl_label = 'Set Picked Cameras Resolution'
+    bl_description = "Set, offset or scale the custom resolution of the picked cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(name="Mode", items=BULK_EDIT_MODES, default="SET")
+    horizontal: bpy.props.IntProperty(name="Horizontal", default=1920, min=4)
+    vertical: bpy.props.IntProperty(name="Vertical", default=1080, min=4)
+    offset_horizontal: bpy.props.IntProperty(name="Horizontal", default=0)
+    offset_vertical: bpy.props.IntProperty(name="Vertical", default=0)
+    factor: bpy.props.FloatProperty(name="Factor", default=1.0, min=0.001)
+
+    def execute(self,context):
+        # Linked cameras are skipped, edits to them would not be saved
+        cams = [cam for cam in SelectedCameras(context) if cam.library is None]
+        if not cams:
+            return{'CANCELLED'}
+        for cam in cams:
+            settings = cam.camera_custom_resolution_settings_pointer_prop
+            horizontal, vertical = BulkResolution(self.mode,
+                (settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution),
+                (self.horizontal, self.vertical), (self.offset_horizontal, self.offset_vertical), self.factor)
+            settings.Custom_Horizontal_Resolution = horizontal
+            settings.Custom_Vertical_Resolution = vertical
+        if context.scene.camera in cams:
+            ApplyCameraCustomResolution(context.scene, context.scene.camera)
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode", expand=True)
+        if self.mode == "SET":
+            layout.prop(self, "horizontal")
+            layout.prop(self, "vertical")
+        elif self.mode == "ADD":
+            layout.prop(self, "offset_horizontal")
+            layout.prop(self, "offset_vertical")
+        else:
+            layout.prop(self, "factor")
+
+# The factor scales both sides and keeps the aspect
+def BulkResolution(mode, current, resolution, offset, factor):
+    if mode == "SET":
+        values = resolution
+    elif mode == "ADD":
+        values = (current[0] + offset[0], current[1] + offset[1])
+    else:
+        values = (round(current[0] * factor), round(current[1] * factor))
+    return max(4, int(values[0])), max(4, int(values[1]))
+
+# BULK EDIT CAMERAS
+# Reads one camera data property of the whole file with foreach_get, changes
+# the rows of the chosen cameras in a NumPy array and writes it back with a
+# single foreach_set. Cameras sharing data are edited once; linked cameras and
+# camera data are skipped, edits to them would not be saved. foreach_set may
+# write straight into the data blocks without clamping or updates, so values
+# are clamped to the property range here and the edited data are tagged.
+BULK_EDIT_KEYS = (
+    ("lens", "Focal Length", 1.0, None),
+    ("ortho_scale", "Orthographic Scale", 0.000001, None),
+    ("shift_x", "Shift X", -10.0, 10.0),
+    ("shift_y", "Shift Y", -10.0, 10.0),
+    ("clip_start", "Clip Start", 0.000001, None),
+    ("clip_end", "Clip End", 0.000001, None),
+    ("sensor_width", "Sensor Width", 1.0, None),
+    ("sensor_height", "Sensor Height", 1.0, None),
+)
+
+def BulkEditCameraData(cams, key, mode, value):
+    import numpy as np
+    all_data = bpy.data.cameras
+    data_index = {data.as_pointer(): i for i, data in enumerate(all_data)}
+    rows = sorted({data_index[cam.data.as_pointer()] for cam in cams
+        if cam.library is None and cam.data.library is None})
+    if not rows:
+        return 0
+    # Worked out in double precision, rounded to the stored float once
+    values = np.empty(len(all_data), dtype=np.float64)
+    all_data.foreach_get(key, values)
+    if mode == "SET":
+        values[rows] = value
+    elif mode == "ADD":
+        values[rows] += value
+    else:
+        values[rows] *= value
+    minimum, maximum = next((low, high) for name, label, low, high in BULK_EDIT_KEYS if name == key)
+    values[rows] = np.clip(values[rows], minimum, maximum)
+    all_data.foreach_set(key, values.astype(np.float32))
+    for i in rows:
+        all_data[i].update_tag()
+    return len(rows)
+
+class BulkEditCameras(bpy.types.Operator):
+    bl_idname = 'cameras.bulk_edit'
+    bl_label = 'Bulk Edit Cameras'
+    bl_description = "Set, offset or scale a lens, shift or clipping value of many cameras at once"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: bpy.props.EnumProperty(
+        name="Cameras",
+        items=[
+            ("PICKED", "Picked", "Only the cameras picked for bulk operations"),
+            ("LISTED", "Listed", "Every camera the lister shows with the current sort and search"),
+            ("SELECTED", "Selected", "The cameras selected in the viewport")],
+        default="PICKED")
+    attribute: bpy.props.EnumProperty(
+        name="Property",
+        items=[(key, label, "") for key, label, low, high in BULK_EDIT_KEYS],
+        default="lens")
+    mode: bpy.props.EnumProperty(name="Mode", items=BULK_EDIT_MODES, default="SET")
+    value: bpy.props.FloatProperty(name="Value", default=50.0)
+
+    def execute(self,context):
+        if self.scope == "PICKED":
+            cams = SelectedCameras(context)
+        elif self.scope == "LISTED":
+            cams = [row_data.object for row_data in ListedCameraRows(context.scene,
+                search=context.window_manager.cameras_lister_search)]
+        else:
+            cams = [ob for ob in context.selected_objects if ob.type == 'CAMERA']
+        if not cams:
+            return{'CANCELLED'}
+        count = BulkEditCameraData(cams, self.attribute, self.mode, self.value)
+        self.report({'INFO'}, "Edited %d cameras" % count)
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        if self.scope == "PICKED" and not lister_selection.keys:
+            self.scope = "LISTED"
+        return context.window_manager.invoke_props_dialog(self)
+
+# CAMERAS SEEING SELECTION
+# Tests the selected objects' bounding boxes against the view frustum of every
+# camera at once with NumPy. The lens, sensor, shift and clipping of all camera
+# data come from bpy.data.cameras through foreach_get, and the camera matrices
+# from scene.objects through foreach_get, at the positions the camera index
+# recorded. The camera type and sensor fit are enums and the custom resolution
+# lives in a property group, none of which foreach_get can read, so those are
+# still read per camera. The frustum is the one Blender computes for the
+# camera at its custom resolution. A box counts as seen unless all its corners
+# lie outside one of the frustum planes, which errs on the side of seen near
+# frustum edges. Panoramic cameras see everything.
+FRUSTUM_CAMERA_KEYS = ("lens", "sensor_width", "sensor_height", "shift_x", "shift_y",
+    "clip_start", "clip_end", "ortho_scale")
+
+def CameraFrustumPlanes(scene, cams):
+    import numpy as np
+    count = len(cams)
+    all_data = bpy.data.cameras
+    data_index = {data.as_pointer(): i for i, data in enumerate(all_data)}
+    params = {}
+    for key in FRUSTUM_CAMERA_KEYS:
+        values = np.empty(len(all_data), dtype=np.float64)
+        all_data.foreach_get(key, values)
+        params[key] = values
+
+    rows = np.empty(count, dtype=np.int64)
+    resolution = np.empty((count, 2), dtype=np.float64)
+    types = []
+    fits = []
+    for i, cam in enumerate(cams):
+        data = cam.data
+        rows[i] = data_index[data.as_pointer()]
+        settings = cam.camera_custom_resolution_settings_pointer_prop
+        resolution[i] = settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution
+        types.append(data.type)
+        fits.append(data.sensor_fit)
+    types = np.array(types)
+    fits = np.array(fits)
+    lens, sensor_width, sensor_height, shift_x, shift_y, clip_start, clip_end, ortho_scale = (
+        params[key][rows] for key in FRUSTUM_CAMERA_KEYS)
+
+    # Same view plane as Blender's BKE_camera_params_compute_viewplane
+    render = scene.render
+    ycor = render.pixel_aspect_y / render.pixel_aspect_x
+    win_x = resolution[:, 0]
+    win_y = resolution[:, 1]
+    horizontal = np.where(fits == 'AUTO', win_x >= win_y * ycor, fits == 'HORIZONTAL')
+    sensor = np.where(fits == 'VERTICAL', sensor_height, sensor_width)
+    viewfac = np.where(horizontal, win_x, ycor * win_y)
+    perspective = (types != 'ORTHO').astype(np.float64)
+    pixsize = np.where(types == 'ORTHO', ortho_scale, sensor / lens) / viewfac
+    x_lo = (-0.5 * win_x + shift_x * viewfac) * pixsize
+    x_hi = (0.5 * win_x + shift_x * viewfac) * pixsize
+    y_lo = (-0.5 * ycor * win_y + shift_y * viewfac) * pixsize
+    y_hi = (0.5 * ycor * win_y + shift_y * viewfac) * pixsize
+
+    # Planes in camera space as n.p + d >= 0, the camera looking down -Z
+    flat = 1.0 - perspective
+    zeros = np.zeros(count)
+    ones = np.ones(count)
+    normals = np.stack([
+        np.stack([ones, zeros, perspective * x_lo], axis=1),
+        np.stack([-ones, zeros, -perspective * x_hi], axis=1),
+        np.stack([zeros, ones, perspective * y_lo], axis=1),
+        np.stack([zeros, -ones, -perspective * y_hi], axis=1),
+        np.stack([zeros, zeros, -ones], axis=1),
+        np.stack([zeros, zeros, ones], axis=1)], axis=1)
+    offsets = np.stack([-flat * x_lo, flat * x_hi, -flat * y_lo, flat * y_hi, -clip_start, clip_end], axis=1)
+    panoramic = types == 'PANO'
+    normals[panoramic] = 0.0
+    offsets[panoramic] = 1.0
+
+    # To world space; Blender ignores the camera's scale
+    matrices = CameraMatrices(scene, cams)
+    rotation = matrices[:, :3, :3] / np.linalg.norm(matrices[:, :3, :3], axis=1, keepdims=True)
+    normals = np.einsum('cij,cpj->cpi', rotation, normals)
+    offsets = offsets - np.einsum('cpi,ci->cp', normals, matrices[:, :3, 3])
+    return normals, offsets
+
+def CameraMatrices(scene, cams):
+    import numpy as np
+    index = camera_index.ensure(scene)
+    objects = scene.objects
+    count = len(objects)
+    keys = [camera_ids.key(cam) for cam in cams]
+    positions = [index.positions.get(key) for key in keys]
+    if (cams and None not in positions and count == index.object_count
+    and all(index.objects[key] == cam for key, cam in zip(keys, cams))
+    and ObjectsAtPositions(objects, count, positions, cams)):
+        values = np.empty(count * 16, dtype=np.float32)
+        objects.foreach_get("matrix_world", values)
+        # Column-major in Blender
+        return values.reshape(-1, 4, 4)[positions].transpose(0, 2, 1).astype(np.float64)
+    # Not all from this scene's index, or its positions no longer hold
+    return np.array([cam.matrix_world for cam in cams], dtype=np.float64).reshape(len(cams), 4, 4)
+
+# Whether the cameras still sit at these positions of scene.objects; a script
+# may add and remove objects before the depsgraph handler runs. Identities are
+# compared through session_uid where Blender has it, else only the count is.
+def ObjectsAtPositions(objects, count, positions, cams):
+    import numpy as np
+    if not hasattr(cams[0], "session_uid"):
+        return True
+    uids = np.empty(count, dtype=np.int32)
+    objects.foreach_get("session_uid", uids)
+    return bool((uids[positions] == [cam.session_uid for cam in cams]).all())
+
+# World space center and half axes of each object's bounding box
+def ObjectBounds(objects):
+    import numpy as np
+    centers = np.empty((len(objects), 3), dtype=np.float64)
+    half_axes = np.empty((len(objects), 3, 3), dtype=np.float64)
+    for i, ob in enumerate(objects):
+        matrix = np.array(ob.matrix_world, dtype=np.float64).reshape(4, 4)
+        box = np.array(ob.bound_box, dtype=np.float64)
+        low = box.min(axis=0)
+        high = box.max(axis=0)
+        centers[i] = matrix[:3, :3] @ ((low + high) * 0.5) + matrix[:3, 3]
+        half_axes[i] = (matrix[:3, :3] * ((high - low) * 0.5)).T
+    return centers, half_axes
+
+def CamerasSeeing(scene, cams, objects, require_all=False):
+    import numpy as np
+    if not cams or not objects:
+        return []
+    normals, offsets = CameraFrustumPlanes(scene, cams)
+    centers, half_axes = ObjectBounds(objects)
+    seen = np.empty(len(cams), dtype=bool)
+    # Cameras are tested in blocks to bound the planes x objects arrays
+    block = max(1, 1000000 // (6 * len(objects)))
+    for start in range(0, len(cams), block):
+        planes = normals[start:start + block].reshape(-1, 3)
+        # Distance of each box center to each plane, plus how far the box
+        # reaches towards the plane: negative when even the nearest corner is out
+        distances = planes @ centers.T + offsets[start:start + block].reshape(-1, 1)
+        for axis in range(3):
+            distances += np.abs(planes @ half_axes[:, axis, :].T)
+        inside = ~(distances < 0.0).reshape(-1, 6, len(objects)).any(axis=1)
+        seen[start:start + block] = inside.all(axis=1) if require_all else inside.any(axis=1)
+    return [cam for cam, is_seen in zip(cams, seen) if is_seen]
+
+# Result of the last query; the lister only shows these cameras while it is set
+class CameraVisibility:
+    def __init__(self):
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.names = None
+        self.targets = ()
+        self.version += 1
+
+    def set(self, names, targets):
+        self.names = frozenset(names)
+        self.targets = tuple(targets)
+        self.version += 1
+
+camera_visibility = CameraVisibility()
+
+class CamerasSeeingSelection(bpy.types.Operator):
+    bl_idname = 'cameras.seeing_selection'
+    bl_label = 'Cameras Seeing Selection'
+    bl_description = "Only list the cameras whose view frames the selected objects"
+
+    match: bpy.props.EnumProperty(
+        name="Match",
+        items=[
+            ("ANY", "Any", "Cameras seeing at least one of the selected objects"),
+            ("ALL", "All", "Cameras seeing every selected object")],
+        default="ANY")
+    clear: bpy.props.BoolProperty(
+        name="Clear",
+        description="Show every camera again",
+        default=False,
+        options={'SKIP_SAVE'})
+
+    def execute(self,context):
+        if self.clear:
+            camera_visibility.clear()
+            return{'FINISHED'}
+        objects = [ob for ob in context.selected_objects if ob.type != 'CAMERA']
+        if not objects:
+            self.report({'WARNING'}, "Select the objects the cameras should frame")
+            return{'CANCELLED'}
+        cams = [row_data.object for row_data in get_camera_index(context).rows]
+        seeing = CamerasSeeing(context.scene, cams, objects, self.match == "ALL")
+        camera_visibility.set([cam.name for cam in seeing], [ob.name for ob in objects])
+        self.report({'INFO'}, "%d of %d cameras see the selection" % (len(seeing), len(cams)))
+
+        return{'FINISHED'}
+
+# CAMERA SETTINGS
+# Camera data edited in the camera settings popup, as fingerprinted by the
+# render cache and written by the camera export
+CAMERA_STRING_KEYS = ("type", "lens_unit", "sensor_fit")
+CAMERA_FLOAT_KEYS = ("lens", "ortho_scale", "shift_x", "shift_y", "clip_start", "clip_end",
+    "sensor_width", "sensor_height")
+PANORAMA_STRING_KEYS = ("panorama_type",)
+PANORAMA_FLOAT_KEYS = ("fisheye_fov", "fisheye_lens", "latitude_min", "latitude_max",
+    "longitude_min", "longitude_max")
+
+# Panorama settings moved from the Cycles camera settings to the camera in Blender 4.0
+def CameraPanoramaSettings(data):
+    return data if hasattr(data, "panorama_type") else getattr(data, "cycles", None)
+
 # PANEL BUTTON - CAMERA SETTINGS
 class PanelButton_CameraSettings(bpy.types.Operator):
     bl_idname = "camera.settings"
@@ -274,7 +2088,13 @@ class PanelButton_CameraSettings(bpy.types.Operator):
     def draw(self, context):
         layout = self.layout
 
-        cam = bpy.context.object.data
+        # The camera itself, not the active object: cameras outside the view
+        # layer cannot be made active
+        cam_object = ResolveCamera(self.camera)
+        if cam_object is None:
+            layout.label(text="Camera not found", icon="ERROR")
+            return
+        cam = cam_object.data
         layout.label(text="RENDER SETTINGS", icon="RESTRICT_RENDER_OFF")
         col = layout.column(align=False)
         row = col.row()
@@ -325,62 +2145,372 @@ class PanelButton_CameraSettings(bpy.types.Operator):
         row.prop(cam, "clip_end", text="End")
         layout.label(text="Custom Resolution:")
         row = layout.row(align=False)
-        if bpy.context.object.hide_get(view_layer=None) == True or bpy.context.object.hide_viewport == True:
-            rowbox = row.box()
-            rowbox.alert =True
-            rowbox.label(text="Unhide Camera in viewport to setup resolution", icon= "ERROR")
-        else:
-            row.prop(context.active_object.camera_custom_resolution_settings_pointer_prop, "Custom_Horizontal_Resolution", text="Horizontal")
-            row.prop(context.active_object.camera_custom_resolution_settings_pointer_prop, "Custom_Vertical_Resolution", text="Vertical")
+        row.prop(cam_object.camera_custom_resolution_settings_pointer_prop, "Custom_Horizontal_Resolution", text="Horizontal")
+        row.prop(cam_object.camera_custom_resolution_settings_pointer_prop, "Custom_Vertical_Resolution", text="Vertical")
         
     def invoke(self, context, event):
-        
-        if context.object:
-            if context.object.select_get():
-                context.object.select_set(state=False)
-        cam=bpy.data.objects[self.camera]
-        cam.select_set(state=True)
-        context.view_layer.objects.active = cam
-        context.scene.camera=cam
-
-        if bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == False:
-            bpy.context.object.hide_set(False)
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-        elif bpy.context.object.hide_get(view_layer=None) == False and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_viewport = False
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_viewport = True
-        elif bpy.context.object.hide_get(view_layer=None) == True and bpy.context.object.hide_viewport == True:
-            bpy.context.object.hide_set(False)
-            bpy.context.object.hide_viewport = False
-            SetCameraCustomResolution(self, context)
-            bpy.context.object.hide_set(True)
-            bpy.context.object.hide_viewport = True
-        else:
-            SetCameraCustomResolution(self, context)
+        cam = ResolveCamera(self.camera)
+        if cam is None:
+            return{'CANCELLED'}
+        SwitchToCamera(context, cam, set_view=False)
 
         wm = context.window_manager
         return wm.invoke_popup(self)
 
+#--------------------------------------------------------------------------------------
+# C A M E R A   T H U M B N A I L S
+#--------------------------------------------------------------------------------------
+
+# Small viewport renders shown next to each camera. Draws only ask for the
+# rows they show; missing thumbnails are queued and rendered a few per timer
+# tick, written to an on-disk cache keyed by a hash of the camera's transform,
+# lens and resolution, and kept in memory as preview icons up to the budget
+# set in the preferences, the least recently drawn being released first. The
+# disk cache has a budget of its own, checked whenever a queue is done.
+class CameraThumbnails:
+    PER_TICK = 2
+    INTERVAL = 0.1
+
+    def __init__(self):
+        self.enabled = False
+        self.size = 128
+        self.capacity = 256
+        self.disk_budget = 256 * 1024 * 1024
+        self.previews = None
+        self.directory = None
+        self.icons = collections.OrderedDict()
+        self.pending = collections.OrderedDict()
+        self.keys = {}
+        self.failed = set()
+
+    def configure(self, enabled, size, budget_mb, disk_mb=256):
+        self.enabled = enabled and not bpy.app.background
+        self.size = size
+        self.capacity = max(1, budget_mb * 1024 * 1024 // (size * size * 4))
+        self.disk_budget = disk_mb * 1024 * 1024
+        if self.enabled:
+            self.evict()
+            self.prune()
+        else:
+            self.clear()
+
+    def key(self, scene, cam):
+        cam_key = camera_ids.key(cam)
+        key = self.keys.get(cam_key)
+        if key is None:
+            key = CameraFingerprint(scene, cam, (bpy.data.filepath, scene.name, self.size))
+            self.keys[cam_key] = key
+        return key
+
+    def cache_directory(self):
+        if self.directory is None:
+            self.directory = bpy.utils.user_resource('DATAFILES', path="cameras_lister_thumbnails", create=True)
+        return self.directory
+
+    def filepath(self, key):
+        return os.path.join(self.cache_directory(), key + ".png")
+
+    # Icon id of the camera's thumbnail, 0 while it is not ready
+    def icon(self, scene, cam):
+        key = self.key(scene, cam)
+        icon_id = self.icons.get(key)
+        if icon_id is not None:
+            self.icons.move_to_end(key)
+            return icon_id
+        if key in self.pending or key in self.failed:
+            return 0
+        filepath = self.filepath(key)
+        if os.path.exists(filepath):
+            # Last shown time, for pruning
+            os.utime(filepath)
+            return self.load(key, filepath)
+        self.pending[key] = camera_ids.key(cam)
+        if not bpy.app.timers.is_registered(thumbnail_timer):
+            bpy.app.timers.register(thumbnail_timer, first_interval=self.INTERVAL)
+        return 0
+
+    def load(self, key, filepath):
+        import bpy.utils.previews
+        if self.previews is None:
+            self.previews = bpy.utils.previews.new()
+        if key in self.previews:
+            del self.previews[key]
+        icon_id = self.previews.load(key, filepath, 'IMAGE').icon_id
+        self.icons[key] = icon_id
+        self.evict()
+        return icon_id
+
+    def evict(self):
+        while len(self.icons) > self.capacity:
+            key, icon_id = self.icons.popitem(last=False)
+            del self.previews[key]
+
+    # Deletes the least recently shown files until the cache fits its budget,
+    # returns how many were deleted
+    def prune(self):
+        entries = []
+        with os.scandir(self.cache_directory()) as scan:
+            for entry in scan:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for mtime, size, path in entries)
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.disk_budget:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    # A changed camera gets a new key, so its thumbnail is rendered again
+    def forget(self, cam=None):
+        if cam is None:
+            self.keys.clear()
+        else:
+            self.keys.pop(camera_ids.key(cam), None)
+
+    def clear(self):
+        self.keys.clear()
+        self.pending.clear()
+        self.icons.clear()
+        self.failed.clear()
+        if self.previews is not None:
+            import bpy.utils.previews
+            bpy.utils.previews.remove(self.previews)
+            self.previews = None
+
+camera_thumbnails = CameraThumbnails()
+
+def ThumbnailViewport(context):
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        return window, area, region
+    return None
+
+# THUMBNAIL RENDER
+# Drawn offscreen from the camera's own matrices, with the shading of the
+# viewport found by ThumbnailViewport. Nothing in the file is written, so a
+# thumbnail fires no depsgraph handler and leaves nothing behind when it
+# fails half way; the PNG is written next to its final path and moved there.
+def ThumbnailSize(cam, size):
+    settings = cam.camera_custom_resolution_settings_pointer_prop
+    width = settings.Custom_Horizontal_Resolution
+    height = settings.Custom_Vertical_Resolution
+    scale = size / float(max(width, height, 1))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def RenderThumbnail(context, viewport, scene, cam, filepath, size):
+    import gpu
+    import numpy as np
+    window, area, region = viewport
+    render = scene.render
+    width, height = ThumbnailSize(cam, size)
+    view_matrix = cam.matrix_world.inverted()
+    projection_matrix = cam.calc_matrix_camera(context.evaluated_depsgraph_get(), x=width, y=height,
+        scale_x=render.pixel_aspect_x, scale_y=render.pixel_aspect_y)
+    offscreen = gpu.types.GPUOffScreen(width, height)
+    try:
+        with offscreen.bind():
+            args = (scene, window.view_layer, area.spaces.active, region, view_matrix, projection_matrix)
+            try:
+                offscreen.draw_view3d(*args, do_color_management=True)
+            except TypeError:
+                # Before Blender 2.91
+                offscreen.draw_view3d(*args)
+            if hasattr(gpu, "state"):
+                buffer = gpu.state.active_framebuffer_get().read_color(0, 0, width, height, 4, 0, 'UBYTE')
+            else:
+                import bgl
+                buffer = bgl.Buffer(bgl.GL_BYTE, width * height * 4)
+                bgl.glReadPixels(0, 0, width, height, bgl.GL_RGBA, bgl.GL_UNSIGNED_BYTE, buffer)
+    finally:
+        offscreen.free()
+    # Signed with bgl; rows come bottom first
+    pixels = np.array(buffer.to_list(), dtype=np.int16).astype(np.uint8).reshape(height, width * 4)[::-1]
+    temp = filepath + ".tmp"
+    WritePNG(temp, width, height, pixels.tobytes())
+    os.replace(temp, filepath)
+
+# 8 bit RGBA, rows top first
+def WritePNG(filepath, width, height, rgba):
+    stride = width * 4
+    raw = b"".join(b"\x00" + rgba[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+    with open(filepath, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw)))
+        f.write(chunk(b"IEND", b""))
+
+def thumbnail_timer():
+    thumbnails = camera_thumbnails
+    if not thumbnails.enabled or not thumbnails.pending:
+        return None
+    context = bpy.context
+    viewport = ThumbnailViewport(context)
+    if context.scene is None or viewport is None:
+        return 1.0
+    scene = context.scene
+    objects = camera_index.ensure(scene).objects
+    for i in range(min(thumbnails.PER_TICK, len(thumbnails.pending))):
+        key, cam_key = thumbnails.pending.popitem(last=False)
+        cam = objects.get(cam_key)
+        # Skip requests for deleted cameras and cameras changed since
+        if cam is None or thumbnails.keys.get(cam_key) != key:
+            continue
+        filepath = thumbnails.filepath(key)
+        if not os.path.exists(filepath):
+            try:
+                RenderThumbnail(context, viewport, scene, cam, filepath, thumbnails.size)
+            except (RuntimeError, TypeError, OSError):
+                thumbnails.failed.add(key)
+                continue
+        thumbnails.load(key, filepath)
+    viewport[1].tag_redraw()
+    if thumbnails.pending:
+        return thumbnails.INTERVAL
+    thumbnails.prune()
+    return None
+
+@persistent
+def thumbnail_depsgraph_update_post(scene, depsgraph=None):
+    if not camera_thumbnails.keys:
+        return
+    if depsgraph is None:
+        camera_thumbnails.forget()
+        return
+    for update in depsgraph.updates:
+        id = update.id
+        if isinstance(id, bpy.types.Camera):
+            camera_thumbnails.forget()
+            return
+        if isinstance(id, bpy.types.Object) and id.type == 'CAMERA':
+            camera_thumbnails.forget(getattr(id, "original", id))
+
+@persistent
+def thumbnail_reset(*args):
+    camera_thumbnails.forget()
+    camera_thumbnails.pending.clear()
+
+thumbnail_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, thumbnail_depsgraph_update_post),
+    (bpy.app.handlers.load_post, thumbnail_reset),
+    (bpy.app.handlers.undo_post, thumbnail_reset),
+    (bpy.app.handlers.redo_post, thumbnail_reset),
+)
+
+# REFRESH THUMBNAILS
+class RefreshCameraThumbnails(bpy.types.Operator):
+    bl_idname = 'cameras.thumbnails_refresh'
+    bl_label = 'Refresh Thumbnails'
+    bl_description = "Render the thumbnails of the scene's cameras again, e.g. after editing the scene around them"
+
+    def execute(self,context):
+        thumbnails = camera_thumbnails
+        for cam in camera_index.ensure(context.scene).objects.values():
+            filepath = thumbnails.filepath(thumbnails.key(context.scene, cam))
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        thumbnails.clear()
+        return{'FINISHED'}
+
 #--------------------------------------------------------------------------------------
 # C A M E R A S   L I S T E R   P A N E L
 #--------------------------------------------------------------------------------------
 
+# CAMERA ROW
+THUMBNAIL_SCALE = 2.0
+
+def camera_thumbnail(scene, cam_object):
+    return camera_thumbnails.icon(scene, cam_object) if camera_thumbnails.enabled else None
+
+def camera_row_state(context, markers):
+    in_camera_view = context.area.spaces[0].region_3d.view_perspective == 'CAMERA'
+    view_camera = context.space_data.camera
+    object_is_camera = context.object is not None and context.object.type == 'CAMERA'
+    bound_camera = markers.bound_camera(context.scene.frame_current)
+    return (in_camera_view, view_camera, object_is_camera, bound_camera)
+
+def draw_camera_row(layout, cam, cam_object, in_camera_view, view_camera, object_is_camera, bound_camera, thumbnail=None):
+    is_view_camera = view_camera == cam_object
+    key = camera_ids.key(cam_object) if cam_object is not None else cam
+    row = layout.row(align=True)
+    if thumbnail:
+        row.template_icon(icon_value=thumbnail, scale=THUMBNAIL_SCALE)
+    elif thumbnail is not None:
+        row.label(text="", icon="OUTLINER_OB_CAMERA")
+    row.operator("cameras.pick", text="", emboss=False,
+        icon="RADIOBUT_ON" if key in lister_selection.keys else "RADIOBUT_OFF").camera=key
+    row.operator("cameras.select", text="", icon="RESTRICT_SELECT_OFF").camera=key
+    row.operator("cameras.camera_view_off"
+        if in_camera_view and is_view_camera else "cameras.set_view",
+        text=cam, icon="CHECKBOX_HLT"
+        if is_view_camera and object_is_camera and in_camera_view
+        else "CHECKBOX_DEHLT").camera=key
+    is_bound = bound_camera == cam_object
+    row.operator("cameras.delete_camera_marker"
+        if is_bound else "cameras.bind_to_marker",
+        text="", icon="MARKER_HLT" if is_bound else "MARKER").camera=key
+    row.operator("cameras.delete", text="", icon="PANEL_CLOSE").camera=key
+    row.separator()
+    row.operator("camera.settings", text="", icon="TRIA_RIGHT").camera=key
+
+# BULK OPERATIONS
+def draw_bulk_operations(layout, context):
+    row = layout.row(align=True)
+    row.operator("cameras.pick_all", text="All").action="ALL"
+    row.operator("cameras.pick_all", text="None").action="NONE"
+    row.operator("cameras.pick_all", text="Invert").action="INVERT"
+    row.operator("cameras.pick_all", text="", icon="RESTRICT_SELECT_OFF").action="VIEWPORT"
+    row.operator("cameras.bulk_edit", text="", icon="MODIFIER")
+    row.operator("cameras.sequence_markers", text="", icon="SEQUENCE")
+    count = len(lister_selection.keys)
+    if not count:
+        return
+    row = layout.row(align=True)
+    row.label(text="%d picked" % count)
+    row.operator("cameras.bulk_bind_to_marker", text="", icon="MARKER_HLT")
+    row.operator("cameras.bulk_unbind", text="", icon="MARKER")
+    row.operator("cameras.bulk_custom_resolution", text="", icon="FULLSCREEN_ENTER")
+    row.operator("cameras.bulk_delete", text="", icon="PANEL_CLOSE")
+
+# CAMERA CATALOG
+def draw_camera_catalog(layout, context):
+    groups = camera_catalog.ensure(context).groups(context.window_manager.cameras_lister_search)
+    if not groups:
+        layout.label(text="No camera matches the search", icon="INFO")
+    for scene_name, rows in groups:
+        scene = bpy.data.scenes.get(scene_name) if scene_name else context.scene
+        if scene_name:
+            layout.label(text=scene_name, icon="SCENE_DATA" if scene == context.scene else "SCENE")
+        else:
+            layout.label(text="Linked, not in a scene", icon="LINK_BLEND")
+        scene_camera = scene.camera if scene is not None else None
+        for row_data in rows:
+            is_camera = (scene_camera is not None and scene_camera.name == row_data.name
+                and (scene_camera.library.filepath if scene_camera.library else None) == row_data.library)
+            op = layout.operator("cameras.catalog_view", text=row_data.name, depress=is_camera,
+                icon="LINKED" if row_data.library else "OUTLINER_OB_CAMERA")
+            op.scene = row_data.scene
+            op.camera = row_data.name
+            op.library = row_data.library or ""
+
 # CAMERAS LISTER PANEL
+@profiled("common_draw")
 def common_draw(self,layout,context):
-    def coll_rec(coll, clist):
-        if coll.children:
-            for child in coll.children:
-                coll_rec(child, clist)
-        cams=[cam.name for cam in coll.objects if cam.type=='CAMERA']
-        if cams:
-            cams.sort(key=str.lower)
-            clist.append((coll.name, cams))
-
-    tm = bpy.context.scene.timeline_markers
-    cur_frame = context.scene.frame_current
-    frame_markers = [marker for marker in tm if marker.frame == cur_frame]
+    index = get_camera_index(context)
+    markers = get_marker_index(context)
 
     box = layout
     row = box.row(align=False)
@@ -389,6 +2519,9 @@ def common_draw(self,layout,context):
     row.operator("render.render", text="", icon="RENDER_STILL")
     row.operator("render.render", text="", icon="RENDER_ANIMATION").animation=True
     row.operator("render.view_show", text="", icon="IMAGE_DATA")
+    row.operator("cameras.batch_render", text="", icon="RENDERLAYERS")
+    row.operator("cameras.export", text="", icon="EXPORT")
+    row.operator("cameras.import", text="", icon="IMPORT")
     if ((context.area.spaces[0].region_3d.view_perspective == 'PERSP' or context.area.spaces[0].region_3d.view_perspective == 'ORTHO')
     and context.area.spaces.active.use_render_border == False):
         row.operator("view3d.render_border", text="", icon="BORDERMOVE")
@@ -396,81 +2529,79 @@ def common_draw(self,layout,context):
     and context.area.spaces.active.use_render_border == True):
         row.alert = True
         row.operator("view3d.clear_render_border", text="", icon="BORDERMOVE")
-    if context.area.spaces[0].region_3d.view_perspective == 'CAMERA' and bpy.data.scenes["Scene"].render.use_border == False:
+    if context.area.spaces[0].region_3d.view_perspective == 'CAMERA' and context.scene.render.use_border == False:
         row.operator("view3d.render_border", text="", icon="BORDERMOVE")
-    if context.area.spaces[0].region_3d.view_perspective == 'CAMERA' and bpy.data.scenes["Scene"].render.use_border == True:
+    if context.area.spaces[0].region_3d.view_perspective == 'CAMERA' and context.scene.render.use_border == True:
         row.alert = True
         row.operator("view3d.clear_render_border", text="", icon="BORDERMOVE")
     row.prop(context.scene, "set_render_engine", text=" ", expand=True)
+    row.prop(context.scene, "cameras_lister_marker_resolution", text="", icon="MARKER_HLT")
     box.separator()
     row = box.row(align=False)
     row.scale_y = 1.2
     row.operator("cameras.new_from_view", text="Add Camera to View", icon="ADD")
     row.operator("cameras.align_selected_to_view", text="Align Selected to View", icon="CON_CAMERASOLVER")
+    row = box.row(align=True)
+    row.operator("cameras.view_nearest", text="Nearest Camera", icon="VIEW_CAMERA")
+    row.operator("cameras.step", text="", icon="TRIA_LEFT").direction="LEFT"
+    row.operator("cameras.step", text="", icon="TRIA_UP").direction="FORWARD"
+    row.operator("cameras.step", text="", icon="TRIA_DOWN").direction="BACK"
+    row.operator("cameras.step", text="", icon="TRIA_RIGHT").direction="RIGHT"
     box.separator()
     boxframe = box.box()
     row = boxframe.row(align=True)
     row.prop(context.scene, "sort_cameras", text=" ", expand=True)
+    row.prop(context.window_manager, "cameras_lister_list_view", text="", icon="PRESET")
+    row.prop(context.window_manager, "cameras_lister_catalog", text="", icon="SCENE_DATA")
+    row = boxframe.row(align=True)
+    row.prop(context.window_manager, "cameras_lister_search", text="", icon="VIEWZOOM")
+    row.operator("cameras.seeing_selection", text="", icon="HIDE_OFF")
+    if camera_visibility.names is not None:
+        row = boxframe.row(align=True)
+        row.label(text="%d cameras see %s" % (len(camera_visibility.names),
+            camera_visibility.targets[0] if len(camera_visibility.targets) == 1
+            else "%d objects" % len(camera_visibility.targets)), icon="HIDE_OFF")
+        row.operator("cameras.seeing_selection", text="", icon="X").clear=True
+    draw_bulk_operations(boxframe, context)
     boxframe = box.box()
     boxframecolumn = boxframe.column()
+
+    if context.window_manager.cameras_lister_catalog:
+        draw_camera_catalog(boxframecolumn, context)
+        return
+
+    if context.window_manager.cameras_lister_list_view:
+        draw_camera_browser(boxframecolumn, context)
+        return
+
+    if not index.rows:
+        row = boxframecolumn.row(align=True)
+        row.alignment = "CENTER"
+        row.alert = True
+        row.label(text="No cameras in this scene", icon= "ERROR")
+        return
+
+    row_state = camera_row_state(context, markers)
+    search = context.window_manager.cameras_lister_search
+
     sort_option = context.scene.sort_cameras
     if sort_option == sorting_cameras_options[0][0]:
-        cam_list=[cam.name for cam in context.scene.collection.all_objects if cam.type=='CAMERA']
-        cam_list.sort(key=str.lower)
-        if not cam_list:
-            row = boxframecolumn.row(align=True)
-            row.alignment = "CENTER"
-            row.alert = True
-            row.label(text="No cameras in this scene", icon= "ERROR")
-        else:
-            for cam in cam_list:
-                row = boxframecolumn.row(align=True)
-                row.operator("cameras.select", text="", icon="RESTRICT_SELECT_OFF").camera=cam
-                row.operator("cameras.camera_view_off"
-                    if context.area.spaces[0].region_3d.view_perspective == 'CAMERA'
-                    and bpy.context.space_data.camera is bpy.context.scene.objects[cam] else "cameras.set_view",
-                    text=cam, icon="CHECKBOX_HLT"
-                    if bpy.context.space_data.camera is bpy.context.scene.objects[cam]
-                    and context.object.type == 'CAMERA'
-                    and context.area.spaces[0].region_3d.view_perspective == 'CAMERA'
-                    else "CHECKBOX_DEHLT").camera=cam
-                row.operator("cameras.delete_camera_marker"
-                    if len(frame_markers) >= 1 and frame_markers[0].name == cam else "cameras.bind_to_marker",
-                    text="", icon="MARKER_HLT" if len(frame_markers) >= 1 and frame_markers[0].name == cam else "MARKER").camera=cam
-                row.operator("cameras.delete", text="", icon="PANEL_CLOSE").camera=cam
-                row.separator()
-                row.operator("camera.settings", text="", icon="TRIA_RIGHT").camera=cam
-                
+        rows = index.filter_rows(context.scene, search)
+        if not rows:
+            boxframecolumn.label(text="No camera matches the search", icon="INFO")
+        for row_data in rows:
+            draw_camera_row(boxframecolumn, row_data.name, row_data.object, *row_state,
+                thumbnail=camera_thumbnail(context.scene, row_data.object))
+
     elif sort_option == sorting_cameras_options[1][0]:
-        collcamlist=[]
-        master_coll = context.scene.collection
-        coll_rec(master_coll, collcamlist)
-        collcamlist.sort()
-        if not collcamlist:
-            row = boxframecolumn.row(align=True)
-            row.alignment = "CENTER"
-            row.alert = True
-            row.label(text="No cameras in this scene", icon= "ERROR")
-        else:
-            for coll in collcamlist:
-                boxframecolumn.label(text=coll[0])
-                for cam in coll[1]:
-                    row = boxframecolumn.row(align=True)
-                    row.operator("cameras.select", text="", icon="RESTRICT_SELECT_OFF").camera=cam
-                    row.operator("cameras.camera_view_off"
-                        if context.area.spaces[0].region_3d.view_perspective == 'CAMERA'
-                        and bpy.context.space_data.camera is bpy.context.scene.objects[cam] else "cameras.set_view",
-                        text=cam, icon="CHECKBOX_HLT"
-                        if bpy.context.space_data.camera is bpy.context.scene.objects[cam]
-                        and context.object.type == 'CAMERA'
-                        and context.area.spaces[0].region_3d.view_perspective == 'CAMERA'
-                        else "CHECKBOX_DEHLT").camera=cam
-                    row.operator("cameras.delete_camera_marker"
-                        if len(frame_markers) >= 1 and frame_markers[0].name == cam else "cameras.bind_to_marker",
-                        text="", icon="MARKER_HLT" if len(frame_markers) >= 1 and frame_markers[0].name == cam else "MARKER").camera=cam
-                    row.operator("cameras.delete", text="", icon="PANEL_CLOSE").camera=cam
-                    row.separator()
-                    row.operator("camera.settings", text="", icon="TRIA_RIGHT").camera=cam
+        groups = index.filter_rows(context.scene, search, by_collections=True)
+        if not groups:
+            boxframecolumn.label(text="No camera matches the search", icon="INFO")
+        for coll_name, rows in groups:
+            boxframecolumn.label(text=coll_name)
+            for row_data in rows:
+                draw_camera_row(boxframecolumn, row_data.name, row_data.object, *row_state,
+                    thumbnail=camera_thumbnail(context.scene, row_data.object))
 
 #--------------------------------------------------------------------------------------
 # P A N E L
@@ -481,6 +2612,7 @@ class VIEW3D_PT_FloatingPanel(Operator):
     bl_label = "Cameras Lister"
     bl_idname = "cameras.lister"
 
+    @profiled("VIEW3D_PT_FloatingPanel.draw")
     def draw(self, context):
         layout = self.layout
         box = layout.column(align=True)
@@ -496,57 +2628,1282 @@ class VIEW3D_PT_FloatingPanel(Operator):
         self.report({'INFO'}, self.my_enum)
         return {'FINISHED'}
 
+#--------------------------------------------------------------------------------------
+# C A M E R A S   B R O W S E R
+#--------------------------------------------------------------------------------------
+
+# BROWSER ITEM
+class Cameras_Lister_Item(PropertyGroup):
+    camera: bpy.props.PointerProperty(type=Object)
+
+# BROWSER SYNC
+# The UIList reads window_manager.cameras_lister_items, which mirrors the
+# camera index. Draw callbacks may not write ID data, so the mirror is
+# refreshed from a one-shot timer whenever the index changes.
+class BrowserState:
+    def __init__(self):
+        self.in_use = False
+        self.clear()
+
+    def clear(self):
+        self.key = None
+        self.version = 0
+        self.positions = {}
+        self.filter_cache = {}
+
+browser_state = BrowserState()
+
+def browser_is_stale(context):
+    index = get_camera_index(context)
+    return browser_state.key != (index.scene_key, index.version)
+
+def sync_camera_browser():
+    context = bpy.context
+    if context.scene is None:
+        return None
+    index = get_camera_index(context)
+    key = (index.scene_key, index.version)
+    if browser_state.key == key:
+        return None
+
+    items = context.window_manager.cameras_lister_items
+    items.clear()
+    for row_data in index.rows:
+        item = items.add()
+        item.name = row_data.name
+        item.camera = row_data.object
+
+    # Visual position of every item in each sort mode, item order being alphabetical
+    item_index = {row_data.key: i for i, row_data in enumerate(index.rows)}
+    by_collections = []
+    seen = set()
+    for coll_name, rows in index.groups(context.scene):
+        for row_data in rows:
+            if row_data.key not in seen:
+                seen.add(row_data.key)
+                by_collections.append(item_index[row_data.key])
+    by_collections.extend(i for i, row_data in enumerate(index.rows) if row_data.key not in seen)
+    positions = [0] * len(by_collections)
+    for position, i in enumerate(by_collections):
+        positions[i] = position
+
+    browser_state.key = key
+    browser_state.version += 1
+    browser_state.positions = {
+        sorting_cameras_options[0][0]: [],
+        sorting_cameras_options[1][0]: positions,
+    }
+    browser_state.filter_cache = {}
+    context.window_manager.cameras_lister_active_index = min(
+        context.window_manager.cameras_lister_active_index, max(len(items) - 1, 0))
+
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+def schedule_browser_sync():
+    if browser_state.in_use and not bpy.app.timers.is_registered(sync_camera_browser):
+        bpy.app.timers.register(sync_camera_browser, first_interval=0.0)
+
+# BROWSER LIST
+class CAMERAS_UL_browser(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row_state = camera_row_state(context, get_marker_index(context))
+        thumbnail = camera_thumbnail(context.scene, item.camera) if item.camera is not None else None
+        draw_camera_row(layout, item.name, item.camera, *row_state, thumbnail=thumbnail)
+
+    def filter_items(self, context, data, propname):
+        # Only the visible rows are drawn; flags and ordering are cached per
+        # sync, sort mode and filter so the per-draw cost does not grow with
+        # the number of cameras
+        sort_option = context.scene.sort_cameras
+        search = context.window_manager.cameras_lister_search
+        key = (browser_state.version, sort_option, search, self.filter_name, camera_visibility.version)
+        cached = browser_state.filter_cache.get(key)
+        if cached is None:
+            items = getattr(data, propname)
+            matches = ListerMatches(search)
+            name_matches = camera_search.search(self.filter_name)
+            if matches is None or name_matches is None:
+                matches = matches if name_matches is None else name_matches
+            else:
+                matches = matches & name_matches
+            if matches is not None:
+                flags = [self.bitflag_filter_item if item.name in matches else 0 for item in items]
+            else:
+                flags = []
+            cached = (flags, browser_state.positions.get(sort_option, []))
+            browser_state.filter_cache[key] = cached
+        return cached
+
+# BROWSER PAGE
+class CameraBrowserPage(bpy.types.Operator):
+    bl_idname = 'cameras.browser_page'
+    bl_label = 'Page Cameras'
+    bl_description = "Scroll the camera list by one page"
+
+    direction: bpy.props.EnumProperty(
+        items=[("PREVIOUS", "Previous", ""), ("NEXT", "Next", "")],
+        default="NEXT")
+
+    def execute(self,context):
+        wm = context.window_manager
+        count = len(wm.cameras_lister_items)
+        if count == 0:
+            return{'CANCELLED'}
+        positions = browser_state.positions.get(context.scene.sort_cameras) or list(range(count))
+        order = [0] * count
+        for i, position in enumerate(positions):
+            order[position] = i
+        step = wm.cameras_lister_page_size if self.direction == "NEXT" else -wm.cameras_lister_page_size
+        position = positions[min(wm.cameras_lister_active_index, count - 1)] + step
+        wm.cameras_lister_active_index = order[max(0, min(position, count - 1))]
+
+        return{'FINISHED'}
+
+# DRAW CAMERA BROWSER
+def draw_camera_browser(layout, context):
+    wm = context.window_manager
+    browser_state.in_use = True
+    if browser_is_stale(context):
+        schedule_browser_sync()
+    layout.template_list("CAMERAS_UL_browser", "", wm, "cameras_lister_items",
+        wm, "cameras_lister_active_index", rows=wm.cameras_lister_page_size)
+    row = layout.row(align=True)
+    row.operator("cameras.browser_page", text="", icon="TRIA_UP").direction="PREVIOUS"
+    row.operator("cameras.browser_page", text="", icon="TRIA_DOWN").direction="NEXT"
+    row.prop(wm, "cameras_lister_page_size", text="Rows")
+
+# SIDEBAR PANEL
+class VIEW3D_PT_CamerasBrowser(Panel):
+    bl_label = "Cameras Lister"
+    bl_idname = "VIEW3D_PT_cameras_browser"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Cameras"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.scene, "sort_cameras", text=" ", expand=True)
+        layout.prop(context.window_manager, "cameras_lister_search", text="", icon="VIEWZOOM")
+        draw_bulk_operations(layout, context)
+        draw_camera_browser(layout, context)
+
+#--------------------------------------------------------------------------------------
+# B A T C H   R E N D E R
+#--------------------------------------------------------------------------------------
+
+# LISTED CAMERAS
+# Same cameras, in the same order, as common_draw shows for a sort mode and search
+def ListedCameraRows(scene, sort_option=None, search=""):
+    index = camera_index.ensure(scene)
+    sort_option = sort_option or scene.sort_cameras
+    if sort_option == sorting_cameras_options[1][0]:
+        listed = []
+        seen = set()
+        for coll_name, rows in index.filter_rows(scene, search, by_collections=True):
+            for row_data in rows:
+                if row_data.key not in seen:
+                    seen.add(row_data.key)
+                    listed.append(row_data)
+        return listed
+    return list(index.filter_rows(scene, search))
+
+# OUTPUT PATH
+# Templates may use {camera}, {scene}, {blend} and {index}, e.g. //renders/{scene}/{camera}
+def ExpandOutputPath(template, scene, cam_name, index=0):
+    blend = os.path.splitext(os.path.basename(bpy.data.filepath))[0] or "untitled"
+    return template.format(
+        camera=bpy.path.clean_name(cam_name),
+        scene=bpy.path.clean_name(scene.name),
+        blend=blend,
+        index=index)
+
+# RENDER CAMERA
+# Blender switches to the camera bound to the current frame's marker when a
+# render starts; the bindings are detached while rendering a given camera
+class DetachedMarkerCameras:
+    def __init__(self, scene):
+        self.scene = scene
+        self.bound = []
+
+    def __enter__(self):
+        self.bound = [(marker, marker.camera) for marker in self.scene.timeline_markers
+            if marker.camera is not None]
+        for marker, cam in self.bound:
+            marker.camera = None
+        return self
+
+    def __exit__(self, *exc):
+        for marker, cam in self.bound:
+            marker.camera = cam
+        self.bound = []
+        return False
+
+def RenderCamera(scene, cam, output_template, index=0):
+    render = scene.render
+    previous = (scene.camera, render.filepath, render.resolution_x, render.resolution_y)
+    scene.camera = cam
+    ApplyCameraCustomResolution(scene, cam)
+    render.filepath = ExpandOutputPath(output_template, scene, cam.name, index)
+    try:
+        with DetachedMarkerCameras(scene):
+            bpy.ops.render.render(write_still=True, scene=scene.name)
+        return RenderedFilePath(scene, render.filepath)
+    finally:
+        scene.camera, render.filepath, render.resolution_x, render.resolution_y = previous
+
+# Workers may load a temporary copy of the file, which would resolve // next
+# to the copy; templates are made absolute against the open file first. An
+# unsaved file has no directory to resolve // against.
+def AbsoluteOutputTemplate(template):
+    if template.startswith("//") and not bpy.data.filepath:
+        return None
+    return os.path.abspath(bpy.path.abspath(template))
+
+# Absolute path of the still Blender writes for a render filepath
+def RenderedFilePath(scene, filepath):
+    render = scene.render
+    path = bpy.path.abspath(filepath)
+    if render.use_file_extension and not path.lower().endswith(render.file_extension.lower()):
+        path += render.file_extension
+    return path
+
+# RENDER CACHE
+# Incremental batch renders skip the cameras whose fingerprint matches the one
+# recorded in the manifest next to the renders. The fingerprint covers the
+# camera transform, lens and custom resolution plus a hash of the rest of the
+# scene. That hash is kept cheap: objects count through their transform,
+# bounds, mesh size, light settings and material names, so edits inside a
+# material node tree or a texture need a full (non incremental) render.
+LIGHT_FINGERPRINT_KEYS = ("type", "energy", "color", "shadow_soft_size", "spot_size", "spot_blend")
+RENDER_FINGERPRINT_KEYS = ("engine", "resolution_percentage", "pixel_aspect_x", "pixel_aspect_y",
+    "film_transparent", "use_border", "border_min_x", "border_min_y", "border_max_x", "border_max_y")
+
+def FingerprintValue(value):
+    if isinstance(value, float):
+        return round(value, 6)
+    if value is None or isinstance(value, (str, int)):
+        return value
+    try:
+        return tuple(FingerprintValue(item) for item in value)
+    except TypeError:
+        return str(value)
+
+def FingerprintValues(data, keys):
+    return tuple(FingerprintValue(getattr(data, key, None)) for key in keys)
+
+def SceneChangeHash(scene, depsgraph):
+    render = scene.render
+    image_settings = getattr(render, "image_settings", None)
+    digest = hashlib.sha1(repr((
+        scene.frame_current,
+        scene.world.name if scene.world else None,
+        FingerprintValues(render, RENDER_FINGERPRINT_KEYS),
+        FingerprintValues(image_settings, ("file_format", "color_mode", "color_depth", "quality")),
+        FingerprintValue(getattr(getattr(scene, "cycles", None), "samples", None)),
+        FingerprintValue(getattr(getattr(scene, "eevee", None), "taa_render_samples", None)),
+        )).encode())
+    entries = []
+    for ob in depsgraph.objects:
+        # Cameras only matter through their own fingerprint
+        if ob.type == 'CAMERA':
+            continue
+        data = ob.data
+        entries.append(repr((
+            ob.name, ob.type, ob.hide_render,
+            FingerprintValue(ob.matrix_world),
+            FingerprintValue(ob.bound_box),
+            data.name if data is not None else None,
+            len(data.vertices) if ob.type == 'MESH' else None,
+            len(data.polygons) if ob.type == 'MESH' else None,
+            FingerprintValues(data, LIGHT_FINGERPRINT_KEYS) if ob.type == 'LIGHT' else None,
+            tuple(slot.material.name if slot.material else None for slot in getattr(ob, "material_slots", ())),
+            )))
+    for entry in sorted(entries):
+        digest.update(entry.encode())
+    return digest.hexdigest()
+
+def CameraFingerprint(scene, cam, scene_hash):
+    data = cam.data
+    settings = cam.camera_custom_resolution_settings_pointer_prop
+    panorama = CameraPanoramaSettings(data)
+    return hashlib.sha1(repr((
+        FingerprintValue(cam.matrix_world),
+        FingerprintValues(data, CAMERA_STRING_KEYS + CAMERA_FLOAT_KEYS),
+        FingerprintValues(panorama, PANORAMA_STRING_KEYS + PANORAMA_FLOAT_KEYS),
+        settings.Custom_Horizontal_Resolution,
+        settings.Custom_Vertical_Resolution,
+        scene_hash,
+        )).encode()).hexdigest()
+
+# Fingerprint, output and render time of each camera, stored as JSON in the
+# directory the renders share
+class RenderManifest:
+    FILENAME = "cameras_lister_manifest.json"
+
+    def __init__(self, directory):
+        self.filepath = os.path.join(directory, self.FILENAME)
+        self.cameras = {}
+        try:
+            with open(self.filepath) as f:
+                self.cameras = json.load(f).get("cameras", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def is_current(self, name, fingerprint, output):
+        entry = self.cameras.get(name)
+        return (entry is not None and entry.get("fingerprint") == fingerprint
+            and entry.get("output") == output and os.path.exists(output))
+
+    def update(self, name, fingerprint, output):
+        self.cameras[name] = {"fingerprint": fingerprint, "output": output, "rendered": time.time()}
+
+    def save(self):
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp = self.filepath + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"version": 1, "cameras": self.cameras}, f, indent=1, sort_keys=True)
+        os.replace(temp, self.filepath)
+
+# Fingerprints every camera of a batch up front; cameras keep their position
+# in the full list as {index}, so output paths do not move between runs.
+# Cameras are given by identifier, or by name from the command line.
+class RenderCache:
+    def __init__(self, scene, depsgraph, cameras, output_template):
+        scene_hash = SceneChangeHash(scene, depsgraph)
+        self.entries = {}
+        self.names = {}
+        for index, key in enumerate(cameras):
+            cam = ResolveCamera(key) or bpy.data.objects[key]
+            output = RenderedFilePath(scene, ExpandOutputPath(output_template, scene, cam.name, index))
+            self.entries[key] = (index, CameraFingerprint(scene, cam, scene_hash), output)
+            self.names[key] = cam.name
+        directories = {os.path.dirname(output) for index, fingerprint, output in self.entries.values()}
+        try:
+            directory = os.path.commonpath(list(directories)) if directories else ""
+        except ValueError:
+            # Outputs on different drives
+            directory = sorted(directories)[0]
+        self.manifest = RenderManifest(directory)
+        self.reused = []
+
+    def stale(self, incremental=True):
+        cameras = []
+        self.reused = []
+        for name, (index, fingerprint, output) in self.entries.items():
+            if incremental and self.manifest.is_current(name, fingerprint, output):
+                self.reused.append(name)
+            else:
+                cameras.append((index, name))
+        return cameras
+
+    def rendered(self, name):
+        index, fingerprint, output = self.entries[name]
+        self.manifest.update(name, fingerprint, output)
+
+# BATCH RENDER JOB
+# Distributes (index, camera identifier) pairs over background Blender processes.
+# Each worker is fed one camera at a time on stdin, so fast and slow cameras
+# balance out, and answers with one prefixed JSON line per camera on stdout.
+class BatchRenderJob:
+    PREFIX = "CAMERAS_LISTER "
+
+    def __init__(self, blend_path, cameras, output_template, workers=1, threads=0, scene=None):
+        self.blend_path = blend_path
+        self.pending = collections.deque(cameras)
+        self.total = len(cameras)
+        self.output_template = output_template
+        self.worker_count = max(1, min(workers, len(cameras) or 1))
+        self.threads = threads
+        self.scene = scene
+        self.events = queue.Queue()
+        self.processes = []
+        self.busy = {}
+        self.done = []
+        self.failed = []
+
+    def worker_command(self):
+        command = [bpy.app.binary_path, "-b", self.blend_path]
+        if self.threads:
+            command += ["-t", str(self.threads)]
+        command += ["--python", os.path.abspath(__file__), "--", "render-worker",
+            "--output", self.output_template]
+        if self.scene:
+            command += ["--scene", self.scene]
+        return command
+
+    def start(self):
+        for worker in range(self.worker_count):
+            process = subprocess.Popen(self.worker_command(), stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, bufsize=1)
+            self.processes.append(process)
+            threading.Thread(target=self._read, args=(worker, process), daemon=True).start()
+            self._feed(worker)
+
+    def _read(self, worker, process):
+        for line in process.stdout:
+            if line.startswith(self.PREFIX):
+                event = json.loads(line[len(self.PREFIX):])
+                event["worker"] = worker
+                self.events.put(event)
+        self.events.put({"event": "exit", "worker": worker, "returncode": process.wait()})
+
+    def _feed(self, worker):
+        process = self.processes[worker]
+        if process.stdin.closed:
+            return
+        try:
+            if self.pending:
+                index, name = self.pending.popleft()
+                self.busy[worker] = name
+                process.stdin.write("%d\t%s\n" % (index, name))
+                process.stdin.flush()
+            else:
+                self.busy.pop(worker, None)
+                process.stdin.close()
+        except OSError:
+            # Worker died; its exit event reports the camera it held
+            pass
+
+    def poll(self, timeout=None):
+        events = []
+        try:
+            event = self.events.get(timeout=timeout) if timeout else self.events.get_nowait()
+            while True:
+                events.append(event)
+                self._handle(event)
+                event = self.events.get_nowait()
+        except queue.Empty:
+            pass
+        return events
+
+    def _handle(self, event):
+        worker = event["worker"]
+        if event["event"] == "done":
+            self.done.append(event)
+            self._feed(worker)
+        elif event["event"] == "error":
+            self.failed.append(event)
+            self._feed(worker)
+        elif event["event"] == "exit":
+            # A worker that dies fails the camera it was rendering; once no
+            # worker is left, the cameras still queued fail too
+            name = self.busy.pop(worker, None)
+            if name is not None:
+                self.failed.append({"event": "error", "camera": name, "worker": worker,
+                    "message": "worker exited with code %s" % event["returncode"]})
+            if all(process.poll() is not None for process in self.processes):
+                while self.pending:
+                    index, name = self.pending.popleft()
+                    self.failed.append({"event": "error", "camera": name, "worker": None,
+                        "message": "no worker left"})
+
+    @property
+    def finished(self):
+        return all(process.poll() is not None for process in self.processes) and self.events.empty()
+
+    @property
+    def progress(self):
+        return (len(self.done) + len(self.failed)) / float(self.total or 1)
+
+    def cancel(self):
+        self.pending.clear()
+        for process in self.processes:
+            if process.poll() is None:
+                process.terminate()
+
+def DefaultWorkerCount(camera_count):
+    return max(1, min(camera_count, (os.cpu_count() or 1) // 4))
+
+def EmitEvent(event):
+    sys.stdout.write(BatchRenderJob.PREFIX + json.dumps(event) + "\n")
+    sys.stdout.flush()
+
+# BATCH RENDER OPERATOR
+class BatchRenderCameras(bpy.types.Operator):
+    bl_idname = 'cameras.batch_render'
+    bl_label = 'Batch Render Cameras'
+    bl_description = "Render a still from every listed (or picked) camera with background Blender workers"
+
+    scope: bpy.props.EnumProperty(
+        name="Cameras",
+        items=[
+            ("LISTED", "Listed", "Every camera the lister shows with the current sort and search"),
+            ("PICKED", "Picked", "Only the cameras picked for bulk operations")],
+        default="LISTED")
+    output: bpy.props.StringProperty(
+        name="Output",
+        description="Output path template; {camera}, {scene}, {blend} and {index} are replaced",
+        default="//renders/{camera}",
+        subtype='FILE_PATH')
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Background Blender processes rendering in parallel (0: one per 4 cores)",
+        default=0, min=0, max=64)
+    incremental: bpy.props.BoolProperty(
+        name="Incremental",
+        description="Only render the cameras that changed since the last batch render to the same output",
+        default=False)
+
+    _job = None
+    _timer = None
+    _copy = None
+    _cache = None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self,context):
+        scene = context.scene
+        # Workers look the cameras up by identifier in the saved file
+        camera_ids.assign()
+        if self.scope == "PICKED":
+            cameras = [camera_ids.key(cam) for cam in SelectedCameras(context)]
+        else:
+            cameras = [row_data.key for row_data in
+                ListedCameraRows(scene, search=context.window_manager.cameras_lister_search)]
+        if not cameras:
+            self.report({'WARNING'}, "No cameras to render")
+            return{'CANCELLED'}
+        output = AbsoluteOutputTemplate(self.output)
+        if output is None:
+            self.report({'ERROR'}, "Save the file first or use an absolute output path")
+            return{'CANCELLED'}
+
+        self._cache = RenderCache(scene, context.evaluated_depsgraph_get(), cameras, output)
+        cameras = self._cache.stale(self.incremental)
+        if not cameras:
+            self.report({'INFO'}, "All %d cameras are up to date" % len(self._cache.reused))
+            return{'FINISHED'}
+
+        # Workers load the file from disk, so render from a copy holding the unsaved changes
+        blend_path = bpy.data.filepath
+        if not blend_path or bpy.data.is_dirty:
+            directory = os.path.dirname(blend_path) if blend_path else tempfile.gettempdir()
+            self._copy = os.path.join(directory, ".cameras_lister_batch_%d.blend" % os.getpid())
+            bpy.ops.wm.save_as_mainfile(filepath=self._copy, copy=True)
+            blend_path = self._copy
+
+        workers = self.workers or DefaultWorkerCount(len(cameras))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        self._job = BatchRenderJob(blend_path, cameras, output, workers, threads, scene.name)
+        self._job.start()
+
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, "Rendering %d cameras with %d workers, %d reused" % (
+            len(cameras), self._job.worker_count, len(self._cache.reused)))
+        return{'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC':
+            job.cancel()
+            self.finish(context)
+            self.report({'WARNING'}, "Batch render cancelled after %d cameras" % len(job.done))
+            return{'CANCELLED'}
+        if event.type != 'TIMER':
+            return{'PASS_THROUGH'}
+
+        for job_event in job.poll():
+            name = self._cache.names.get(job_event.get("camera"), job_event.get("camera"))
+            if job_event["event"] == "done":
+                self._cache.rendered(job_event["camera"])
+                self.report({'INFO'}, "Rendered %s (%d/%d)" % (name, len(job.done), job.total))
+            elif job_event["event"] == "error":
+                self.report({'ERROR'}, "%s: %s" % (name, job_event.get("message", "")))
+        context.window_manager.progress_update(int(job.progress * 100))
+        if context.area:
+            context.area.header_text_set("Batch render: %d/%d cameras" % (len(job.done) + len(job.failed), job.total))
+
+        if job.finished:
+            for job_event in job.poll():
+                if job_event["event"] == "done":
+                    self._cache.rendered(job_event["camera"])
+            self.finish(context)
+            self.report({'INFO'}, "Batch render finished: %d rendered, %d reused, %d failed" % (
+                len(job.done), len(self._cache.reused), len(job.failed)))
+            return{'FINISHED'}
+        return{'RUNNING_MODAL'}
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        if context.area:
+            context.area.header_text_set(None)
+        try:
+            self._cache.manifest.save()
+        except OSError as error:
+            self.report({'WARNING'}, "Could not write the render manifest: %s" % error)
+        if self._copy and os.path.exists(self._copy):
+            os.remove(self._copy)
+
+#--------------------------------------------------------------------------------------
+# C A M E R A   T R A N S F E R
+#--------------------------------------------------------------------------------------
+
+# CAMERA RECORDS
+# One record per camera: transform, camera settings, custom resolution and
+# the (frame, name) of every marker bound to it. Files are written and read
+# one record at a time, either as JSON lines (a header line, then one line
+# per camera) or in a compact binary layout, so exporting or importing
+# thousands of cameras never holds the whole document in memory.
+CAMERA_TRANSFER_VERSION = 1
+CAMERA_TRANSFER_FORMATS = {"JSONL": ".jsonl", "BINARY": ".cameras"}
+
+def CameraRecord(cam, markers):
+    data = cam.data
+    panorama = CameraPanoramaSettings(data)
+    settings = cam.camera_custom_resolution_settings_pointer_prop
+    record = {
+        "name": cam.name,
+        "data": data.name,
+        "matrix_world": [value for row in cam.matrix_world for value in row],
+    }
+    for key in CAMERA_STRING_KEYS + CAMERA_FLOAT_KEYS:
+        record[key] = getattr(data, key)
+    for key in PANORAMA_STRING_KEYS + PANORAMA_FLOAT_KEYS:
+        record[key] = getattr(panorama, key, None)
+    record["resolution"] = [settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution]
+    record["markers"] = sorted([marker.frame, marker.name] for marker in markers.for_camera(cam))
+    return record
+
+def ApplyCameraRecord(cam, record):
+    from mathutils import Matrix
+    matrix = record["matrix_world"]
+    cam.matrix_world = Matrix([matrix[i:i + 4] for i in range(0, 16, 4)])
+    data = cam.data
+    for key in CAMERA_STRING_KEYS + CAMERA_FLOAT_KEYS:
+        setattr(data, key, record[key])
+    panorama = CameraPanoramaSettings(data)
+    if panorama is not None:
+        for key in PANORAMA_STRING_KEYS + PANORAMA_FLOAT_KEYS:
+            value = record.get(key)
+            if value is None or value == "" or value != value:
+                continue
+            try:
+                setattr(panorama, key, value)
+            except (AttributeError, TypeError):
+                # Panorama type unknown to this Blender version
+                pass
+    settings = cam.camera_custom_resolution_settings_pointer_prop
+    settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution = record["resolution"]
+
+# BINARY LAYOUT
+# Little endian: magic and format version, then per camera the strings (a
+# uint16 byte length and UTF-8 bytes), the matrix and float settings as
+# float32, the resolution as two int32 and the markers as a uint32 count of
+# int32 frame and string name pairs. Missing panorama settings are stored as
+# an empty string or NaN.
+CAMERA_BINARY_MAGIC = b"CAMLST"
+CAMERA_BINARY_STRINGS = ("name", "data") + CAMERA_STRING_KEYS + PANORAMA_STRING_KEYS
+CAMERA_BINARY_FLOATS = struct.Struct("<16f%df" % len(CAMERA_FLOAT_KEYS + PANORAMA_FLOAT_KEYS))
+CAMERA_BINARY_RESOLUTION = struct.Struct("<2iI")
+CAMERA_BINARY_FRAME = struct.Struct("<i")
+CAMERA_BINARY_LENGTH = struct.Struct("<H")
+
+def _write_string(f, text):
+    data = (text or "").encode("utf-8")
+    f.write(CAMERA_BINARY_LENGTH.pack(len(data)))
+    f.write(data)
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated camera file")
+    return data
+
+def _read_string(f):
+    return _read_exact(f, CAMERA_BINARY_LENGTH.unpack(_read_exact(f, 2))[0]).decode("utf-8")
+
+def _write_binary_record(f, record):
+    for key in CAMERA_BINARY_STRINGS:
+        _write_string(f, record[key])
+    floats = [record[key] for key in CAMERA_FLOAT_KEYS + PANORAMA_FLOAT_KEYS]
+    f.write(CAMERA_BINARY_FLOATS.pack(*record["matrix_world"],
+        *(float("nan") if value is None else value for value in floats)))
+    f.write(CAMERA_BINARY_RESOLUTION.pack(record["resolution"][0], record["resolution"][1], len(record["markers"])))
+    for frame, name in record["markers"]:
+        f.write(CAMERA_BINARY_FRAME.pack(frame))
+        _write_string(f, name)
+
+def _read_binary_records(f):
+    version, = CAMERA_BINARY_LENGTH.unpack(_read_exact(f, 2))
+    if version > CAMERA_TRANSFER_VERSION:
+        raise ValueError("Camera file version %d is newer than this add-on" % version)
+    while True:
+        length = f.read(2)
+        if not length:
+            return
+        if len(length) != 2:
+            raise ValueError("Truncated camera file")
+        record = {"name": _read_exact(f, CAMERA_BINARY_LENGTH.unpack(length)[0]).decode("utf-8")}
+        for key in CAMERA_BINARY_STRINGS[1:]:
+            record[key] = _read_string(f)
+        values = CAMERA_BINARY_FLOATS.unpack(_read_exact(f, CAMERA_BINARY_FLOATS.size))
+        record["matrix_world"] = list(values[:16])
+        record.update(zip(CAMERA_FLOAT_KEYS + PANORAMA_FLOAT_KEYS, values[16:]))
+        resolution_x, resolution_y, marker_count = CAMERA_BINARY_RESOLUTION.unpack(
+            _read_exact(f, CAMERA_BINARY_RESOLUTION.size))
+        record["resolution"] = [resolution_x, resolution_y]
+        record["markers"] = [[CAMERA_BINARY_FRAME.unpack(_read_exact(f, 4))[0], _read_string(f)]
+            for i in range(marker_count)]
+        yield record
+
+def WriteCameraRecords(filepath, records, format="JSONL", header=None):
+    count = 0
+    if format == "BINARY":
+        with open(filepath, "wb") as f:
+            f.write(CAMERA_BINARY_MAGIC + CAMERA_BINARY_LENGTH.pack(CAMERA_TRANSFER_VERSION))
+            for record in records:
+                _write_binary_record(f, record)
+                count += 1
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(json.dumps(dict(header or {}, format="cameras_lister", version=CAMERA_TRANSFER_VERSION)) + "\n")
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+    return count
+
+# Yields the records of a file written by WriteCameraRecords, either format
+def ReadCameraRecords(filepath):
+    with open(filepath, "rb") as f:
+        if f.read(len(CAMERA_BINARY_MAGIC)) == CAMERA_BINARY_MAGIC:
+            yield from _read_binary_records(f)
+            return
+    with open(filepath, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != "cameras_lister":
+            raise ValueError("Not a Cameras Lister camera file")
+        if header.get("version", 0) > CAMERA_TRANSFER_VERSION:
+            raise ValueError("Camera file version %d is newer than this add-on" % header["version"])
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def ExportCameraRecords(scene, cams, filepath, format="JSONL"):
+    markers = marker_index.ensure(scene)
+    records = (CameraRecord(cam, markers) for cam in cams)
+    return WriteCameraRecords(filepath, records, format, {"scene": scene.name, "blend": bpy.data.filepath})
+
+# IMPORT
+# Creates or updates the cameras record by record. Marker bindings are
+# collected on the way and applied in one pass at the end: markers of
+# replaced cameras are removed in a single batch, then every binding reuses
+# the marker already at its frame or adds one.
+def ImportCameraRecords(scene, records, collection=None, existing="REPLACE", bind_markers=True):
+    collection = collection or scene.collection
+    # Records name cameras, local ones first
+    cameras = {}
+    for row_data in camera_index.ensure(scene).rows:
+        cameras.setdefault(row_data.name, row_data.object)
+    counts = {"created": 0, "updated": 0, "skipped": 0, "markers": 0}
+    replaced = []
+    bindings = []
+    try:
+        for record in records:
+            cam = cameras.get(record["name"])
+            if cam is not None and (existing == "SKIP" or cam.library is not None or cam.data.library is not None):
+                counts["skipped"] += 1
+                continue
+            if cam is not None and existing == "REPLACE":
+                replaced.append(cam)
+                counts["updated"] += 1
+            else:
+                cam = bpy.data.objects.new(record["name"], bpy.data.cameras.new(record["data"]))
+                cam.cameras_lister_id = uuid.uuid4().hex
+                collection.objects.link(cam)
+                cameras[cam.name] = cam
+                counts["created"] += 1
+            ApplyCameraRecord(cam, record)
+            if bind_markers and record["markers"]:
+                bindings.append((cam, record["markers"]))
+
+        if bind_markers:
+            markers = marker_index.ensure(scene)
+            markers.remove_many(scene, [marker for cam in replaced for marker in markers.for_camera(cam)])
+            at_frame = {frame: frame_markers[0] for frame, frame_markers in markers.ensure(scene).by_frame.items()}
+            timeline_markers = scene.timeline_markers
+            for cam, cam_markers in bindings:
+                for frame, name in cam_markers:
+                    marker = at_frame.get(frame)
+                    if marker is None:
+                        marker = timeline_markers.new(name, frame=frame)
+                        at_frame[frame] = marker
+                    else:
+                        marker.name = name
+                    marker.camera = cam
+                    counts["markers"] += 1
+    finally:
+        camera_ids.invalidate()
+        camera_index.invalidate()
+        collection_camera_map.invalidate()
+        marker_index.invalidate()
+        camera_positions.invalidate()
+        resolution_schedule.invalidate()
+    return counts
+
+# EXPORT CAMERAS
+class ExportCameras(bpy.types.Operator):
+    bl_idname = 'cameras.export'
+    bl_label = 'Export Cameras'
+    bl_description = "Write the cameras, their settings and marker bindings to a file"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.jsonl;*.cameras", options={'HIDDEN'})
+    format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ("JSONL", "JSON Lines", "One JSON object per camera, readable and easy to process"),
+            ("BINARY", "Binary", "Compact binary records, faster for thousands of cameras")],
+        default="JSONL")
+    scope: bpy.props.EnumProperty(
+        name="Cameras",
+        items=[
+            ("ALL", "All", "Every camera of the scene"),
+            ("LISTED", "Listed", "Every camera the lister shows with the current sort and search"),
+            ("PICKED", "Picked", "Only the cameras picked for bulk operations")],
+        default="ALL")
+
+    def execute(self,context):
+        scene = context.scene
+        if self.scope == "PICKED":
+            cams = SelectedCameras(context)
+        elif self.scope == "LISTED":
+            cams = [row_data.object for row_data in
+                ListedCameraRows(scene, search=context.window_manager.cameras_lister_search)]
+        else:
+            cams = [row_data.object for row_data in get_camera_index(context).rows]
+        filepath = bpy.path.abspath(self.filepath)
+        extension = CAMERA_TRANSFER_FORMATS[self.format]
+        if not filepath.lower().endswith(extension):
+            filepath += extension
+        count = ExportCameraRecords(scene, cams, filepath, self.format)
+        self.report({'INFO'}, "Exported %d cameras to %s" % (count, filepath))
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.clean_name(context.scene.name) + "_cameras" + CAMERA_TRANSFER_FORMATS[self.format]
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+# IMPORT CAMERAS
+class ImportCameras(bpy.types.Operator):
+    bl_idname = 'cameras.import'
+    bl_label = 'Import Cameras'
+    bl_description = "Create cameras and bind markers from a file written by Export Cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.jsonl;*.cameras", options={'HIDDEN'})
+    existing: bpy.props.EnumProperty(
+        name="Existing Cameras",
+        items=[
+            ("REPLACE", "Replace", "Update cameras of the same name and rebind their markers"),
+            ("NEW", "Keep Both", "Import as new cameras, renamed when the name is taken"),
+            ("SKIP", "Skip", "Leave cameras of the same name untouched")],
+        default="REPLACE")
+    markers: bpy.props.BoolProperty(
+        name="Marker Bindings",
+        description="Bind the imported cameras to markers at the frames they were bound to",
+        default=True)
+
+    def execute(self,context):
+        collection = context.collection if context.collection is not None else context.scene.collection
+        try:
+            counts = ImportCameraRecords(context.scene, ReadCameraRecords(bpy.path.abspath(self.filepath)),
+                collection, self.existing, self.markers)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, "Could not import cameras: %s" % error)
+            return{'CANCELLED'}
+        self.report({'INFO'}, "Imported cameras: %(created)d created, %(updated)d updated, "
+            "%(skipped)d skipped, %(markers)d markers bound" % counts)
+
+        return{'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
 #--------------------------------------------------------------------------------------
 # R E G I S T R Y
 #--------------------------------------------------------------------------------------
 
 classes = (
+    Cameras_Lister_Preferences,
+    ClearProfilingData,
+    ExportProfilingData,
+    RefreshCameraThumbnails,
     Camera_Custom_Resolution_Settings,
     CameraViewOff,
     AlignSelectedCameraToView,
     NewCameraFromView,
     SetCameraView,
     SelectCamera,
+    ViewNearestCamera,
+    StepCamera,
+    CatalogViewCamera,
+    ExportCameras,
+    ImportCameras,
     BindCameraToMarker,
     Delete_Camera_Marker,
     DeleteCamera,
+    PickCamera,
+    PickCameras,
+    BulkDeleteCameras,
+    BulkBindCamerasToMarkers,
+    BulkUnbindCameras,
+    SequenceCameraMarkers,
+    BulkCamerasCustomResolution,
+    BulkEditCameras,
+    CamerasSeeingSelection,
+    BatchRenderCameras,
     PanelButton_CameraSettings,
     VIEW3D_PT_FloatingPanel,
+    Cameras_Lister_Item,
+    CAMERAS_UL_browser,
+    CameraBrowserPage,
+    VIEW3D_PT_CamerasBrowser,
 )
 
+addon_keymaps = []
+
+def CameraIDProperty():
+    return bpy.props.StringProperty(
+        name="Cameras Lister ID",
+        description="Identifier the Cameras Lister uses to find this camera, kept across renames",
+        options={'HIDDEN'})
+
 def register():
     from bpy.utils import register_class
+    InstrumentOperators(classes)
     for cls in classes:
         register_class(cls)
 
+    preferences = GetPreferences(bpy.context)
+    if preferences is not None:
+        UpdateProfiler(preferences)
+        UpdateThumbnails(preferences)
+
+    for handlers, handler in index_handlers + resolution_schedule_handlers + thumbnail_handlers:
+        if handler not in handlers:
+            handlers.append(handler)
+
     Object.camera_custom_resolution_settings_pointer_prop = bpy.props.PointerProperty(type = Camera_Custom_Resolution_Settings)
+    Object.cameras_lister_id = CameraIDProperty()
 
-    wm = bpy.context.window_manager
+    WindowManager.cameras_lister_items = bpy.props.CollectionProperty(type = Cameras_Lister_Item)
+    WindowManager.cameras_lister_active_index = bpy.props.IntProperty()
+    WindowManager.cameras_lister_list_view = bpy.props.BoolProperty(
+        name="List View",
+        description="Show cameras in a scrollable list that only draws the visible rows",
+        default=False)
+    WindowManager.cameras_lister_catalog = bpy.props.BoolProperty(
+        name="All Scenes",
+        description="List the cameras of every scene and the linked cameras of the file",
+        default=False)
+    WindowManager.cameras_lister_search = bpy.props.StringProperty(
+        name="Search",
+        description="Only list cameras whose name contains this text",
+        options={'TEXTEDIT_UPDATE'})
+    WindowManager.cameras_lister_page_size = bpy.props.IntProperty(
+        name="Rows",
+        description="Number of cameras shown per page",
+        default=20, min=5, max=200)
+    schedule_browser_sync()
 
-    wm = bpy.context.window_manager
-    km = wm.keyconfigs.addon.keymaps.new(name = 'Object Mode')
-    kmi = km.keymap_items.new('cameras.lister', 'C', 'PRESS', alt=True)
-    kmi.active = True
+    # There is no addon keyconfig in background mode
+    kc = bpy.context.window_manager.keyconfigs.addon
+    if kc is not None:
+        km = kc.keymaps.new(name = 'Object Mode')
+        kmi = km.keymap_items.new('cameras.lister', 'C', 'PRESS', alt=True)
+        kmi.active = True
+        addon_keymaps.append((km, kmi))
 
 def unregister():
     from bpy.utils import unregister_class
     for cls in classes:
         unregister_class(cls)
-    
-    del Object.Pointer_Camera_Custom_Resolution_Settings
 
-    addon_keymaps = []
+    for handlers, handler in index_handlers + resolution_schedule_handlers + thumbnail_handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    resolution_schedule.clear()
+    if bpy.app.timers.is_registered(thumbnail_timer):
+        bpy.app.timers.unregister(thumbnail_timer)
+    camera_thumbnails.clear()
+    camera_ids.clear()
+    camera_index.clear()
+    camera_search.clear()
+    collection_camera_map.clear()
+    marker_index.clear()
+    camera_positions.clear()
+    camera_catalog.clear()
     
-    wm = bpy.context.window_manager
+    del Object.camera_custom_resolution_settings_pointer_prop
+    del Object.cameras_lister_id
+    del WindowManager.cameras_lister_items
+    del WindowManager.cameras_lister_active_index
+    del WindowManager.cameras_lister_list_view
+    del WindowManager.cameras_lister_catalog
+    del WindowManager.cameras_lister_page_size
+    del WindowManager.cameras_lister_search
+    if bpy.app.timers.is_registered(sync_camera_browser):
+        bpy.app.timers.unregister(sync_camera_browser)
+    browser_state.clear()
+
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
 
-    if wm.keyconfigs.addon:
-        for km in addon_keymaps:
-            for kmi in km.keymap_items:
-                km.keymap_items.remove(kmi)
+# DATA ONLY REGISTRATION (command line)
+def register_data():
+    from bpy.utils import register_class
+    if not hasattr(Object, "camera_custom_resolution_settings_pointer_prop"):
+        register_class(Camera_Custom_Resolution_Settings)
+        Object.camera_custom_resolution_settings_pointer_prop = bpy.props.PointerProperty(type = Camera_Custom_Resolution_Settings)
+    if not hasattr(Object, "cameras_lister_id"):
+        Object.cameras_lister_id = CameraIDProperty()
 
-            wm.keyconfigs.addon.keymaps.remove(km)
+#--------------------------------------------------------------------------------------
+# C O M M A N D   L I N E
+#--------------------------------------------------------------------------------------
 
-    addon_keymaps.clear()
+#   blender -b shot.blend --python Cameras_Lister.py -- render --workers 4 --output "//renders/{camera}"
+#   blender -b --python Cameras_Lister.py -- list --output cameras.jsonl shots/*.blend
+
+def cli_scene(name):
+    return bpy.data.scenes[name] if name else bpy.context.scene
+
+def cli_render(args):
+    scene = cli_scene(args.scene)
+    cameras = args.camera or [row_data.key for row_data in ListedCameraRows(scene, args.sort, args.search)]
+    if not cameras:
+        EmitEvent({"event": "finished", "done": 0, "reused": 0, "failed": 0})
+        return 0
+    output = AbsoluteOutputTemplate(args.output)
+    if output is None:
+        EmitEvent({"event": "error", "camera": None, "message": "relative output path in an unsaved file"})
+        return 1
+    cache = RenderCache(scene, bpy.context.evaluated_depsgraph_get(), cameras, output)
+    cameras = cache.stale(args.incremental)
+    EmitEvent({"event": "cache", "render": len(cameras), "reused": len(cache.reused),
+        "manifest": cache.manifest.filepath})
+    if args.in_process:
+        for index, key in cameras:
+            start = time.perf_counter()
+            rendered = RenderCamera(scene, ResolveCamera(key) or bpy.data.objects[key], output, index)
+            cache.rendered(key)
+            EmitEvent({"event": "done", "camera": key, "name": cache.names[key], "output": rendered,
+                "seconds": time.perf_counter() - start})
+        cache.manifest.save()
+        EmitEvent({"event": "finished", "done": len(cameras), "reused": len(cache.reused), "failed": 0})
+        return 0
+    if not cameras:
+        EmitEvent({"event": "finished", "done": 0, "reused": len(cache.reused), "failed": 0})
+        return 0
+
+    workers = args.workers or DefaultWorkerCount(len(cameras))
+    threads = args.threads or max(1, (os.cpu_count() or 1) // workers)
+    job = BatchRenderJob(bpy.data.filepath, cameras, output, workers, threads, scene.name)
+    job.start()
+    while not job.finished:
+        for event in job.poll(timeout=0.5):
+            cli_render_event(job, cache, event)
+    for event in job.poll():
+        cli_render_event(job, cache, event)
+    cache.manifest.save()
+    EmitEvent({"event": "finished", "done": len(job.done), "reused": len(cache.reused), "failed": len(job.failed)})
+    return 1 if job.failed else 0
+
+def cli_render_event(job, cache, event):
+    if event["event"] == "done":
+        cache.rendered(event["camera"])
+    if event["event"] in ("done", "error"):
+        EmitEvent(dict(event, progress=round(job.progress, 4)))
+
+def cli_render_worker(args):
+    scene = cli_scene(args.scene)
+    for line in sys.stdin:
+        index, key = line.rstrip("\n").split("\t", 1)
+        start = time.perf_counter()
+        try:
+            cam = ResolveCamera(key) or bpy.data.objects[key]
+            output = RenderCamera(scene, cam, args.output, int(index))
+        except Exception as error:
+            EmitEvent({"event": "error", "camera": key, "message": str(error)})
+        else:
+            EmitEvent({"event": "done", "camera": key, "name": cam.name, "output": output,
+                "seconds": time.perf_counter() - start})
+    return 0
+
+def cli_cameras(scene, args):
+    if args.camera:
+        return [ResolveCamera(name) or bpy.data.objects[name] for name in args.camera]
+    return [row_data.object for row_data in ListedCameraRows(scene, args.sort, args.search)]
+
+def cli_export(args):
+    scene = cli_scene(args.scene)
+    count = ExportCameraRecords(scene, cli_cameras(scene, args), args.output, args.format.upper())
+    EmitEvent({"event": "exported", "cameras": count, "output": os.path.abspath(args.output)})
+    return 0
+
+def cli_import(args):
+    scene = cli_scene(args.scene)
+    counts = ImportCameraRecords(scene, ReadCameraRecords(args.input), scene.collection,
+        args.existing.upper(), not args.no_markers)
+    if args.save_as or args.save:
+        bpy.ops.wm.save_as_mainfile(filepath=args.save_as or bpy.data.filepath)
+    EmitEvent(dict(counts, event="imported", input=os.path.abspath(args.input)))
+    return 0
+
+# Same rows, order and resolutions as common_draw, one JSON object per camera
+# and collection it is listed under
+def cli_list_scene(scene, args, filepath, write):
+    index = camera_index.ensure(scene)
+    markers = marker_index.ensure(scene)
+    if (args.sort or scene.sort_cameras) == sorting_cameras_options[1][0]:
+        rows = [(coll_name, row_data)
+            for coll_name, group in index.filter_rows(scene, args.search, by_collections=True)
+            for row_data in group]
+    else:
+        rows = [(None, row_data) for row_data in index.filter_rows(scene, args.search)]
+    for position, (coll_name, row_data) in enumerate(rows):
+        cam = row_data.object
+        settings = cam.camera_custom_resolution_settings_pointer_prop
+        write({
+            "event": "camera",
+            "file": filepath,
+            "scene": scene.name,
+            "camera": row_data.name,
+            "id": camera_ids.key(cam),
+            "index": position,
+            "collection": coll_name,
+            "active": scene.camera == cam,
+            "resolution": [settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution],
+            "markers": sorted([marker.frame, marker.name] for marker in markers.for_camera(cam)),
+        })
+    return len(rows)
+
+def cli_list(args):
+    if args.output:
+        stream = open(args.output, "w")
+        def write(event):
+            stream.write(json.dumps(event) + "\n")
+    else:
+        stream = None
+        write = EmitEvent
+
+    failed = 0
+    total = 0
+    filepaths = args.files or [bpy.data.filepath]
+    try:
+        for filepath in filepaths:
+            start = time.perf_counter()
+            try:
+                if filepath != bpy.data.filepath:
+                    bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False)
+                # The load_post handlers are not installed on the command line
+                index_load_post()
+                assigned = camera_ids.assign()
+                if assigned and args.save and bpy.data.filepath:
+                    bpy.ops.wm.save_mainfile()
+                if args.all_scenes:
+                    scenes = list(bpy.data.scenes)
+                else:
+                    scenes = [cli_scene(args.scene)]
+                count = sum(cli_list_scene(scene, args, filepath, write) for scene in scenes)
+            except (RuntimeError, KeyError) as error:
+                failed += 1
+                write({"event": "error", "file": filepath, "message": str(error)})
+                continue
+            total += count
+            write({"event": "file", "file": filepath, "scenes": len(scenes), "cameras": count,
+                "assigned": assigned, "seconds": time.perf_counter() - start})
+        write({"event": "finished", "files": len(filepaths) - failed, "cameras": total, "failed": failed})
+    finally:
+        if stream is not None:
+            stream.close()
+    return 1 if failed else 0
+
+def cli_parser():
+    parser = argparse.ArgumentParser(prog="blender -b file.blend --python Cameras_Lister.py --")
+    commands = parser.add_subparsers(dest="command")
+
+    render = commands.add_parser("render", help="render a still from every listed camera")
+    render.add_argument("--output", default="//renders/{camera}",
+        help="output path template; {camera}, {scene}, {blend} and {index} are replaced")
+    render.add_argument("--workers", type=int, default=0,
+        help="background Blender processes in parallel (0: one per 4 cores)")
+    render.add_argument("--in-process", action="store_true",
+        help="render in this Blender process instead of starting workers")
+    render.add_argument("--threads", type=int, default=0, help="render threads per worker")
+    render.add_argument("--scene", help="scene to render (default: the file's active scene)")
+    render.add_argument("--camera", action="append", help="camera to render, may be repeated (default: all)")
+    render.add_argument("--sort", choices=[option[0] for option in sorting_cameras_options])
+    render.add_argument("--search", default="", help="only cameras whose name contains this text")
+    render.add_argument("--incremental", action="store_true",
+        help="skip cameras whose fingerprint matches the manifest of the last render")
+    render.set_defaults(func=cli_render)
+
+    export = commands.add_parser("export", help="write the listed cameras and their marker bindings to a file")
+    export.add_argument("--output", required=True, help="file to write")
+    export.add_argument("--format", choices=["jsonl", "binary"], default="jsonl")
+    export.add_argument("--scene", help="scene to export (default: the file's active scene)")
+    export.add_argument("--camera", action="append", help="camera to export, may be repeated (default: all)")
+    export.add_argument("--sort", choices=[option[0] for option in sorting_cameras_options])
+    export.add_argument("--search", default="", help="only cameras whose name contains this text")
+    export.set_defaults(func=cli_export)
+
+    load = commands.add_parser("import", help="create cameras and marker bindings from an exported file")
+    load.add_argument("--input", required=True, help="file written by export, either format")
+    load.add_argument("--scene", help="scene to import into (default: the file's active scene)")
+    load.add_argument("--existing", choices=["replace", "new", "skip"], default="replace",
+        help="what to do with cameras of the same name")
+    load.add_argument("--no-markers", action="store_true", help="do not bind markers")
+    load.add_argument("--save", action="store_true", help="save the .blend file after importing")
+    load.add_argument("--save-as", help="save the .blend file under this path after importing")
+    load.set_defaults(func=cli_import)
+
+    listing = commands.add_parser("list", help="stream the listed cameras of one or more files as JSON lines")
+    listing.add_argument("files", nargs="*", help=".blend files to open in turn (default: the open file)")
+    listing.add_argument("--output", help="write plain JSON lines to this file instead of stdout")
+    listing.add_argument("--scene", help="scene to list (default: each file's active scene)")
+    listing.add_argument("--all-scenes", action="store_true", help="list every scene of each file")
+    listing.add_argument("--save", action="store_true",
+        help="save the files whose cameras were given new identifiers, so the ids listed stay stable")
+    listing.add_argument("--sort", choices=[option[0] for option in sorting_cameras_options],
+        help="row order (default: each scene's own setting)")
+    listing.add_argument("--search", default="", help="only cameras whose name contains this text")
+    listing.set_defaults(func=cli_list)
+
+    worker = commands.add_parser("render-worker", help=argparse.SUPPRESS)
+    worker.add_argument("--output", required=True)
+    worker.add_argument("--scene")
+    worker.set_defaults(func=cli_render_worker)
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        register()
+        return 0
+    args = cli_parser().parse_args(argv)
+    register_data()
+    # Blender itself exits with 0 after the script, pipelines need the status
+    sys.exit(args.func(args))
 
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Per-switch latency of SetCameraView: nested operators vs the data API path.
+
+Cycles through every camera of the open file with the operator chain the
+addon used to run (cameras.select, view3d.object_as_camera,
+view3d.view_center_camera and the hide/unhide dance) and with
+SwitchToCamera, then prints the mean and median time per switch.
+
+Needs a 3D viewport, so run it with the UI:
+
+    blender shot.blend --python benchmarks/bench_camera_switch.py -- --cycles 3
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Cameras_Lister
+
+
+def find_view3d(context):
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                region = next(region for region in area.regions if region.type == 'WINDOW')
+                return window, area, region
+    raise RuntimeError("No 3D viewport open")
+
+
+def override(context):
+    window, area, region = find_view3d(context)
+    kwargs = dict(window=window, area=area, region=region, space_data=area.spaces.active)
+    if hasattr(context, "temp_override"):
+        return context.temp_override(**kwargs)
+    return _LegacyOverride(context.copy(), kwargs)
+
+
+class _LegacyOverride:
+    # Blender < 3.2: operators take the override dict as first argument
+    def __init__(self, base, kwargs):
+        self.override = dict(base, **kwargs)
+
+    def __enter__(self):
+        return self.override
+
+    def __exit__(self, *exc):
+        return False
+
+
+def legacy_switch(context, cam, override_dict=None):
+    args = (override_dict,) if override_dict else ()
+    hidden = cam.hide_get()
+    hidden_viewport = cam.hide_viewport
+    if hidden:
+        cam.hide_set(False)
+    if hidden_viewport:
+        cam.hide_viewport = False
+    active = context.view_layer.objects.active
+    if active is not None and active.select_get():
+        active.select_set(state=False)
+    cam.select_set(state=True)
+    context.view_layer.objects.active = cam
+    context.scene.camera = cam
+    bpy.ops.view3d.object_as_camera(*args)
+    bpy.ops.view3d.view_center_camera(*args)
+    Cameras_Lister.ApplyCameraCustomResolution(context.scene, cam)
+    if hidden:
+        cam.hide_set(True)
+    if hidden_viewport:
+        cam.hide_viewport = True
+
+
+def time_switches(cameras, cycles, switch):
+    timings = []
+    for _ in range(cycles):
+        for cam in cameras:
+            start = time.perf_counter()
+            switch(cam)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(cycles):
+    context = bpy.context
+    if not hasattr(bpy.types.Object, "camera_custom_resolution_settings_pointer_prop"):
+        Cameras_Lister.register()
+    cameras = [ob for ob in context.scene.objects if ob.type == 'CAMERA']
+    if not cameras:
+        print("bench_camera_switch: no cameras in the scene")
+        return
+
+    with override(context) as override_dict:
+        ctx = bpy.context
+        legacy = time_switches(cameras, cycles,
+            lambda cam: legacy_switch(ctx, cam, override_dict if isinstance(override_dict, dict) else None))
+        fast_context = ctx if not isinstance(override_dict, dict) else _DictContext(ctx, override_dict)
+        fast = time_switches(cameras, cycles, lambda cam: Cameras_Lister.SwitchToCamera(fast_context, cam))
+
+    for label, timings in (("operators", legacy), ("data api", fast)):
+        print("bench_camera_switch: %-9s %d switches, mean %.3f ms, median %.3f ms" % (
+            label, len(timings), statistics.mean(timings) * 1000.0, statistics.median(timings) * 1000.0))
+    print("bench_camera_switch: speedup x%.1f" % (statistics.mean(legacy) / statistics.mean(fast)))
+
+
+class _DictContext:
+    # Attribute view over a legacy override dict, falling back to bpy.context
+    def __init__(self, context, override_dict):
+        self._context = context
+        self._override = override_dict
+
+    def __getattr__(self, name):
+        if name in self._override:
+            return self._override[name]
+        return getattr(self._context, name)
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    cycles = int(argv[argv.index("--cycles") + 1]) if "--cycles" in argv else 3
+
+    def deferred():
+        run(cycles)
+        return None
+
+    # Give the window manager a moment to open the viewport before timing
+    bpy.app.timers.register(deferred, first_interval=0.5)
+
+
+if __name__ == "__main__":
+    main()
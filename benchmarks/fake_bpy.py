@@ -0,0 +1,861 @@
+"""Lightweight stand-in for the ``bpy`` module.
+
+Only the parts of the Blender Python API used by Cameras_Lister.py are
+modelled, closely enough to run ``common_draw`` and the ``cameras.*``
+operators headless and time their Python-side cost. Call ``install()``
+before importing the addon.
+"""
+
+import os
+import sys
+import types as _types
+
+
+#--------------------------------------------------------------------------------------
+# P R O P E R T I E S
+#--------------------------------------------------------------------------------------
+
+class _PropDef:
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.kwargs = kwargs
+        self.attr = None
+
+    def __set_name__(self, owner, name):
+        self.attr = name
+
+    def default(self, owner):
+        if self.kind == 'POINTER':
+            pointer_type = self.kwargs.get("type")
+            if pointer_type is not None and issubclass(pointer_type, PropertyGroup):
+                return pointer_type()
+            return None
+        if self.kind == 'COLLECTION':
+            return PropCollection(item_type=self.kwargs.get("type"))
+        if "default" in self.kwargs:
+            return self.kwargs["default"]
+        if self.kind == 'ENUM':
+            items = self.kwargs.get("items")
+            if isinstance(items, (list, tuple)) and items:
+                return items[0][0]
+            return ""
+        return {'INT': 0, 'FLOAT': 0.0, 'BOOL': False, 'STRING': ""}.get(self.kind)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        storage = instance.__dict__.setdefault("_props", {})
+        if self.attr not in storage:
+            storage[self.attr] = self.default(instance)
+        return storage[self.attr]
+
+    def __set__(self, instance, value):
+        instance.__dict__.setdefault("_props", {})[self.attr] = value
+        update = self.kwargs.get("update")
+        if update is not None:
+            update(instance, context)
+
+
+def _prop_factory(kind):
+    def factory(**kwargs):
+        return _PropDef(kind, **kwargs)
+    return factory
+
+
+props = _types.SimpleNamespace(
+    IntProperty=_prop_factory('INT'),
+    FloatProperty=_prop_factory('FLOAT'),
+    BoolProperty=_prop_factory('BOOL'),
+    StringProperty=_prop_factory('STRING'),
+    EnumProperty=_prop_factory('ENUM'),
+    PointerProperty=_prop_factory('POINTER'),
+    CollectionProperty=_prop_factory('COLLECTION'),
+    FloatVectorProperty=_prop_factory('FLOAT'),
+    IntVectorProperty=_prop_factory('INT'),
+)
+
+
+def _install_annotations(cls):
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).get("__annotations__", {}).items():
+            if isinstance(value, _PropDef):
+                value.attr = name
+                setattr(cls, name, value)
+
+
+class _StructMeta(type):
+    def __setattr__(cls, name, value):
+        if isinstance(value, _PropDef):
+            value.attr = name
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+
+
+class bpy_struct(metaclass=_StructMeta):
+    def as_pointer(self):
+        return id(self)
+
+    def __getitem__(self, key):
+        return self.__dict__.setdefault("_idprops", {})[key]
+
+    def __setitem__(self, key, value):
+        self.__dict__.setdefault("_idprops", {})[key] = value
+
+    def __contains__(self, key):
+        return key in self.__dict__.get("_idprops", {})
+
+    def get(self, key, default=None):
+        return self.__dict__.get("_idprops", {}).get(key, default)
+
+    def keys(self):
+        return self.__dict__.get("_idprops", {}).keys()
+
+
+#--------------------------------------------------------------------------------------
+# C O L L E C T I O N S
+#--------------------------------------------------------------------------------------
+
+class PropCollection(list):
+    def __init__(self, iterable=(), item_type=None):
+        super().__init__(iterable)
+        self.item_type = item_type
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self:
+                if item.name == key:
+                    return item
+            raise KeyError(key)
+        return list.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(item.name == key for item in self)
+        return any(item is key for item in self)
+
+    def get(self, key, default=None):
+        if isinstance(key, tuple):
+            # ID collections also take (name, library filepath or None)
+            name, library = key
+            for item in self:
+                item_library = item.library.filepath if item.library is not None else None
+                if item.name == name and item_library == library:
+                    return item
+            return default
+        for item in self:
+            if item.name == key:
+                return item
+        return default
+
+    def find(self, key):
+        for i, item in enumerate(self):
+            if item.name == key:
+                return i
+        return -1
+
+    def add(self):
+        item = self.item_type()
+        self.append(item)
+        return item
+
+    def clear(self):
+        del self[:]
+
+    def foreach_get(self, attr, seq):
+        i = 0
+        for item in self:
+            value = getattr(item, attr)
+            if isinstance(value, (list, tuple)):
+                if attr.startswith("matrix_"):
+                    # Blender stores matrices column-major
+                    value = list(zip(*value))
+                flat = [v for part in value for v in (part if isinstance(part, (list, tuple)) else (part,))]
+                seq[i:i + len(flat)] = flat
+                i += len(flat)
+            else:
+                seq[i] = value
+                i += 1
+
+    def foreach_set(self, attr, seq):
+        for i, item in enumerate(self):
+            setattr(item, attr, type(getattr(item, attr))(seq[i]))
+
+
+class TimelineMarker(bpy_struct):
+    def __init__(self, name, frame):
+        self.name = name
+        self.frame = frame
+        self.camera = None
+        self.select = False
+
+
+class TimelineMarkers(PropCollection):
+    def new(self, name, frame=1):
+        marker = TimelineMarker(name, frame)
+        self.append(marker)
+        return marker
+
+    def remove(self, marker):
+        # Blender unlinks the marker from a C list; list.index keeps the
+        # lookup in C as well (markers have no __eq__, so it matches identity)
+        try:
+            del self[self.index(marker)]
+        except ValueError:
+            raise ReferenceError("marker not found") from None
+
+
+#--------------------------------------------------------------------------------------
+# T Y P E S
+#--------------------------------------------------------------------------------------
+
+_pointer_counter = [0]
+
+
+class ID(bpy_struct):
+    def __init__(self, name=""):
+        self.name = name
+        self.library = None
+        self.users = 1
+        _pointer_counter[0] += 1
+        self._pointer = _pointer_counter[0]
+
+    def as_pointer(self):
+        return self._pointer
+
+    @property
+    def session_uid(self):
+        return self._pointer
+
+    def update_tag(self, refresh=set()):
+        pass
+
+    @property
+    def name_full(self):
+        if self.library is not None:
+            return "%s [%s]" % (self.name, self.library.name)
+        return self.name
+
+
+class Camera(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.type = 'PERSP'
+        self.lens_unit = 'MILLIMETERS'
+        self.lens = 50.0
+        self.angle = 0.6911
+        self.ortho_scale = 6.0
+        self.shift_x = 0.0
+        self.shift_y = 0.0
+        self.clip_start = 0.1
+        self.clip_end = 1000.0
+        self.sensor_width = 36.0
+        self.sensor_height = 24.0
+        self.sensor_fit = 'AUTO'
+        self.cycles = _types.SimpleNamespace(
+            panorama_type='FISHEYE_EQUISOLID', fisheye_fov=3.14, fisheye_lens=10.5,
+            latitude_min=-1.57, latitude_max=1.57, longitude_min=-3.14, longitude_max=3.14)
+
+
+class Mesh(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.vertices = PropCollection()
+        self.polygons = PropCollection()
+
+
+def _identity():
+    return [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+
+
+class Object(ID):
+    def __init__(self, name="", data=None):
+        super().__init__(name)
+        if isinstance(data, Camera):
+            self.type = 'CAMERA'
+        elif data is None:
+            self.type = 'EMPTY'
+        else:
+            self.type = 'MESH'
+        self.data = data
+        self.matrix_world = _identity()
+        self.location = [0.0, 0.0, 0.0]
+        self.bound_box = [[x, y, z] for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)]
+        self.hide_viewport = False
+        self.hide_render = False
+        self.users_collection = []
+        self._hidden = False
+        self._selected = False
+        # In an excluded collection: still in scene.objects, not in the view layer
+        self._excluded = False
+
+    def hide_get(self, view_layer=None):
+        return self._hidden
+
+    def hide_set(self, state, view_layer=None):
+        self._hidden = state
+
+    def select_get(self, view_layer=None):
+        return self._selected
+
+    def select_set(self, state, view_layer=None):
+        if self._excluded:
+            raise RuntimeError("Object '%s' can't be selected because it is not in View Layer" % self.name)
+        self._selected = state
+
+
+class CollectionObjects(PropCollection):
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+    def link(self, ob):
+        self.append(ob)
+        ob.users_collection.append(self.owner)
+        for scene in data.scenes:
+            scene.invalidate_objects()
+
+
+class Collection(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.children = PropCollection()
+        self.objects = CollectionObjects(self)
+
+    @property
+    def all_objects(self):
+        seen = set()
+        result = PropCollection()
+        stack = [self]
+        while stack:
+            coll = stack.pop()
+            for ob in coll.objects:
+                if id(ob) not in seen:
+                    seen.add(id(ob))
+                    result.append(ob)
+            stack.extend(coll.children)
+        return result
+
+
+class RenderSettings(bpy_struct):
+    def __init__(self):
+        self.resolution_x = 1920
+        self.resolution_y = 1080
+        self.resolution_percentage = 100
+        self.pixel_aspect_x = 1.0
+        self.pixel_aspect_y = 1.0
+        self.use_border = False
+        self.engine = 'BLENDER_EEVEE'
+        self.filepath = "//"
+        self.use_file_extension = True
+        self.file_extension = ".png"
+        self.image_settings = _types.SimpleNamespace(file_format='PNG')
+
+
+class Scene(ID):
+    def __init__(self, name="Scene"):
+        super().__init__(name)
+        self.collection = Collection("Scene Collection")
+        self.timeline_markers = TimelineMarkers()
+        self.frame_current = 1
+        self.frame_start = 1
+        self.frame_end = 250
+        self.render = RenderSettings()
+        self.camera = None
+        self.world = None
+        self._objects = None
+
+    @property
+    def objects(self):
+        if self._objects is None:
+            self._objects = self.collection.all_objects
+        return self._objects
+
+    def invalidate_objects(self):
+        self._objects = None
+
+    def frame_set(self, frame, subframe=0.0):
+        self.frame_current = frame
+
+
+class LayerObjects:
+    """The active scene's objects, minus those flagged as excluded."""
+
+    def __init__(self):
+        self.active = None
+        self._objects = None
+        self._by_name = {}
+
+    def get(self, name, default=None):
+        objects = context.scene.objects
+        ob = self._by_name.get(name)
+        if self._objects is not objects or (ob is not None and ob.name != name):
+            self._objects = objects
+            self._by_name = {ob.name: ob for ob in objects}
+            ob = self._by_name.get(name)
+        if ob is None or ob._excluded:
+            return default
+        return ob
+
+
+class ViewLayer(bpy_struct):
+    def __init__(self):
+        self.objects = LayerObjects()
+
+
+class Region3D(bpy_struct):
+    def __init__(self):
+        self.view_perspective = 'PERSP'
+        self.view_camera_offset = [0.0, 0.0]
+        self.view_camera_zoom = 0.0
+        self.view_matrix = _identity()
+        self.view_location = [0.0, 0.0, 0.0]
+        self.view_rotation = [1.0, 0.0, 0.0, 0.0]
+        self.view_distance = 10.0
+
+
+class SpaceView3D(bpy_struct):
+    def __init__(self):
+        self.type = 'VIEW_3D'
+        self.region_3d = Region3D()
+        self.camera = None
+        self.use_local_camera = False
+        self.use_render_border = False
+
+
+class Area(bpy_struct):
+    def __init__(self):
+        self.type = 'VIEW_3D'
+        space = SpaceView3D()
+        self.spaces = PropCollection([space])
+        self.spaces.active = space
+        self.regions = PropCollection([_types.SimpleNamespace(type='WINDOW', width=1920, height=1080)])
+
+    def tag_redraw(self):
+        pass
+
+
+class KeyMapItems(list):
+    def new(self, idname, type, value, **kwargs):
+        item = _types.SimpleNamespace(idname=idname, type=type, value=value, active=True,
+            properties=_types.SimpleNamespace(), **kwargs)
+        self.append(item)
+        return item
+
+
+class KeyMaps(list):
+    def new(self, name, space_type='EMPTY', region_type='WINDOW'):
+        keymap = _types.SimpleNamespace(name=name, keymap_items=KeyMapItems())
+        self.append(keymap)
+        return keymap
+
+
+class WindowManager(ID):
+    def __init__(self):
+        super().__init__("WinMan")
+        self.keyconfigs = _types.SimpleNamespace(addon=_types.SimpleNamespace(keymaps=KeyMaps()))
+        self.windows = []
+
+    def invoke_popup(self, op, width=300):
+        return {'RUNNING_MODAL'}
+
+    def invoke_props_dialog(self, op, width=300):
+        return {'RUNNING_MODAL'}
+
+    def invoke_props_popup(self, op, event):
+        return {'RUNNING_MODAL'}
+
+    def invoke_confirm(self, op, event):
+        return {'RUNNING_MODAL'}
+
+    def fileselect_add(self, op):
+        return None
+
+    def modal_handler_add(self, op):
+        return True
+
+    def event_timer_add(self, time_step, window=None):
+        return object()
+
+    def event_timer_remove(self, timer):
+        return None
+
+    def progress_begin(self, min, max):
+        return None
+
+    def progress_update(self, value):
+        return None
+
+    def progress_end(self):
+        return None
+
+
+class Library(ID):
+    def __init__(self, name="", filepath=""):
+        super().__init__(name)
+        self.filepath = filepath
+
+
+class Operator(bpy_struct):
+    bl_options = set()
+
+    def __init__(self):
+        self.layout = UILayout()
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((level, message))
+
+
+class Panel(bpy_struct):
+    def __init__(self):
+        self.layout = UILayout()
+
+
+class Menu(Panel):
+    pass
+
+
+class UIList(bpy_struct):
+    def __init__(self):
+        self.filter_name = ""
+        self.use_filter_sort_alpha = False
+        self.use_filter_sort_reverse = False
+        self.bitflag_filter_item = 1 << 30
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class AddonPreferences(bpy_struct):
+    def __init__(self):
+        self.layout = UILayout()
+
+
+class DepsgraphUpdate:
+    def __init__(self, id, is_updated_transform=False, is_updated_geometry=False):
+        self.id = id
+        self.is_updated_transform = is_updated_transform
+        self.is_updated_geometry = is_updated_geometry
+
+
+class Depsgraph:
+    def __init__(self, updates=(), objects=()):
+        self.updates = list(updates)
+        self.objects = list(objects)
+
+    def id_type_updated(self, id_type):
+        return False
+
+
+#--------------------------------------------------------------------------------------
+# L A Y O U T
+#--------------------------------------------------------------------------------------
+
+class _OperatorProperties:
+    pass
+
+
+class UILayout:
+    """Records how many layout calls a draw makes."""
+
+    calls = 0
+
+    def __init__(self):
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.alert = False
+        self.enabled = True
+        self.active = True
+        self.alignment = 'EXPAND'
+        self.operator_context = 'INVOKE_DEFAULT'
+
+    def _child(self, *args, **kwargs):
+        UILayout.calls += 1
+        return UILayout()
+
+    row = column = box = split = column_flow = grid_flow = _child
+
+    def operator(self, *args, **kwargs):
+        UILayout.calls += 1
+        return _OperatorProperties()
+
+    def _leaf(self, *args, **kwargs):
+        UILayout.calls += 1
+
+    prop = label = separator = template_list = template_icon = prop_search = menu = _leaf
+
+
+#--------------------------------------------------------------------------------------
+# O P S ,   D A T A ,   C O N T E X T
+#--------------------------------------------------------------------------------------
+
+_operators = {}
+
+
+class _OpCall:
+    def __init__(self, idname):
+        self.idname = idname
+
+    def __call__(self, *args, **kwargs):
+        cls = _operators.get(self.idname)
+        if cls is None:
+            builtin = _builtin_ops.get(self.idname)
+            if builtin is not None:
+                return builtin(**kwargs)
+            return {'FINISHED'}
+        op = cls()
+        for key, value in kwargs.items():
+            setattr(op, key, value)
+        return op.execute(context)
+
+    def poll(self):
+        return True
+
+
+class _OpModule:
+    def __init__(self, module):
+        self.module = module
+
+    def __getattr__(self, name):
+        return _OpCall("%s.%s" % (self.module, name))
+
+
+class _Ops:
+    def __getattr__(self, name):
+        return _OpModule(name)
+
+
+def _object_as_camera(**kwargs):
+    ob = context.view_layer.objects.active
+    context.scene.camera = ob
+    context.space_data.camera = ob
+    context.space_data.region_3d.view_perspective = 'CAMERA'
+    return {'FINISHED'}
+
+
+def _view_center_camera(**kwargs):
+    context.space_data.region_3d.view_camera_offset = [0.0, 0.0]
+    return {'FINISHED'}
+
+
+def _undo_push(**kwargs):
+    return {'FINISHED'}
+
+
+_builtin_ops = {
+    "view3d.object_as_camera": _object_as_camera,
+    "view3d.view_center_camera": _view_center_camera,
+    "ed.undo_push": _undo_push,
+}
+
+ops = _Ops()
+
+
+class BlendDataObjects(PropCollection):
+    def remove(self, ob, do_unlink=True):
+        for coll in list(ob.users_collection):
+            coll.objects.remove(ob)
+        for scene in data.scenes:
+            scene.invalidate_objects()
+        list.remove(self, ob)
+
+    def new(self, name, object_data):
+        ob = Object(name, object_data)
+        self.append(ob)
+        return ob
+
+
+class BlendDataCameras(PropCollection):
+    def new(self, name):
+        cam = Camera(name)
+        self.append(cam)
+        return cam
+
+    def remove(self, cam, do_unlink=True):
+        list.remove(self, cam)
+
+
+class BlendData:
+    def __init__(self):
+        self.objects = BlendDataObjects()
+        self.cameras = BlendDataCameras()
+        self.scenes = PropCollection()
+        self.collections = PropCollection()
+        self.libraries = PropCollection()
+        self.filepath = ""
+
+    def batch_remove(self, ids):
+        for id in list(ids):
+            if isinstance(id, Object):
+                self.objects.remove(id)
+            elif isinstance(id, Camera):
+                self.cameras.remove(id)
+
+
+data = BlendData()
+
+
+class Context:
+    def __init__(self):
+        self.scene = None
+        self.view_layer = ViewLayer()
+        self.area = Area()
+        self.space_data = self.area.spaces.active
+        self.region = self.area.regions[0]
+        self.window_manager = WindowManager()
+        self.preferences = _types.SimpleNamespace(addons={})
+        self.engine = 'BLENDER_EEVEE'
+        self.window = None
+        self.selected_objects = []
+
+    @property
+    def object(self):
+        return self.view_layer.objects.active
+
+    active_object = object
+
+    def evaluated_depsgraph_get(self):
+        return Depsgraph(objects=self.scene.objects if self.scene else ())
+
+
+context = Context()
+
+
+#--------------------------------------------------------------------------------------
+# A P P ,   U T I L S
+#--------------------------------------------------------------------------------------
+
+def persistent(func):
+    func._bpy_persistent = True
+    return func
+
+
+_handlers = _types.SimpleNamespace(
+    persistent=persistent,
+    depsgraph_update_pre=[], depsgraph_update_post=[],
+    load_pre=[], load_post=[], undo_post=[], redo_post=[], undo_pre=[], redo_pre=[],
+    frame_change_pre=[], frame_change_post=[], render_pre=[], render_post=[],
+    render_init=[], render_complete=[], render_cancel=[], save_pre=[], save_post=[],
+)
+
+app = _types.SimpleNamespace(
+    handlers=_handlers,
+    timers=_types.SimpleNamespace(
+        register=lambda func, first_interval=0.0, persistent=False: None,
+        unregister=lambda func: None,
+        is_registered=lambda func: False),
+    background=True,
+    version=(2, 93, 0),
+    binary_path="blender",
+)
+
+
+def register_class(cls):
+    _install_annotations(cls)
+    idname = getattr(cls, "bl_idname", None)
+    if idname and issubclass(cls, Operator):
+        _operators[idname] = cls
+
+
+def unregister_class(cls):
+    idname = getattr(cls, "bl_idname", None)
+    _operators.pop(idname, None)
+
+
+class ImagePreviewCollection(dict):
+    _icon_ids = [0]
+
+    def load(self, name, filepath, filetype):
+        self._icon_ids[0] += 1
+        preview = _types.SimpleNamespace(icon_id=self._icon_ids[0], filepath=filepath)
+        self[name] = preview
+        return preview
+
+
+def _user_resource(resource_type, path="", create=False):
+    # Blender's user config; redirected by setting BLENDER_USER_RESOURCES
+    directory = os.path.join(os.environ.get("BLENDER_USER_RESOURCES", "blender_user"), resource_type.lower(), path)
+    if create:
+        os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+utils = _types.SimpleNamespace(
+    register_class=register_class,
+    unregister_class=unregister_class,
+    user_resource=_user_resource,
+    previews=_types.SimpleNamespace(new=ImagePreviewCollection, remove=lambda collection: collection.clear()),
+)
+
+def _clean_name(name, replace="_"):
+    return "".join(c if c.isalnum() or c in "-." else replace for c in name)
+
+
+path = _types.SimpleNamespace(
+    abspath=lambda p: os.path.join(os.path.dirname(data.filepath), p[2:]) if p.startswith("//") else p,
+    clean_name=_clean_name)
+
+types_module = _types.SimpleNamespace(
+    ID=ID, Object=Object, Camera=Camera, Mesh=Mesh, Collection=Collection, Scene=Scene,
+    Library=Library, TimelineMarker=TimelineMarker, Operator=Operator, Panel=Panel,
+    Menu=Menu, UIList=UIList, PropertyGroup=PropertyGroup, AddonPreferences=AddonPreferences,
+    PointerProperty=_PropDef, WindowManager=WindowManager,
+    SpaceView3D=SpaceView3D, Depsgraph=Depsgraph, DepsgraphUpdate=DepsgraphUpdate,
+    UILayout=UILayout,
+)
+
+
+def install():
+    """Register this module as ``bpy`` (and its submodules) in ``sys.modules``."""
+    module = sys.modules[__name__]
+    bpy_types = _types.ModuleType("bpy.types")
+    bpy_types.__dict__.update(vars(types_module))
+    bpy_props = _types.ModuleType("bpy.props")
+    bpy_props.__dict__.update(vars(props))
+    bpy_app = _types.ModuleType("bpy.app")
+    bpy_app.__dict__.update(vars(app))
+    bpy_handlers = _types.ModuleType("bpy.app.handlers")
+    bpy_handlers.__dict__.update(vars(_handlers))
+    bpy_utils = _types.ModuleType("bpy.utils")
+    bpy_utils.__dict__.update(vars(utils))
+    module.types = bpy_types
+    module.props = bpy_props
+    module.app = bpy_app
+    module.app.handlers = bpy_handlers
+    module.utils = bpy_utils
+    sys.modules["bpy"] = module
+    sys.modules["bpy.types"] = bpy_types
+    sys.modules["bpy.props"] = bpy_props
+    sys.modules["bpy.app"] = bpy_app
+    sys.modules["bpy.app.handlers"] = bpy_handlers
+    sys.modules["bpy.utils"] = bpy_utils
+    sys.modules["bpy.utils.previews"] = utils.previews
+    return module
+
+
+#--------------------------------------------------------------------------------------
+# S C E N E   B U I L D I N G
+#--------------------------------------------------------------------------------------
+
+def reset():
+    """Start over with an empty file holding a single scene."""
+    global data
+    data = BlendData()
+    module = sys.modules.get("bpy", sys.modules[__name__])
+    module.data = data
+    scene = Scene("Scene")
+    data.scenes.append(scene)
+    context.scene = scene
+    context.view_layer = ViewLayer()
+    context.area = Area()
+    context.space_data = context.area.spaces.active
+    return scene
+
+
+def link(ob, collection, scene):
+    collection.objects.append(ob)
+    ob.users_collection.append(collection)
+    scene.invalidate_objects()
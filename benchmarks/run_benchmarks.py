@@ -0,0 +1,246 @@
+"""Headless benchmark suite for the Cameras Lister addon.
+
+Builds synthetic scenes on top of the lightweight ``fake_bpy`` module (no
+Blender needed), then times ``common_draw`` in both sort modes and the
+camera operators. Results are written as JSON so runs can be compared
+across revisions:
+
+    python benchmarks/run_benchmarks.py --cameras 1500 --objects 200000 \\
+        --collections 500 --depth 4 --markers 5000 --output bench.json
+
+Only the Python-side cost is measured; Blender's own drawing and operator
+overhead are not modelled.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+import fake_bpy
+
+bpy = fake_bpy.install()
+import Cameras_Lister
+
+
+#--------------------------------------------------------------------------------------
+# S C E N E
+#--------------------------------------------------------------------------------------
+
+def build_scene(cameras, objects, collections, depth, markers, seed=0):
+    """Populate a fresh fake file and return its scene."""
+    rng = random.Random(seed)
+    scene = fake_bpy.reset()
+
+    # Nested collections: a few top level trees, each `depth` levels deep
+    all_collections = [scene.collection]
+    parents = [scene.collection]
+    for i in range(collections):
+        coll = fake_bpy.Collection("Collection_%05d" % i)
+        bpy.data.collections.append(coll)
+        parent = parents[rng.randrange(len(parents))]
+        parent.children.append(coll)
+        all_collections.append(coll)
+        if len(parents) < max(1, collections // max(depth, 1)):
+            parents.append(coll)
+
+    for i in range(cameras):
+        cam_data = bpy.data.cameras.new("CameraData_%05d" % i)
+        cam_data.lens = rng.uniform(18.0, 135.0)
+        ob = bpy.data.objects.new("Camera_%05d" % i, cam_data)
+        ob.location = [rng.uniform(-100.0, 100.0) for _ in range(3)]
+        ob.matrix_world[0][3], ob.matrix_world[1][3], ob.matrix_world[2][3] = ob.location
+        fake_bpy.link(ob, all_collections[rng.randrange(len(all_collections))], scene)
+
+    for i in range(objects):
+        ob = bpy.data.objects.new("Object_%06d" % i, fake_bpy.Mesh("Mesh_%06d" % i))
+        fake_bpy.link(ob, all_collections[rng.randrange(len(all_collections))], scene)
+
+    camera_objects = [ob for ob in bpy.data.objects if ob.type == 'CAMERA']
+    for i in range(markers):
+        marker = scene.timeline_markers.new("F_%06d" % i, frame=i + 1)
+        if camera_objects:
+            cam = camera_objects[rng.randrange(len(camera_objects))]
+            marker.name = cam.name
+            marker.camera = cam
+
+    scene.frame_current = 1
+    if camera_objects:
+        scene.camera = camera_objects[0]
+    reset_indexes()
+    return scene
+
+
+def reset_indexes():
+    Cameras_Lister.index_load_post(None)
+
+
+def structural_update(scene):
+    """Simulate the depsgraph update Blender sends after a link change."""
+    Cameras_Lister.index_depsgraph_update_post(
+        scene, fake_bpy.Depsgraph([fake_bpy.DepsgraphUpdate(scene.collection)]))
+
+
+#--------------------------------------------------------------------------------------
+# T I M I N G
+#--------------------------------------------------------------------------------------
+
+def summarize(timings):
+    ordered = sorted(timings)
+    return {
+        "runs": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000.0,
+        "median_ms": statistics.median(ordered) * 1000.0,
+        "min_ms": ordered[0] * 1000.0,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000.0,
+        "max_ms": ordered[-1] * 1000.0,
+    }
+
+
+def timed(func, repeat, setup=None):
+    timings = []
+    for i in range(repeat):
+        if setup is not None:
+            setup(i)
+        start = time.perf_counter()
+        func(i)
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def draw(context):
+    fake_bpy.UILayout.calls = 0
+    Cameras_Lister.common_draw(None, fake_bpy.UILayout(), context)
+    return fake_bpy.UILayout.calls
+
+
+def bench_draw(context, scene, sort_mode, repeat):
+    scene.sort_cameras = sort_mode
+    results = {}
+    results["cold"] = timed(lambda i: draw(context), max(1, repeat // 4),
+        setup=lambda i: structural_update(scene))
+    draw(context)
+    results["warm"] = timed(lambda i: draw(context), repeat)
+    results["warm"]["layout_calls"] = draw(context)
+    return results
+
+
+def bench_operators(context, scene, repeat):
+    results = {}
+    cameras = list(Cameras_Lister.get_camera_index(context).names)
+    if not cameras:
+        return results
+    rng = random.Random(1)
+    frame_end = max(len(scene.timeline_markers), 1)
+
+    def pick(i):
+        return cameras[rng.randrange(len(cameras))]
+
+    def set_frame(i):
+        scene.frame_current = rng.randrange(1, frame_end + 1)
+
+    results["bind_to_marker"] = timed(
+        lambda i: bpy.ops.cameras.bind_to_marker(camera=pick(i)), repeat, setup=set_frame)
+    results["delete_camera_marker"] = timed(
+        lambda i: bpy.ops.cameras.delete_camera_marker(camera=pick(i)), repeat, setup=set_frame)
+    results["set_view"] = timed(lambda i: bpy.ops.cameras.set_view(camera=pick(i)), repeat)
+    results["select"] = timed(lambda i: bpy.ops.cameras.select(camera=pick(i)), repeat)
+
+    # The frustum query needs NumPy, which Blender bundles
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        context.selected_objects = [ob for ob in bpy.data.objects if ob.type == 'MESH'][:10]
+        results["seeing_selection"] = timed(lambda i: bpy.ops.cameras.seeing_selection(), repeat)
+        bpy.ops.cameras.seeing_selection(clear=True)
+        context.selected_objects = []
+
+    deletable = cameras[:min(repeat, max(len(cameras) - 1, 0))]
+    if deletable:
+        results["delete"] = timed(
+            lambda i: bpy.ops.cameras.delete(camera=deletable[i]), len(deletable),
+            setup=lambda i: structural_update(scene))
+    return results
+
+
+#--------------------------------------------------------------------------------------
+# M A I N
+#--------------------------------------------------------------------------------------
+
+def revision():
+    try:
+        return subprocess.check_output(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    Cameras_Lister.register()
+    context = bpy.context
+    params = {
+        "cameras": args.cameras,
+        "objects": args.objects,
+        "collections": args.collections,
+        "depth": args.depth,
+        "markers": args.markers,
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+
+    start = time.perf_counter()
+    scene = build_scene(args.cameras, args.objects, args.collections, args.depth, args.markers, args.seed)
+    build_time = time.perf_counter() - start
+
+    results = {}
+    for sort_mode in ("alphabetically", "by_collections"):
+        results["common_draw_" + sort_mode] = bench_draw(context, scene, sort_mode, args.repeat)
+    results.update(bench_operators(context, scene, args.repeat))
+
+    Cameras_Lister.unregister()
+    return {
+        "suite": "cameras_lister",
+        "revision": revision(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": params,
+        "scene_build_s": build_time,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cameras", type=int, default=1500)
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--collections", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--markers", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
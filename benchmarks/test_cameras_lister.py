@@ -0,0 +1,1064 @@
+"""Behaviour tests for the Cameras Lister addon on top of ``fake_bpy``.
+
+The benchmarks only time the addon; these check that the indexes and the
+camera transfer give the right answers. No Blender needed:
+
+    python -m pytest -q benchmarks
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import types
+import unittest
+import zlib
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+import fake_bpy
+
+bpy = fake_bpy.install()
+import Cameras_Lister
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import mathutils
+except ImportError:
+    mathutils = None
+
+Cameras_Lister.register()
+
+
+def new_scene():
+    scene = fake_bpy.reset()
+    Cameras_Lister.index_load_post(None)
+    return scene
+
+
+def new_camera(scene, name, location=(0.0, 0.0, 0.0), rotation_y=0.0, type='PERSP'):
+    """Link a camera looking down its -Z axis, turned ``rotation_y`` degrees about Y."""
+    data = bpy.data.cameras.new(name + "_data")
+    data.type = type
+    ob = bpy.data.objects.new(name, data)
+    angle = math.radians(rotation_y)
+    ob.matrix_world = [
+        [math.cos(angle), 0.0, math.sin(angle), location[0]],
+        [0.0, 1.0, 0.0, location[1]],
+        [-math.sin(angle), 0.0, math.cos(angle), location[2]],
+        [0.0, 0.0, 0.0, 1.0]]
+    fake_bpy.link(ob, scene.collection, scene)
+    return ob
+
+
+def new_mesh(scene, name, location=(0.0, 0.0, 0.0)):
+    ob = bpy.data.objects.new(name, fake_bpy.Mesh(name + "_mesh"))
+    for i in range(3):
+        ob.matrix_world[i][3] = location[i]
+    fake_bpy.link(ob, scene.collection, scene)
+    return ob
+
+
+def depsgraph_update(scene, *ids):
+    Cameras_Lister.index_depsgraph_update_post(
+        scene, fake_bpy.Depsgraph([fake_bpy.DepsgraphUpdate(id) for id in ids]))
+
+
+#--------------------------------------------------------------------------------------
+# P R O F I L I N G
+#--------------------------------------------------------------------------------------
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Cameras_Lister.profiler
+        self.addCleanup(self.profiler.configure, False, self.profiler.samples.maxlen)
+        self.addCleanup(self.profiler.clear)
+        self.profiler.clear()
+
+    def test_disabled_records_nothing(self):
+        self.profiler.configure(False, 16)
+        self.assertEqual(Cameras_Lister.timed_call("add", lambda a, b: a + b, 1, 2), 3)
+        self.assertEqual(self.profiler.stats(), [])
+
+    def test_ring_buffer(self):
+        self.profiler.configure(True, 4)
+        for i in range(10):
+            Cameras_Lister.timed_call("noop", lambda: None)
+        self.assertEqual(len(self.profiler.samples), 4)
+        stats = self.profiler.stats()
+        self.assertEqual([(entry["name"], entry["calls"], entry["samples"]) for entry in stats], [("noop", 10, 4)])
+        # Shrinking keeps the newest samples
+        newest = list(self.profiler.samples)[-2:]
+        self.profiler.configure(True, 2)
+        self.assertEqual(list(self.profiler.samples), newest)
+        self.assertEqual(self.profiler.samples.maxlen, 2)
+
+    def test_percentiles(self):
+        self.profiler.configure(True, 100)
+        for ms in range(1, 101):
+            self.profiler.record("op", ms / 1000.0)
+        entry, = self.profiler.stats()
+        self.assertAlmostEqual(entry["p50_ms"], 51.0)
+        self.assertAlmostEqual(entry["p95_ms"], 96.0)
+        self.assertAlmostEqual(entry["max_ms"], 100.0)
+
+    def test_records_when_the_call_raises(self):
+        self.profiler.configure(True, 16)
+        with self.assertRaises(ZeroDivisionError):
+            Cameras_Lister.timed_call("fails", lambda: 1 / 0)
+        self.assertEqual(self.profiler.counts["fails"], 1)
+
+    def test_dump(self):
+        self.profiler.configure(True, 16)
+        self.profiler.record("a", 0.002)
+        self.profiler.record("b", 0.004)
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "timings.json")
+            self.profiler.dump(filepath)
+            with open(filepath) as f:
+                content = json.load(f)
+            self.assertEqual([entry["name"] for entry in content["stats"]], ["a", "b"])
+            self.assertEqual([sample["ms"] for sample in content["samples"]], [2.0, 4.0])
+            filepath = os.path.join(directory, "timings.csv")
+            self.profiler.dump(filepath)
+            with open(filepath) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines[0], "name,timestamp,ms")
+            self.assertEqual([line.split(",")[0] for line in lines[1:]], ["a", "b"])
+
+    def test_wrappers_keep_the_signature(self):
+        # Blender checks the argument count of draw, execute and invoke
+        self.assertEqual(Cameras_Lister.common_draw.__code__.co_argcount, 3)
+        operator = Cameras_Lister.SelectCamera
+        self.assertTrue(operator.execute.profiled)
+        self.assertEqual(operator.execute.__code__.co_argcount, 2)
+        self.assertFalse(getattr(Cameras_Lister.Cameras_Lister_Preferences.draw, "profiled", False))
+
+    def test_operators_are_timed(self):
+        scene = new_scene()
+        cam = new_camera(scene, "Cam")
+        self.profiler.configure(True, 16)
+        bpy.ops.cameras.select(camera=Cameras_Lister.camera_ids.key(cam))
+        self.assertEqual(self.profiler.counts["cameras.select.execute"], 1)
+
+
+#--------------------------------------------------------------------------------------
+# C A M E R A   I N D E X
+#--------------------------------------------------------------------------------------
+
+class CameraIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.collection = fake_bpy.Collection("Shots")
+        bpy.data.collections.append(self.collection)
+        self.scene.collection.children.append(self.collection)
+        new_camera(self.scene, "Cam_B")
+        new_camera(self.scene, "cam_a")
+        new_mesh(self.scene, "Mesh")
+        self.index = Cameras_Lister.camera_index.ensure(self.scene)
+
+    def test_sorted_names(self):
+        self.assertEqual(self.index.names, ["cam_a", "Cam_B"])
+        self.assertEqual([row.name for row in self.index.rows], ["cam_a", "Cam_B"])
+
+    def test_scene_update_does_not_walk_objects(self):
+        # Transform and selection edits send scene updates; they must not
+        # cost a pass over the scene objects
+        Cameras_Lister.marker_index.ensure(self.scene)
+        with mock.patch.object(fake_bpy.Scene, "objects", property(lambda scene: self.fail("scene.objects read"))):
+            depsgraph_update(self.scene, self.scene)
+        self.assertFalse(self.index.dirty)
+        self.assertFalse(Cameras_Lister.marker_index.dirty)
+
+    def test_link_to_collection(self):
+        ob = bpy.data.objects.new("Cam_C", bpy.data.cameras.new("Cam_C"))
+        fake_bpy.link(ob, self.collection, self.scene)
+        depsgraph_update(self.scene, self.collection)
+        self.assertEqual(self.index.ensure(self.scene).names, ["cam_a", "Cam_B", "Cam_C"])
+
+    def test_link_to_scene_collection(self):
+        ob = bpy.data.objects.new("Cam_C", bpy.data.cameras.new("Cam_C"))
+        fake_bpy.link(ob, self.scene.collection, self.scene)
+        depsgraph_update(self.scene, self.scene)
+        self.assertEqual(self.index.ensure(self.scene).names, ["cam_a", "Cam_B", "Cam_C"])
+
+    def test_rename(self):
+        cam = self.index.rows[0].object
+        cam.name = "Cam_Z"
+        depsgraph_update(self.scene, cam)
+        self.assertEqual(self.index.ensure(self.scene).names, ["Cam_B", "Cam_Z"])
+
+    def test_linked_camera_with_a_local_name(self):
+        local = self.index.rows[1].object
+        linked = bpy.data.objects.new("Cam_B", bpy.data.cameras.new("Cam_B"))
+        linked.library = fake_bpy.Library("rig.blend", "//rig.blend")
+        fake_bpy.link(linked, self.collection, self.scene)
+        depsgraph_update(self.scene, self.collection)
+        index = self.index.ensure(self.scene)
+        self.assertEqual(index.names, ["cam_a", "Cam_B", "Cam_B"])
+        self.assertEqual([row.object for row in index.rows[1:]], [local, linked])
+        self.assertEqual(len(index.objects), 3)
+        self.assertEqual([row.name for coll_name, rows in index.groups(self.scene) for row in rows],
+            ["cam_a", "Cam_B", "Cam_B"])
+
+    def test_resolve_camera(self):
+        cam = self.index.rows[0].object
+        self.assertIs(Cameras_Lister.ResolveCamera(Cameras_Lister.camera_ids.key(cam)), cam)
+        self.assertIs(Cameras_Lister.ResolveCamera("cam_a"), cam)
+        self.assertIsNone(Cameras_Lister.ResolveCamera("Mesh"))
+        self.assertIsNone(Cameras_Lister.ResolveCamera("Gone"))
+
+    def test_new_cameras_get_an_identifier(self):
+        # Cameras keyed by name until the timer gives them an identifier
+        with mock.patch.object(bpy.app.timers, "register") as register:
+            self.index.invalidate()
+            self.index.ensure(self.scene)
+        register.assert_called_once_with(Cameras_Lister.assign_camera_ids, first_interval=0.0)
+        Cameras_Lister.assign_camera_ids()
+        index = self.index.ensure(self.scene)
+        self.assertTrue(all(row.object.cameras_lister_id == row.key for row in index.rows))
+        with mock.patch.object(bpy.app.timers, "register") as register:
+            self.index.invalidate()
+            self.index.ensure(self.scene)
+        register.assert_not_called()
+
+    def test_duplicate_keeps_its_pick_through_rename(self):
+        Cameras_Lister.assign_camera_ids()
+        cam = self.index.ensure(self.scene).rows[0].object
+        duplicate = new_camera(self.scene, "cam_a.001")
+        duplicate.cameras_lister_id = cam.cameras_lister_id
+        depsgraph_update(self.scene, duplicate, self.scene)
+        keys = {row.object: row.key for row in self.index.ensure(self.scene).rows}
+        self.assertEqual(keys[cam], cam.cameras_lister_id)
+        Cameras_Lister.lister_selection.keys = {keys[duplicate]}
+        Cameras_Lister.assign_camera_ids()
+        self.assertNotEqual(duplicate.cameras_lister_id, cam.cameras_lister_id)
+        duplicate.name = "Cam_Close"
+        depsgraph_update(self.scene, duplicate)
+        self.assertEqual(Cameras_Lister.SelectedCameras(bpy.context), [duplicate])
+
+
+#--------------------------------------------------------------------------------------
+# S W I T C H I N G
+#--------------------------------------------------------------------------------------
+
+class RecordingLayout(fake_bpy.UILayout):
+    """Keeps the (data, property) pairs drawn through it and its children."""
+
+    def __init__(self, props=None):
+        super().__init__()
+        self.props = [] if props is None else props
+
+    def _child(self, *args, **kwargs):
+        return RecordingLayout(self.props)
+
+    row = column = box = split = _child
+
+    def prop(self, data, property, **kwargs):
+        self.props.append((data, property))
+
+
+class SwitchCameraTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.mesh = new_mesh(self.scene, "Mesh")
+        self.cam = new_camera(self.scene, "Cam")
+        self.excluded = new_camera(self.scene, "Excluded")
+        self.excluded._excluded = True
+        bpy.context.view_layer.objects.active = self.mesh
+
+    def test_switch(self):
+        Cameras_Lister.SwitchToCamera(bpy.context, self.cam)
+        self.assertIs(self.scene.camera, self.cam)
+        self.assertIs(bpy.context.view_layer.objects.active, self.cam)
+        self.assertTrue(self.cam.select_get())
+
+    def test_switch_to_excluded_camera(self):
+        Cameras_Lister.SwitchToCamera(bpy.context, self.excluded)
+        self.assertIs(self.scene.camera, self.excluded)
+        self.assertIs(bpy.context.view_layer.objects.active, self.mesh)
+
+    def test_settings_draw_the_camera_not_the_active_object(self):
+        for cam in (self.cam, self.excluded):
+            op = Cameras_Lister.PanelButton_CameraSettings()
+            op.camera = Cameras_Lister.camera_ids.key(cam)
+            op.layout = RecordingLayout()
+            bpy.context.view_layer.objects.active = self.mesh
+            op.draw(bpy.context)
+            owners = {data for data, property in op.layout.props}
+            self.assertEqual(owners, {cam.data, cam.camera_custom_resolution_settings_pointer_prop})
+
+
+#--------------------------------------------------------------------------------------
+# M A R K E R S
+#--------------------------------------------------------------------------------------
+
+class MarkerIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i) for i in range(3)]
+        self.index = Cameras_Lister.marker_index
+
+    def assertMatchesRebuild(self):
+        # The incremental updates must leave what a full rebuild would
+        frames = {frame: list(markers) for frame, markers in self.index.by_frame.items()}
+        cameras = {key: list(markers) for key, markers in self.index.by_camera.items()}
+        self.index.rebuild(self.scene)
+        self.assertEqual(frames, self.index.by_frame)
+        self.assertEqual(cameras, self.index.by_camera)
+
+    def test_add(self):
+        marker = self.index.add(self.scene, "F_10", 10, self.cams[0])
+        self.assertIn(marker, self.scene.timeline_markers)
+        self.assertEqual(list(self.index.at_frame(10)), [marker])
+        self.assertEqual(list(self.index.for_camera(self.cams[0])), [marker])
+        self.assertIs(self.index.bound_camera(10), self.cams[0])
+        self.assertIsNone(self.index.bound_camera(11))
+        self.assertMatchesRebuild()
+
+    def test_add_many(self):
+        self.index.add_many(self.scene, [("F_%d" % frame, frame, self.cams[frame % 3]) for frame in range(1, 31)])
+        self.assertEqual(len(self.scene.timeline_markers), 30)
+        self.assertEqual(len(self.index.for_camera(self.cams[1])), 10)
+        self.assertIs(self.index.bound_camera(5), self.cams[2])
+        self.assertMatchesRebuild()
+
+    def test_remove_many_keeps_other_markers(self):
+        self.index.add_many(self.scene, [("F_%d" % frame, frame, self.cams[frame % 3]) for frame in range(1, 31)])
+        kept = [marker for marker in self.scene.timeline_markers if marker.camera is not self.cams[0]]
+        self.index.remove_many(self.scene, self.index.for_camera(self.cams[0]))
+        self.assertEqual(self.index.for_camera(self.cams[0]), ())
+        self.assertEqual(len(self.scene.timeline_markers), 20)
+        # Same marker objects, not recreated ones
+        for marker, remaining in zip(kept, self.scene.timeline_markers):
+            self.assertIs(marker, remaining)
+        self.assertIsNone(self.index.bound_camera(3))
+        self.assertMatchesRebuild()
+
+    def test_unbind_camera(self):
+        self.index.add(self.scene, "A", 1, self.cams[0])
+        self.index.add(self.scene, "B", 1, self.cams[1])
+        self.index.unbind_camera(self.scene, self.cams[0])
+        self.assertEqual([marker.name for marker in self.scene.timeline_markers], ["B"])
+        self.assertIs(self.index.bound_camera(1), self.cams[1])
+        self.assertMatchesRebuild()
+
+    def test_external_change_rebuilds(self):
+        self.index.add(self.scene, "A", 1, self.cams[0])
+        marker = self.scene.timeline_markers.new("B", frame=2)
+        marker.camera = self.cams[1]
+        self.assertIs(self.index.ensure(self.scene).bound_camera(2), self.cams[1])
+
+
+#--------------------------------------------------------------------------------------
+# M A R K E R   R E S O L U T I O N
+#--------------------------------------------------------------------------------------
+
+class ResolutionScheduleTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        Cameras_Lister.resolution_schedule.clear()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i) for i in range(2)]
+        for cam, (x, y) in zip(self.cams, ((1000, 500), (640, 480))):
+            settings = cam.camera_custom_resolution_settings_pointer_prop
+            settings.Custom_Horizontal_Resolution = x
+            settings.Custom_Vertical_Resolution = y
+        Cameras_Lister.marker_index.add(self.scene, "A", 10, self.cams[0])
+        Cameras_Lister.marker_index.add(self.scene, "Unbound", 15)
+        Cameras_Lister.marker_index.add(self.scene, "B", 20, self.cams[1])
+
+    def resolution_at(self, frame):
+        self.scene.frame_current = frame
+        Cameras_Lister.resolution_schedule_frame_change_pre(self.scene)
+        return self.scene.render.resolution_x, self.scene.render.resolution_y
+
+    def test_lookup(self):
+        schedule = Cameras_Lister.resolution_schedule.ensure(self.scene)
+        # Blender's rule: last marker at or before the frame, else the first
+        self.assertIs(schedule.lookup(1)[0], self.cams[0])
+        self.assertIs(schedule.lookup(15)[0], self.cams[0])
+        self.assertIs(schedule.lookup(20)[0], self.cams[1])
+        self.assertIs(schedule.lookup(1000)[0], self.cams[1])
+
+    def test_off_by_default(self):
+        # Existing files with camera markers keep their render resolution
+        self.assertFalse(self.scene.cameras_lister_marker_resolution)
+        self.assertEqual(self.resolution_at(20), (1920, 1080))
+
+    def test_follow_markers(self):
+        self.scene.cameras_lister_marker_resolution = True
+        self.assertEqual(self.resolution_at(12), (1000, 500))
+        self.assertEqual(self.resolution_at(25), (640, 480))
+
+    def test_follows_changes(self):
+        self.scene.cameras_lister_marker_resolution = True
+        self.assertEqual(self.resolution_at(25), (640, 480))
+        self.cams[1].camera_custom_resolution_settings_pointer_prop.Custom_Horizontal_Resolution = 800
+        self.assertEqual(self.resolution_at(25), (800, 480))
+        Cameras_Lister.marker_index.add(self.scene, "C", 22, self.cams[0])
+        self.assertEqual(self.resolution_at(25), (1000, 500))
+
+
+#--------------------------------------------------------------------------------------
+# S E Q U E N C E
+#--------------------------------------------------------------------------------------
+
+class CameraCutListTest(unittest.TestCase):
+    def test_even_split(self):
+        self.assertEqual(Cameras_Lister.CameraCutList(["A", "B", "C"], 1, 90),
+            [(1, 30, "A"), (31, 60, "B"), (61, 90, "C")])
+
+    def test_uneven_split_covers_range(self):
+        cuts = Cameras_Lister.CameraCutList(["A", "B", "C"], 1, 100)
+        self.assertEqual(cuts[0][0], 1)
+        self.assertEqual(cuts[-1][1], 100)
+        for (start, end, cam), (next_start, next_end, next_cam) in zip(cuts, cuts[1:]):
+            self.assertEqual(end + 1, next_start)
+
+    def test_shot_length(self):
+        self.assertEqual(Cameras_Lister.CameraCutList(["A", "B", "C"], 10, 20, shot_length=24),
+            [(10, 33, "A"), (34, 57, "B"), (58, 81, "C")])
+
+    def test_more_cameras_than_frames(self):
+        self.assertEqual(Cameras_Lister.CameraCutList(["A", "B", "C", "D"], 5, 6),
+            [(5, 5, "A"), (6, 6, "B")])
+
+
+#--------------------------------------------------------------------------------------
+# S E A R C H
+#--------------------------------------------------------------------------------------
+
+class NameSearchIndexTest(unittest.TestCase):
+    NAMES = ("Shot_010_Wide", "Shot_010_Close", "Shot_020_Wide", "Drone", "Close_Up")
+
+    def setUp(self):
+        self.index = Cameras_Lister.NameSearchIndex()
+        self.index.sync(self.NAMES)
+
+    def expected(self, query):
+        return {name for name in self.NAMES if query.lower() in name.lower()}
+
+    def test_empty_query(self):
+        self.assertIsNone(self.index.search(""))
+        self.assertIsNone(self.index.search("   "))
+
+    def test_matches_substring_search(self):
+        for query in ("s", "Wi", "clo", "shot_0", "010_wide", "_", "drones", "xyz"):
+            self.assertEqual(set(self.index.search(query)), self.expected(query), query)
+
+    def test_narrowing(self):
+        # Typing further filters the previous result instead of starting over
+        for query in ("s", "sh", "sho", "shot", "shot_", "shot_0", "shot_02", "shot_020_wide"):
+            self.assertEqual(set(self.index.search(query)), self.expected(query), query)
+        # Going back to a broader query must not reuse the narrowed result
+        self.assertEqual(set(self.index.search("shot")), self.expected("shot"))
+
+    def test_sync_invalidates_result(self):
+        self.assertEqual(set(self.index.search("wide")), self.expected("wide"))
+        self.index.sync(self.NAMES[1:] + ("Wide_Extra",))
+        self.assertEqual(set(self.index.search("wide")), {"Shot_020_Wide", "Wide_Extra"})
+
+
+#--------------------------------------------------------------------------------------
+# C A T A L O G
+#--------------------------------------------------------------------------------------
+
+class CameraCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        new_camera(self.scene, "Cam_B")
+        new_camera(self.scene, "Cam_A")
+        self.shot = fake_bpy.Scene("Shot_020")
+        bpy.data.scenes.append(self.shot)
+        new_camera(self.shot, "S2Cam")
+        self.library = fake_bpy.Library("rig.blend", "//rig.blend")
+        bpy.data.libraries.append(self.library)
+        # Linked into Shot_020, and linked but in no scene
+        self.new_linked("Rig", self.shot)
+        self.new_linked("Cam_A")
+        self.catalog = Cameras_Lister.camera_catalog
+
+    def new_linked(self, name, scene=None, library=None):
+        ob = bpy.data.objects.new(name, bpy.data.cameras.new(name + "_data"))
+        ob.library = library or self.library
+        if scene is not None:
+            fake_bpy.link(ob, scene.collection, scene)
+        return ob
+
+    def groups(self, search=""):
+        return [(name, [(row.name, row.library) for row in rows])
+            for name, rows in self.catalog.ensure(bpy.context).groups(search)]
+
+    def test_groups(self):
+        self.assertEqual(self.groups(), [
+            ("Scene", [("Cam_A", None), ("Cam_B", None)]),
+            ("Shot_020", [("Rig", "//rig.blend"), ("S2Cam", None)]),
+            ("", [("Cam_A", "//rig.blend")])])
+
+    def test_search(self):
+        self.assertEqual(self.groups("cam_a"), [
+            ("Scene", [("Cam_A", None)]),
+            ("", [("Cam_A", "//rig.blend")])])
+        self.assertEqual(self.groups("RIG"), [("Shot_020", [("Rig", "//rig.blend")])])
+        self.assertEqual(self.groups("xyz"), [])
+
+    def test_cached_until_a_scene_changes(self):
+        groups = self.catalog.ensure(bpy.context).groups("")
+        self.assertIs(self.catalog.ensure(bpy.context).groups(""), groups)
+        new_camera(self.shot, "S2Cam_Close")
+        self.assertIs(self.catalog.ensure(bpy.context).groups(""), groups)
+        self.catalog.invalidate_scene("Shot_020")
+        self.assertEqual(dict(self.groups())["Shot_020"],
+            [("Rig", "//rig.blend"), ("S2Cam", None), ("S2Cam_Close", None)])
+
+    def test_active_scene_follows_the_index(self):
+        self.groups()
+        new_camera(self.scene, "Cam_C")
+        depsgraph_update(self.scene, self.scene)
+        self.assertEqual(dict(self.groups())["Scene"], [("Cam_A", None), ("Cam_B", None), ("Cam_C", None)])
+
+    def test_new_library(self):
+        self.groups()
+        library = fake_bpy.Library("props.blend", "//props.blend")
+        bpy.data.libraries.append(library)
+        self.new_linked("Prop_Cam", library=library)
+        self.assertEqual(dict(self.groups())[""], [("Prop_Cam", "//props.blend"), ("Cam_A", "//rig.blend")])
+
+    def test_removed_scene(self):
+        self.groups()
+        bpy.data.scenes.remove(self.shot)
+        self.assertEqual([name for name, rows in self.groups()], ["Scene", ""])
+
+
+#--------------------------------------------------------------------------------------
+# B U L K   E D I T
+#--------------------------------------------------------------------------------------
+
+@unittest.skipIf(numpy is None, "needs NumPy")
+class BulkEditTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i) for i in range(3)]
+        # Cam_2 shares Cam_1's data
+        self.cams[2].data = self.cams[1].data
+        library = fake_bpy.Library("rig.blend", "//rig.blend")
+        self.linked = new_camera(self.scene, "Rig")
+        self.linked.library = self.linked.data.library = library
+
+    def test_multiply_rounds_once(self):
+        # 50 * 1.2 worked out in single precision is 60.000003814697266
+        count = Cameras_Lister.BulkEditCameraData(self.cams, "lens", "MULTIPLY", 1.2)
+        self.assertEqual(count, 2)
+        self.assertEqual([cam.data.lens for cam in self.cams], [60.0, 60.0, 60.0])
+
+    def test_shared_data_edited_once(self):
+        Cameras_Lister.BulkEditCameraData(self.cams, "clip_end", "ADD", 10.0)
+        self.assertEqual([cam.data.clip_end for cam in self.cams], [1010.0, 1010.0, 1010.0])
+
+    def test_clamped(self):
+        Cameras_Lister.BulkEditCameraData(self.cams, "shift_x", "SET", 12.0)
+        self.assertEqual(self.cams[0].data.shift_x, 10.0)
+        Cameras_Lister.BulkEditCameraData(self.cams, "lens", "ADD", -60.0)
+        self.assertEqual(self.cams[0].data.lens, 1.0)
+
+    def test_linked_skipped(self):
+        self.assertEqual(Cameras_Lister.BulkEditCameraData([self.linked], "lens", "SET", 85.0), 0)
+        count = Cameras_Lister.BulkEditCameraData([self.linked, self.cams[0]], "lens", "SET", 85.0)
+        self.assertEqual(count, 1)
+        self.assertEqual((self.linked.data.lens, self.cams[0].data.lens), (50.0, 85.0))
+
+
+class BulkResolutionTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i) for i in range(2)]
+        self.linked = new_camera(self.scene, "Rig")
+        self.linked.library = fake_bpy.Library("rig.blend", "//rig.blend")
+        for cam in self.cams + [self.linked]:
+            Cameras_Lister.lister_selection.keys.add(Cameras_Lister.camera_ids.key(cam))
+        self.settings = [cam.camera_custom_resolution_settings_pointer_prop for cam in self.cams]
+        self.settings[1].Custom_Horizontal_Resolution = 1000
+        self.settings[1].Custom_Vertical_Resolution = 500
+        self.scene.camera = self.cams[0]
+
+    def run_mode(self, mode, **kwargs):
+        op = Cameras_Lister.BulkCamerasCustomResolution()
+        op.mode = mode
+        for key, value in kwargs.items():
+            setattr(op, key, value)
+        self.assertEqual(op.execute(bpy.context), {'FINISHED'})
+        return [(settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution)
+            for settings in self.settings]
+
+    def test_set(self):
+        self.assertEqual(self.run_mode("SET", horizontal=1280, vertical=720), [(1280, 720), (1280, 720)])
+        self.assertEqual((self.scene.render.resolution_x, self.scene.render.resolution_y), (1280, 720))
+
+    def test_offset(self):
+        self.assertEqual(self.run_mode("ADD", offset_horizontal=100, offset_vertical=-1000),
+            [(2020, 80), (1100, 4)])
+
+    def test_scale(self):
+        self.assertEqual(self.run_mode("MULTIPLY", factor=0.5), [(960, 540), (500, 250)])
+        self.assertEqual(self.scene.render.resolution_x, 960)
+
+    def test_linked_skipped(self):
+        self.run_mode("SET", horizontal=1280, vertical=720)
+        settings = self.linked.camera_custom_resolution_settings_pointer_prop
+        self.assertEqual((settings.Custom_Horizontal_Resolution, settings.Custom_Vertical_Resolution), (1920, 1080))
+
+
+#--------------------------------------------------------------------------------------
+# F R U S T U M
+#--------------------------------------------------------------------------------------
+
+@unittest.skipIf(numpy is None, "needs NumPy")
+class CamerasSeeingTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.target = new_mesh(self.scene, "Target")
+        self.aside = new_mesh(self.scene, "Aside", (50.0, 0.0, 0.0))
+
+    def seeing(self, cams, objects, require_all=False):
+        return [cam.name for cam in Cameras_Lister.CamerasSeeing(self.scene, cams, objects, require_all)]
+
+    def test_culling(self):
+        cams = [
+            new_camera(self.scene, "Front", (0.0, 0.0, 10.0)),
+            new_camera(self.scene, "Behind", (0.0, 0.0, -10.0)),
+            new_camera(self.scene, "Side", (10.0, 0.0, 0.0), 90.0),
+            new_camera(self.scene, "SideAway", (10.0, 0.0, 0.0), -90.0),
+            new_camera(self.scene, "Far", (0.0, 0.0, 2000.0)),
+            new_camera(self.scene, "Ortho", (0.0, 0.0, 10.0), type='ORTHO'),
+            new_camera(self.scene, "OrthoAside", (20.0, 0.0, 10.0), type='ORTHO'),
+            new_camera(self.scene, "Pano", (0.0, 0.0, -10.0), type='PANO'),
+        ]
+        self.assertEqual(self.seeing(cams, [self.target]), ["Front", "Side", "Ortho", "Pano"])
+
+    def test_require_all(self):
+        cams = [
+            new_camera(self.scene, "Close", (0.0, 0.0, 10.0)),
+            new_camera(self.scene, "Wide", (25.0, 0.0, 100.0)),
+        ]
+        self.assertEqual(self.seeing(cams, [self.target, self.aside]), ["Close", "Wide"])
+        self.assertEqual(self.seeing(cams, [self.target, self.aside], require_all=True), ["Wide"])
+
+    def test_matrices(self):
+        cams = [new_camera(self.scene, "Cam_%d" % i, (float(i), 2.0, 3.0), 30.0 * i) for i in range(3)]
+        expected = numpy.array([cam.matrix_world for cam in cams])
+        numpy.testing.assert_allclose(Cameras_Lister.CameraMatrices(self.scene, cams), expected, atol=1e-6)
+        # Objects removed by a script before the depsgraph handler ran
+        bpy.data.objects.remove(self.aside)
+        numpy.testing.assert_allclose(Cameras_Lister.CameraMatrices(self.scene, cams), expected, atol=1e-6)
+        self.assertEqual(self.seeing(cams[:1], [self.target]), [])
+        new_mesh(self.scene, "Added")
+        numpy.testing.assert_allclose(Cameras_Lister.CameraMatrices(self.scene, cams[1:]), expected[1:], atol=1e-6)
+
+    def test_empty(self):
+        cam = new_camera(self.scene, "Front", (0.0, 0.0, 10.0))
+        self.assertEqual(self.seeing([cam], []), [])
+        self.assertEqual(self.seeing([], [self.target]), [])
+
+
+#--------------------------------------------------------------------------------------
+# B A T C H   R E N D E R
+#--------------------------------------------------------------------------------------
+
+class BatchRenderTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i) for i in range(2)]
+        self.saved = []
+        self.addCleanup(fake_bpy._builtin_ops.pop, "wm.save_as_mainfile", None)
+        fake_bpy._builtin_ops["wm.save_as_mainfile"] = lambda **kwargs: self.saved.append(kwargs)
+
+    def execute(self, filepath, is_dirty):
+        bpy.data.filepath = filepath
+        bpy.data.is_dirty = is_dirty
+        op = Cameras_Lister.BatchRenderCameras()
+        with mock.patch.object(Cameras_Lister.BatchRenderJob, "start"):
+            return op, op.execute(bpy.context)
+
+    def test_absolute_output_template(self):
+        bpy.data.filepath = ""
+        self.assertIsNone(Cameras_Lister.AbsoluteOutputTemplate("//renders/{camera}"))
+        absolute = os.path.abspath("/renders/{camera}")
+        self.assertEqual(Cameras_Lister.AbsoluteOutputTemplate(absolute), absolute)
+        bpy.data.filepath = os.path.abspath("/shots/shot.blend")
+        self.assertEqual(Cameras_Lister.AbsoluteOutputTemplate("//renders/{camera}"),
+            os.path.abspath("/shots/renders/{camera}"))
+
+    def test_unsaved_file_with_relative_output(self):
+        # Workers would render next to the temporary copy, never to where
+        # the manifest looks for the stills
+        op, result = self.execute("", True)
+        self.assertEqual(result, {'CANCELLED'})
+        self.assertEqual(self.saved, [])
+        self.assertIsNone(op._job)
+
+    def test_workers_render_next_to_the_open_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            op, result = self.execute(os.path.join(directory, "shot.blend"), True)
+            self.assertEqual(result, {'RUNNING_MODAL'})
+            # Unsaved changes: the workers load a copy...
+            self.assertEqual([kwargs["filepath"] for kwargs in self.saved], [op._job.blend_path])
+            self.assertNotEqual(op._job.blend_path, bpy.data.filepath)
+            # ...but render where the cache and manifest look
+            renders = os.path.join(directory, "renders")
+            command = op._job.worker_command()
+            self.assertEqual(command[command.index("--output") + 1], os.path.join(renders, "{camera}"))
+            self.assertEqual(os.path.dirname(op._cache.manifest.filepath), renders)
+            self.assertEqual({os.path.dirname(output) for index, fingerprint, output in op._cache.entries.values()},
+                {renders})
+
+    def test_workers_get_camera_identifiers(self):
+        linked = new_camera(self.scene, "Cam_0")
+        linked.library = fake_bpy.Library("rig.blend", "//rig.blend")
+        with tempfile.TemporaryDirectory() as directory:
+            op, result = self.execute(os.path.join(directory, "shot.blend"), False)
+        keys = [key for index, key in op._job.pending]
+        # Given before the copy is saved, so the workers find the same ones
+        self.assertEqual(keys, [self.cams[0].cameras_lister_id, "name:Cam_0 [rig.blend]",
+            self.cams[1].cameras_lister_id])
+        self.assertEqual([Cameras_Lister.ResolveCamera(key) for key in keys], [self.cams[0], linked, self.cams[1]])
+
+
+class RenderCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i, (0.0, 0.0, 10.0 * i)) for i in range(3)]
+        self.mesh = new_mesh(self.scene, "Mesh")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.rendered = []
+        self.addCleanup(fake_bpy._builtin_ops.pop, "render.render", None)
+        fake_bpy._builtin_ops["render.render"] = self.render
+
+    def render(self, **kwargs):
+        # Blender would switch to the marker's camera otherwise
+        self.assertEqual([marker.camera for marker in self.scene.timeline_markers if marker.camera], [])
+        self.rendered.append(self.scene.camera.name)
+        with open(Cameras_Lister.RenderedFilePath(self.scene, self.scene.render.filepath), "w") as f:
+            f.write(self.scene.camera.name)
+
+    def run_render(self, incremental=True):
+        self.rendered = []
+        args = types.SimpleNamespace(scene=None, camera=None, sort=None, search="", workers=0, threads=0,
+            output=os.path.join(self.directory.name, "{camera}"), in_process=True, incremental=incremental)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(Cameras_Lister.cli_render(args), 0)
+        return sorted(self.rendered)
+
+    def test_incremental(self):
+        names = [cam.name for cam in self.cams]
+        self.assertEqual(self.run_render(), names)
+        self.assertEqual(self.run_render(), [])
+        self.assertEqual(self.run_render(incremental=False), names)
+
+    def test_camera_change(self):
+        self.run_render()
+        self.cams[1].matrix_world[0][3] += 1.0
+        self.assertEqual(self.run_render(), ["Cam_1"])
+        self.cams[2].data.lens = 85.0
+        self.assertEqual(self.run_render(), ["Cam_2"])
+        self.cams[0].camera_custom_resolution_settings_pointer_prop.Custom_Horizontal_Resolution = 640
+        self.assertEqual(self.run_render(), ["Cam_0"])
+
+    def test_scene_change(self):
+        self.run_render()
+        self.mesh.matrix_world[0][3] += 1.0
+        self.assertEqual(self.run_render(), [cam.name for cam in self.cams])
+
+    def test_missing_output(self):
+        self.run_render()
+        os.remove(os.path.join(self.directory.name, "Cam_2.png"))
+        self.assertEqual(self.run_render(), ["Cam_2"])
+
+    def test_unreadable_manifest(self):
+        self.run_render()
+        with open(os.path.join(self.directory.name, Cameras_Lister.RenderManifest.FILENAME), "w") as f:
+            f.write("{")
+        self.assertEqual(self.run_render(), [cam.name for cam in self.cams])
+
+    def test_render_restores_the_scene(self):
+        Cameras_Lister.marker_index.add(self.scene, "A", 1, self.cams[2])
+        self.scene.camera = self.cams[2]
+        self.run_render()
+        self.assertIs(self.scene.camera, self.cams[2])
+        self.assertIs(self.scene.timeline_markers[0].camera, self.cams[2])
+        self.assertEqual((self.scene.render.resolution_x, self.scene.render.filepath), (1920, "//"))
+
+
+#--------------------------------------------------------------------------------------
+# T H U M B N A I L S
+#--------------------------------------------------------------------------------------
+
+class CameraMatrix(list):
+    """matrix_world stand-in with the one mathutils method thumbnails use."""
+
+    def inverted(self):
+        return self
+
+
+class FakeOffScreen:
+    drawn = []
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def bind(self):
+        return contextlib.nullcontext()
+
+    def draw_view3d(self, scene, view_layer, view3d, region, view_matrix, projection_matrix,
+            do_color_management=False):
+        FakeOffScreen.drawn.append((scene, view3d, view_matrix, projection_matrix))
+
+    def free(self):
+        pass
+
+
+class FakeFramebuffer:
+    def read_color(self, x, y, width, height, channels, slot, format):
+        # Bottom row first, each row filled with its index
+        rows = [[[row, row, row, 255]] * width for row in range(height)]
+        return types.SimpleNamespace(to_list=lambda: rows)
+
+
+def read_png(filepath):
+    with open(filepath, "rb") as f:
+        content = f.read()
+    assert content[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks = {}
+    offset = 8
+    while offset < len(content):
+        length = int.from_bytes(content[offset:offset + 4], "big")
+        chunks[content[offset + 4:offset + 8]] = content[offset + 8:offset + 8 + length]
+        offset += length + 12
+    width = int.from_bytes(chunks[b"IHDR"][:4], "big")
+    height = int.from_bytes(chunks[b"IHDR"][4:8], "big")
+    raw = zlib.decompress(chunks[b"IDAT"])
+    stride = width * 4 + 1
+    return width, height, [raw[y * stride + 1:(y + 1) * stride] for y in range(height)]
+
+
+class ThumbnailTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i, (float(i), 0.0, 0.0)) for i in range(3)]
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.thumbnails = Cameras_Lister.camera_thumbnails
+        self.addCleanup(self.thumbnails.configure, False, 128, 32)
+        self.thumbnails.clear()
+        self.thumbnails.directory = self.directory.name
+        self.timers = []
+        timers = types.SimpleNamespace(register=lambda func, first_interval=0.0: self.timers.append(func),
+            is_registered=lambda func: func in self.timers)
+        for patcher in (mock.patch.object(bpy.app, "background", False), mock.patch.object(bpy.app, "timers", timers)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.area = fake_bpy.Area()
+        self.viewport = (types.SimpleNamespace(view_layer=bpy.context.view_layer), self.area, self.area.regions[0])
+        self.rendered = []
+
+    def fake_render(self, context, viewport, scene, cam, filepath, size):
+        self.rendered.append(cam.name)
+        with open(filepath, "wb") as f:
+            f.write(cam.name.encode())
+
+    def run_timer(self):
+        with mock.patch.object(Cameras_Lister, "RenderThumbnail", self.fake_render), \
+                mock.patch.object(Cameras_Lister, "ThumbnailViewport", lambda context: self.viewport):
+            while self.timers:
+                func = self.timers.pop(0)
+                while func() is not None:
+                    pass
+
+    def icons(self):
+        return [self.thumbnails.icon(self.scene, cam) for cam in self.cams]
+
+    @unittest.skipIf(numpy is None, "needs NumPy")
+    def test_render_leaves_the_scene_alone(self):
+        cam = self.cams[0]
+        cam.matrix_world = CameraMatrix(cam.matrix_world)
+        cam.calc_matrix_camera = lambda depsgraph, x, y, scale_x, scale_y: ("projection", x, y)
+        Cameras_Lister.marker_index.add(self.scene, "A", 1, self.cams[1])
+        self.scene.camera = self.cams[1]
+        render = dict(vars(self.scene.render))
+        gpu = types.SimpleNamespace(types=types.SimpleNamespace(GPUOffScreen=FakeOffScreen),
+            state=types.SimpleNamespace(active_framebuffer_get=FakeFramebuffer))
+        filepath = os.path.join(self.directory.name, "thumbnail.png")
+        FakeOffScreen.drawn = []
+        with mock.patch.dict(sys.modules, gpu=gpu):
+            Cameras_Lister.RenderThumbnail(bpy.context, self.viewport, self.scene, cam, filepath, 64)
+
+        self.assertEqual(FakeOffScreen.drawn, [(self.scene, self.area.spaces.active, cam.matrix_world, ("projection", 64, 36))])
+        width, height, rows = read_png(filepath)
+        self.assertEqual((width, height), (64, 36))
+        # Top row of the image is the last one read
+        self.assertEqual(rows[0], bytes([35, 35, 35, 255]) * 64)
+        self.assertEqual(rows[-1], bytes([0, 0, 0, 255]) * 64)
+        self.assertEqual(os.listdir(self.directory.name), ["thumbnail.png"])
+        self.assertIs(self.scene.camera, self.cams[1])
+        self.assertIs(self.scene.timeline_markers[0].camera, self.cams[1])
+        self.assertEqual(vars(self.scene.render), render)
+
+    def test_queue_and_disk_cache(self):
+        self.thumbnails.configure(True, 64, 32)
+        self.assertEqual(self.icons(), [0, 0, 0])
+        self.assertEqual(len(self.timers), 1)
+        self.run_timer()
+        self.assertEqual(self.rendered, ["Cam_0", "Cam_1", "Cam_2"])
+        self.assertNotIn(0, self.icons())
+
+        # Cached on disk: shown again without rendering
+        self.thumbnails.clear()
+        self.rendered = []
+        self.assertNotIn(0, self.icons())
+        self.assertEqual(self.rendered, [])
+
+    def test_changed_camera_rendered_again(self):
+        self.thumbnails.configure(True, 64, 32)
+        self.icons()
+        self.run_timer()
+        self.rendered = []
+        self.cams[1].matrix_world[0][3] += 0.5
+        Cameras_Lister.thumbnail_depsgraph_update_post(self.scene,
+            fake_bpy.Depsgraph([fake_bpy.DepsgraphUpdate(self.cams[1])]))
+        self.assertEqual(self.icons()[1], 0)
+        self.run_timer()
+        self.assertEqual(self.rendered, ["Cam_1"])
+
+    def test_memory_budget(self):
+        # 1 MB holds 64 thumbnails of 64x64
+        self.thumbnails.configure(True, 64, 1)
+        self.assertEqual(self.thumbnails.capacity, 64)
+        self.thumbnails.capacity = 2
+        self.icons()
+        self.run_timer()
+        self.assertEqual(len(self.thumbnails.icons), 2)
+        self.assertEqual(len(self.thumbnails.previews), 2)
+        # The least recently shown went first
+        self.assertNotIn(self.thumbnails.key(self.scene, self.cams[0]), self.thumbnails.icons)
+
+    def test_disk_budget(self):
+        self.thumbnails.configure(True, 64, 32)
+        self.icons()
+        self.run_timer()
+        files = sorted(os.listdir(self.directory.name))
+        for i, name in enumerate(files):
+            os.utime(os.path.join(self.directory.name, name), (1000 + i, 1000 + i))
+        # Showing a thumbnail again keeps it
+        oldest = self.thumbnails.filepath(self.thumbnails.key(self.scene, self.cams[0]))
+        os.utime(oldest, (0, 0))
+        self.thumbnails.clear()
+        self.thumbnails.icon(self.scene, self.cams[0])
+        self.thumbnails.disk_budget = 2 * len(self.cams[0].name)
+        self.assertEqual(self.thumbnails.prune(), 1)
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+        self.assertTrue(os.path.exists(oldest))
+
+    def test_pruned_when_the_queue_is_done(self):
+        self.thumbnails.configure(True, 64, 32, 1)
+        self.thumbnails.disk_budget = 0
+        self.icons()
+        self.run_timer()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+#--------------------------------------------------------------------------------------
+# T R A N S F E R
+#--------------------------------------------------------------------------------------
+
+class CameraTransferTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = new_scene()
+        self.cams = [new_camera(self.scene, "Cam_%d" % i, (i, 2.0 * i, 3.0), 15.0 * i) for i in range(3)]
+        self.cams[0].data.lens = 85.0
+        self.cams[1].data.type = 'ORTHO'
+        self.cams[1].camera_custom_resolution_settings_pointer_prop.Custom_Horizontal_Resolution = 1000
+        Cameras_Lister.marker_index.add(self.scene, "F_10", 10, self.cams[0])
+        Cameras_Lister.marker_index.add(self.scene, "F_20", 20, self.cams[2])
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def export(self, format):
+        filepath = os.path.join(self.directory.name, "cameras" + Cameras_Lister.CAMERA_TRANSFER_FORMATS[format])
+        count = Cameras_Lister.ExportCameraRecords(self.scene, self.cams, filepath, format)
+        self.assertEqual(count, len(self.cams))
+        return filepath
+
+    def expected(self):
+        markers = Cameras_Lister.marker_index.ensure(self.scene)
+        return [Cameras_Lister.CameraRecord(cam, markers) for cam in self.cams]
+
+    def assertRecordsEqual(self, records, expected, places=None):
+        self.assertEqual(len(records), len(expected))
+        for record, original in zip(records, expected):
+            self.assertEqual(set(record), set(original))
+            for key, value in original.items():
+                if places is not None and isinstance(value, float):
+                    self.assertAlmostEqual(record[key], value, places=places, msg=key)
+                elif places is not None and key == "matrix_world":
+                    for a, b in zip(record[key], value):
+                        self.assertAlmostEqual(a, b, places=places, msg=key)
+                else:
+                    self.assertEqual(record[key], value, key)
+
+    def test_jsonl_round_trip(self):
+        records = list(Cameras_Lister.ReadCameraRecords(self.export("JSONL")))
+        self.assertRecordsEqual(records, self.expected())
+
+    def test_binary_round_trip(self):
+        # Floats are stored as float32
+        records = list(Cameras_Lister.ReadCameraRecords(self.export("BINARY")))
+        self.assertRecordsEqual(records, self.expected(), places=5)
+
+    def test_truncated_binary(self):
+        filepath = self.export("BINARY")
+        with open(filepath, "rb") as f:
+            content = f.read()
+        with open(filepath, "wb") as f:
+            f.write(content[:-3])
+        with self.assertRaises(ValueError):
+            list(Cameras_Lister.ReadCameraRecords(filepath))
+
+    def test_not_a_camera_file(self):
+        filepath = os.path.join(self.directory.name, "other.jsonl")
+        with open(filepath, "w") as f:
+            f.write('{"format": "something_else"}\n')
+        with self.assertRaises(ValueError):
+            list(Cameras_Lister.ReadCameraRecords(filepath))
+
+    @unittest.skipIf(mathutils is None, "needs mathutils")
+    def test_import(self):
+        expected = self.expected()
+        filepaths = [self.export(format) for format in ("JSONL", "BINARY")]
+        for filepath in filepaths:
+            scene = new_scene()
+            counts = Cameras_Lister.ImportCameraRecords(scene, Cameras_Lister.ReadCameraRecords(filepath))
+            self.assertEqual((counts["created"], counts["markers"]), (3, 2))
+            markers = Cameras_Lister.marker_index.ensure(scene)
+            imported = [Cameras_Lister.CameraRecord(scene.objects[record["name"]], markers) for record in expected]
+            self.assertRecordsEqual(imported, expected, places=5)
+
+            # Importing again replaces, without duplicating cameras or markers
+            counts = Cameras_Lister.ImportCameraRecords(scene, Cameras_Lister.ReadCameraRecords(filepath))
+            self.assertEqual((counts["created"], counts["updated"]), (0, 3))
+            self.assertEqual(len(scene.objects), 3)
+            self.assertEqual(len(scene.timeline_markers), 2)
+
+if __name__ == "__main__":
+    unittest.main()